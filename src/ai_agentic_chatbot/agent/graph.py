@@ -1,35 +1,128 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from langchain_core.messages import SystemMessage
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.constants import START, END
 from langgraph.graph import StateGraph
 from langchain_core.messages import AIMessage
 from langgraph.checkpoint.memory import MemorySaver
+from ai_agentic_chatbot.agent.history import get_history_manager
+from ai_agentic_chatbot.agent.intent_classifier import get_fast_path_classifier
 from ai_agentic_chatbot.agent.router import RouterNode
+from ai_agentic_chatbot.agent.settings import get_agent_settings
 from ai_agentic_chatbot.agent.state import AgentState
 from ai_agentic_chatbot.infrastructure.llm import get_llm
 from ai_agentic_chatbot.infrastructure.llm.types import LLMProvider, ModelType
-from ai_agentic_chatbot.agent.subgraphs.sql_query.graph import sql_subgraph
+from ai_agentic_chatbot.infrastructure.llm.usage import usage_config
+from ai_agentic_chatbot.agent.subgraphs.sql_query.graph import (
+    async_sql_subgraph,
+    sql_subgraph,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.retrieve_schemas import (
+    retrieve_candidates,
+)
 from ai_agentic_chatbot.agent.nodes.visualizer import visualizer_node
+from ai_agentic_chatbot.logging_config import get_logger
 
 fast_llm = get_llm(provider=LLMProvider.AZURE_OPENAI, model=ModelType.FAST)
 
+logger = get_logger(__name__)
+
+_speculation_pool = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="speculative-retrieval"
+)
+_summary_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="history-summary")
+
+
+def _fold_history(state: AgentState, config: RunnableConfig) -> dict:
+    """Summary update of the previous turn's fold; this turn's fold runs in the background."""
+    thread_id = (config or {}).get("configurable", {}).get("thread_id", "default")
+    return get_history_manager().fold_in_background(
+        str(thread_id),
+        state["messages"],
+        state.get("history_summary"),
+        state.get("summarized_count", 0),
+        _summary_pool,
+    )
+
+
+def router(state: AgentState, config: RunnableConfig) -> dict:
+    settings = get_agent_settings()
+
+    if settings.fast_path.enabled:
+        try:
+            prediction = get_fast_path_classifier().classify(
+                state["messages"][-1].content
+            )
+        except Exception as e:
+            logger.warning(f"Fast-path classification failed: {e}")
+            prediction = None
+        if prediction is not None:
+            logger.info(
+                f"[Router] Fast path: {prediction.intent} "
+                f"({prediction.source}, {prediction.confidence:.2f})"
+            )
+            return {"next_step": prediction.intent, "candidate_tables": None}
+
+    # Never waits for the summarizer: the router and later nodes see the
+    # summary of the last finished fold, which lags at most one turn
+    history_update = _fold_history(state, config)
+
+    if not settings.speculative_retrieval:
+        return {
+            **RouterNode({**state, **history_update}).classify(),
+            **history_update,
+            "candidate_tables": None,
+        }
+
+    # Embed the query and score tables while the router LLM call is in flight
+    future = _speculation_pool.submit(
+        retrieve_candidates, state["messages"][-1].content
+    )
+    decision = RouterNode({**state, **history_update}).classify()
+
+    candidate_tables = None
+    if decision.get("next_step") == "sql_query":
+        try:
+            candidate_tables = future.result(timeout=settings.speculative_timeout)
+        except Exception as e:
+            logger.warning(f"Speculative retrieval unavailable: {e}")
+    else:
+        # Not a data question: discard the speculative result
+        future.cancel()
+
+    return {
+        **decision,
+        **history_update,
+        "candidate_tables": candidate_tables,
+    }
+
 
-def router(state: AgentState) -> dict:
-    return RouterNode(state).classify()
+GREETING_PROMPT = SystemMessage(
+    "You are a helpful chat assistant. User has greeted you. Greet them warmly and ask how can you help them."
+)
+FALLBACK_PROMPT = SystemMessage(
+    "You are a helpful chat assistant. User has sent a message that does not make sense. Ask them to rephrase."
+)
+
+
+def _history_window(state: AgentState) -> list:
+    return get_history_manager().window(
+        state["messages"], state.get("history_summary")
+    )
 
 
 def greeting_node(state: AgentState) -> dict:
-    prompt = SystemMessage(
-        "You are a helpful chat assistant. User has greeted you. Greet them warmly and ask how can you help them."
+    response = fast_llm.invoke(
+        [GREETING_PROMPT, *_history_window(state)], config=usage_config("greeting")
     )
-    response = fast_llm.invoke([prompt, *state["messages"]])
     return {"messages": [AIMessage(content=response.content)]}
 
 
 def fallback_node(state: AgentState) -> dict:
-    prompt = SystemMessage(
-        "You are a helpful chat assistant. User has sent a message that does not make sense. Ask them to rephrase."
+    response = fast_llm.invoke(
+        [FALLBACK_PROMPT, *_history_window(state)], config=usage_config("fallback")
     )
-    response = fast_llm.invoke([prompt, *state["messages"]])
     return {"messages": [AIMessage(content=response.content)]}
 
 
@@ -42,76 +135,124 @@ def sql_query_node(state: AgentState) -> dict:
     Adapter node that invokes the SQL subgraph.
     Maps parent state to subgraph input, runs subgraph, maps output back.
     """
-    from ai_agentic_chatbot.logging_config import get_logger
-
-    logger = get_logger(__name__)
     logger.info("[Parent] Invoking SQL subgraph")
 
-    # Map parent state to subgraph input
-    subgraph_input = {
+    try:
+        subgraph_result = sql_subgraph.invoke(_sql_subgraph_input(state))
+        return _sql_subgraph_response(state, subgraph_result)
+
+    except Exception as e:
+        return _sql_subgraph_failure(e)
+
+
+async def asql_query_node(state: AgentState) -> dict:
+    """
+    Async adapter node: runs the SQL subgraph with async query execution,
+    so a slow query does not hold the event loop serving other streams.
+    """
+    logger.info("[Parent] Invoking SQL subgraph (async)")
+
+    try:
+        subgraph_result = await async_sql_subgraph.ainvoke(_sql_subgraph_input(state))
+        return _sql_subgraph_response(state, subgraph_result)
+
+    except Exception as e:
+        return _sql_subgraph_failure(e)
+
+
+def _sql_subgraph_input(state: AgentState) -> dict:
+    """Map parent state to subgraph input."""
+    return {
         "user_query": state["messages"][-1].content,
         "router_table_hints": state.get("relevant_tables", []),
+        "candidate_tables": state.get("candidate_tables"),
+        "cache_hit": False,
+        "cache_key": None,
         "generation_attempts": 0,
         "max_retries": 2,
         "is_safe": False,
         "validation_errors": [],
+        "schema_errors": [],
         "retrieved_tables": None,
         "generated_sql": None,
         "explanation": None,
         "confidence": 0.0,
         "tables_used": [],
+        "model_tier": None,
+        "escalation_reason": None,
+        "tier_calls": [],
         "query_result": None,
         "execution_error": None,
+        "repair_attempts": 0,
+        "last_repair": None,
     }
 
-    try:
-        # Invoke subgraph
-        subgraph_result = sql_subgraph.invoke(subgraph_input)
-
-        # Check for errors
-        if subgraph_result.get("validation_errors"):
-            error_msg = "\n".join(subgraph_result["validation_errors"])
-            return {
-                "messages": [
-                    AIMessage(content=f"I encountered an error:\n{error_msg}")
-                ],
-                "next_step": "end",
-            }
-
-        if subgraph_result.get("execution_error"):
-            error_msg = subgraph_result["execution_error"]
-            return {
-                "messages": [
-                    AIMessage(content=f"Query execution failed:\n{error_msg}")
-                ],
-                "next_step": "end",
-            }
-
-        # Add visualization analysis to the state
-        state.update(subgraph_result)
-
-        # Generate visualization configuration
-        viz_result = visualizer_node(state)
-
-        # Create structured response data
-        visualization = viz_result.get("visualization", {})
-        content = _generate_brief_content(visualization)
 
+def _sql_subgraph_response(state: AgentState, subgraph_result: dict) -> dict:
+    """Map subgraph output back to parent state."""
+    _log_tier_calls(subgraph_result.get("tier_calls") or [])
+
+    # Check for errors
+    if subgraph_result.get("validation_errors"):
+        error_msg = "\n".join(subgraph_result["validation_errors"])
         return {
-            "messages": [AIMessage(content=content)],
-            "visualization": visualization,
+            "messages": [
+                AIMessage(content=f"I encountered an error:\n{error_msg}")
+            ],
             "next_step": "end",
         }
 
-    except Exception as e:
-        logger.error(f"SQL subgraph failed: {e}", exc_info=True)
+    if subgraph_result.get("execution_error"):
+        error_msg = subgraph_result["execution_error"]
         return {
             "messages": [
-                AIMessage(content=f"I encountered an unexpected error: {str(e)}")
+                AIMessage(content=f"Query execution failed:\n{error_msg}")
             ],
             "next_step": "end",
         }
 
+    # Add visualization analysis to the state
+    state.update(subgraph_result)
+
+    # Generate visualization configuration
+    viz_result = visualizer_node(state)
+
+    # Create structured response data
+    visualization = viz_result.get("visualization", {})
+    content = _generate_brief_content(visualization)
+
+    return {
+        "messages": [AIMessage(content=content)],
+        "visualization": visualization,
+        "next_step": "end",
+    }
+
+
+def _sql_subgraph_failure(e: Exception) -> dict:
+    logger.error(f"SQL subgraph failed: {e}", exc_info=True)
+    return {
+        "messages": [
+            AIMessage(content=f"I encountered an unexpected error: {str(e)}")
+        ],
+        "next_step": "end",
+    }
+
+
+def _log_tier_calls(tier_calls: list) -> None:
+    """Per-request latency and cost of SQL generation, per model tier."""
+    totals = {}
+    for call in tier_calls:
+        total = totals.setdefault(call["tier"], {"calls": 0, "latency_ms": 0.0, "cost": 0.0})
+        total["calls"] += 1
+        total["latency_ms"] += call["latency_ms"]
+        total["cost"] += call["cost"]
+
+    for tier, total in totals.items():
+        logger.info(
+            f"[SQL generation] {tier}: {total['calls']} call(s), "
+            f"{total['latency_ms']:.0f} ms, cost {total['cost']:.5f}"
+        )
+
 
 def create_clean_json_response(subgraph_result: dict, viz_result: dict) -> str:
     """Create a clean JSON response for frontend consumption."""
@@ -423,7 +564,14 @@ def build_graph():
     workflow.add_node("greeting_node", greeting_node)
     workflow.add_node("fallback_node", fallback_node)
     workflow.add_node("clarification_node", clarification_node)
-    workflow.add_node("sql_query_node", sql_query_node)
+    if get_agent_settings().async_execution:
+        # invoke() keeps the synchronous path; astream()/ainvoke() use the async one
+        workflow.add_node(
+            "sql_query_node",
+            RunnableLambda(sql_query_node, afunc=asql_query_node, name="sql_query_node"),
+        )
+    else:
+        workflow.add_node("sql_query_node", sql_query_node)
 
     workflow.add_edge(START, "router_node")
 
@@ -0,0 +1,271 @@
+"""Conversation history windowing with a rolling summary of older turns."""
+
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from ai_agentic_chatbot.infrastructure.llm.tokens import (
+    count_message_tokens,
+    truncate_to_tokens,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SUMMARY_PROMPT = """You maintain a running summary of a conversation between a user and a data assistant.
+Update the summary with the new messages below. Keep the user's goals, the entities, filters,
+time ranges and tables they referred to, and any answers that later questions may build on.
+Drop greetings and small talk. Reply with the updated summary only, at most {max_words} words.
+
+CURRENT SUMMARY:
+{summary}
+
+NEW MESSAGES:
+{messages}"""
+
+# (previous summary, messages to fold in) -> updated summary
+Summarizer = Callable[[str, Sequence[BaseMessage]], str]
+
+
+def _window_start(messages: Sequence[BaseMessage], max_turns: int) -> int:
+    """Index of the first message of the last ``max_turns`` turns (a turn starts with a user message)."""
+    turns = 0
+    for index in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[index], HumanMessage):
+            turns += 1
+            if turns == max_turns:
+                return index
+    return 0
+
+
+@dataclass(frozen=True)
+class _BackgroundFold:
+    """A fold started from this summary, of these messages."""
+
+    summary: str
+    summarized_count: int
+    folded: Tuple[str, ...]
+    future: Future
+
+
+def _contents(messages: Sequence[BaseMessage]) -> Tuple[str, ...]:
+    return tuple(str(message.content) for message in messages)
+
+
+def format_transcript(messages: Sequence[BaseMessage]) -> str:
+    return "\n".join(
+        f"{'User' if isinstance(message, HumanMessage) else 'Assistant'}: {message.content}"
+        for message in messages
+    )
+
+
+class HistoryManager:
+    """
+    Builds the message history sent to the LLM.
+
+    The last ``max_turns`` turns are kept verbatim; older messages are folded
+    into a rolling summary, one batch at a time as they leave the window, so
+    each update only reads the previous summary and the newly aged messages.
+    The summary plus window is then trimmed (oldest first) to ``max_tokens``;
+    the latest message is always kept.
+
+    Background folds are kept per conversation until its next turn, for at
+    most ``max_background_folds`` conversations (least recently used first
+    out), so ended conversations do not accumulate.
+    """
+
+    def __init__(
+        self,
+        summarizer: Optional[Summarizer] = None,
+        max_turns: int = 4,
+        max_tokens: int = 2000,
+        summary_max_tokens: int = 300,
+        max_background_folds: int = 1024,
+    ):
+        self.summarizer = summarizer
+        self.max_turns = max_turns
+        self.max_tokens = max_tokens
+        self.summary_max_tokens = summary_max_tokens
+        self.max_background_folds = max_background_folds
+        self._folds: "OrderedDict[str, _BackgroundFold]" = OrderedDict()
+        self._folds_lock = Lock()
+
+    def pending(self, messages: Sequence[BaseMessage], summarized_count: int) -> List[BaseMessage]:
+        """Messages that left the verbatim window but are not in the summary yet."""
+        return list(messages[summarized_count:_window_start(messages, self.max_turns)])
+
+    def fold(
+        self,
+        messages: Sequence[BaseMessage],
+        summary: Optional[str],
+        summarized_count: int,
+    ) -> Optional[dict]:
+        """
+        Fold aged-out messages into the summary.
+
+        Returns the state update (``history_summary``, ``summarized_count``),
+        or None when nothing left the window or no summarizer is configured.
+        """
+        pending = self.pending(messages, summarized_count)
+        if not pending or self.summarizer is None:
+            return None
+
+        updated = self.summarizer(summary or "", pending)
+        updated = truncate_to_tokens(updated.strip(), self.summary_max_tokens)
+        logger.info(
+            f"[History] Folded {len(pending)} messages into summary "
+            f"({summarized_count + len(pending)} summarized)"
+        )
+        return {
+            "history_summary": updated,
+            "summarized_count": summarized_count + len(pending),
+        }
+
+    def fold_in_background(
+        self,
+        key: str,
+        messages: Sequence[BaseMessage],
+        summary: Optional[str],
+        summarized_count: int,
+        executor: Executor,
+    ) -> dict:
+        """
+        Fold without waiting for the summarizer.
+
+        Returns the update of an earlier fold for conversation ``key`` if it
+        has finished and still applies, then starts a fold of the messages
+        still pending. The summary thus lags one turn behind; while a fold
+        is running, nothing new is started.
+        """
+        with self._folds_lock:
+            fold = self._folds.get(key)
+            if fold is not None and not fold.future.done():
+                return {}
+            self._folds.pop(key, None)
+
+        update = self._finished_fold(fold, messages, summary, summarized_count) if fold else {}
+        summary = update.get("history_summary", summary)
+        summarized_count = update.get("summarized_count", summarized_count)
+
+        pending = self.pending(messages, summarized_count)
+        if pending and self.summarizer is not None:
+            future = executor.submit(self.fold, list(messages), summary, summarized_count)
+            with self._folds_lock:
+                self._folds[key] = _BackgroundFold(
+                    summary or "", summarized_count, _contents(pending), future
+                )
+                self._folds.move_to_end(key)
+                while len(self._folds) > self.max_background_folds:
+                    # A dropped fold's turns stay pending and are folded again later
+                    self._folds.popitem(last=False)
+        return update
+
+    @staticmethod
+    def _finished_fold(
+        fold: _BackgroundFold,
+        messages: Sequence[BaseMessage],
+        summary: Optional[str],
+        summarized_count: int,
+    ) -> dict:
+        # Stale if the state moved on since the fold started
+        end = summarized_count + len(fold.folded)
+        if (
+            fold.summary != (summary or "")
+            or fold.summarized_count != summarized_count
+            or _contents(messages[summarized_count:end]) != fold.folded
+        ):
+            return {}
+        try:
+            return fold.future.result() or {}
+        except Exception as e:
+            # Older turns stay pending and are folded on a later turn
+            logger.warning(f"History summarization failed: {e}")
+            return {}
+
+    def window(
+        self, messages: Sequence[BaseMessage], summary: Optional[str] = None
+    ) -> List[BaseMessage]:
+        """Summary message (if any) followed by the recent turns, within the token budget."""
+        recent = list(messages[_window_start(messages, self.max_turns):])
+
+        prefix: List[BaseMessage] = []
+        if summary:
+            prefix = [
+                SystemMessage(
+                    content="Summary of the earlier conversation:\n"
+                    + truncate_to_tokens(summary, self.summary_max_tokens)
+                )
+            ]
+
+        budget = self.max_tokens - count_message_tokens(prefix)
+        kept: List[BaseMessage] = []
+        for message in reversed(recent):
+            cost = count_message_tokens([message])
+            if kept and cost > budget:
+                break
+            kept.append(message)
+            budget -= cost
+
+        if len(kept) < len(recent):
+            logger.debug(
+                f"[History] Token budget dropped {len(recent) - len(kept)} recent messages"
+            )
+        return prefix + kept[::-1]
+
+
+def llm_summarizer(llm, max_words: int = 150) -> Summarizer:
+    """Summarizer backed by a chat model."""
+    from ai_agentic_chatbot.infrastructure.llm.usage import usage_config
+
+    def summarize(summary: str, messages: Sequence[BaseMessage]) -> str:
+        prompt = SUMMARY_PROMPT.format(
+            max_words=max_words,
+            summary=summary or "(empty)",
+            messages=format_transcript(messages),
+        )
+        response = llm.invoke(
+            [HumanMessage(content=prompt)], config=usage_config("history_summary")
+        )
+        return response.content
+
+    return summarize
+
+
+_manager: Optional[HistoryManager] = None
+_manager_lock = Lock()
+
+
+def get_history_manager() -> HistoryManager:
+    """Get the global history manager, configured from agent settings."""
+    global _manager
+    if _manager is None:
+        with _manager_lock:
+            if _manager is None:
+                from ai_agentic_chatbot.agent.settings import get_agent_settings
+                from ai_agentic_chatbot.infrastructure.llm import get_llm
+                from ai_agentic_chatbot.infrastructure.llm.types import (
+                    LLMProvider,
+                    ModelType,
+                )
+
+                settings = get_agent_settings().history
+                summarizer = (
+                    llm_summarizer(
+                        get_llm(LLMProvider.AZURE_OPENAI, ModelType.FAST),
+                        max_words=settings.summary_max_words,
+                    )
+                    if settings.summarize
+                    else None
+                )
+                _manager = HistoryManager(
+                    summarizer=summarizer,
+                    max_turns=settings.max_turns,
+                    max_tokens=settings.max_tokens,
+                    summary_max_tokens=settings.summary_max_tokens,
+                    max_background_folds=settings.max_background_folds,
+                )
+    return _manager
@@ -0,0 +1,310 @@
+"""Local fast-path intent classifier in front of the LLM router."""
+
+import re
+from dataclasses import dataclass
+from threading import Lock
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+INTENT_GREETING = "greeting"
+INTENT_NONSENSE = "nonsense"
+INTENT_SQL_QUERY = "sql_query"
+
+GREETING_LEXICON = {
+    "hi",
+    "hii",
+    "hello",
+    "hey",
+    "heya",
+    "hiya",
+    "yo",
+    "howdy",
+    "greetings",
+    "good morning",
+    "good afternoon",
+    "good evening",
+    "hi there",
+    "hello there",
+    "hey there",
+    "thanks",
+    "thank you",
+    "thank you very much",
+    "thanks a lot",
+    "many thanks",
+    "thx",
+    "ty",
+    "cheers",
+    "how are you",
+    "how are you doing",
+    "what's up",
+    "whats up",
+    "sup",
+    "nice to meet you",
+    "cześć",
+    "dzień dobry",
+    "dziękuję",
+    "dzięki",
+}
+
+# Labelled examples for the nearest-centroid model
+LABELLED_EXAMPLES: Dict[str, List[str]] = {
+    INTENT_GREETING: [
+        "hi",
+        "hello there",
+        "hey, how are you?",
+        "good morning!",
+        "thanks a lot",
+        "thank you for your help",
+        "nice to meet you",
+        "hi, I'm new here",
+    ],
+    INTENT_NONSENSE: [
+        "asdfghjkl",
+        "qwerty uiop",
+        "lorem ipsum dolor",
+        "blah blah blah",
+        "???",
+        "jdjdjdjd",
+        "banana keyboard purple",
+        "zzzzzz",
+    ],
+    INTENT_SQL_QUERY: [
+        "what were total sales last month",
+        "show top 10 customers by revenue",
+        "how many orders are pending",
+        "list products with low stock",
+        "average order value by region",
+        "chart of monthly revenue this year",
+        "which suppliers delivered late",
+        "count invoices per status",
+    ],
+}
+
+_WORD = re.compile(r"[^\W\d_]+", re.UNICODE)
+_PUNCTUATION = re.compile(r"[^\w\s']+", re.UNICODE)
+_CONSONANT_RUN = re.compile(r"[bcdfghjklmnpqrstvwxz]{5,}")
+_REPEATED_CHAR = re.compile(r"(.)\1{3,}")
+_VOWELS = set("aeiouyąęó")
+
+
+@dataclass(frozen=True)
+class IntentPrediction:
+    """Confident local classification of a user message."""
+
+    intent: str
+    confidence: float
+    source: str
+
+
+def _normalize(message: str) -> str:
+    text = _PUNCTUATION.sub(" ", message.casefold())
+    return " ".join(text.split())
+
+
+def schema_vocabulary(table_docs: Sequence[Mapping[str, Any]]) -> FrozenSet[str]:
+    """Lower-case words of every table and column name (``order_total`` -> order, total)."""
+    names = []
+    for table_doc in table_docs:
+        names.append(table_doc.get("name", ""))
+        names.extend(table_doc.get("columns") or [])
+    return frozenset(word.casefold() for name in names for word in _WORD.findall(str(name)))
+
+
+def match_lexicon(
+    message: str, vocabulary: AbstractSet[str] = frozenset()
+) -> Optional[IntentPrediction]:
+    """
+    Exact greeting phrases and obvious keyboard mash.
+
+    Acronyms (all upper-case words such as YTD, GMV, SKU) and words of the
+    schema ``vocabulary`` are not judged by the keyboard-mash rule.
+    """
+    normalized = _normalize(message)
+
+    if normalized in GREETING_LEXICON:
+        return IntentPrediction(INTENT_GREETING, 1.0, "lexicon")
+
+    if not normalized:
+        # Only punctuation / emoji / whitespace
+        return IntentPrediction(INTENT_NONSENSE, 1.0, "lexicon")
+
+    words = _WORD.findall(normalized)
+    if not words:
+        return IntentPrediction(INTENT_NONSENSE, 1.0, "lexicon")
+
+    acronyms = {word.casefold() for word in _WORD.findall(message) if word.isupper()}
+    words = [word for word in words if word not in acronyms and word not in vocabulary]
+    if not words:
+        return None
+
+    letters = "".join(words)
+    vowel_ratio = sum(char in _VOWELS for char in letters) / len(letters)
+    if len(letters) >= 5 and (
+        vowel_ratio < 0.1
+        or all(_CONSONANT_RUN.search(word) or _REPEATED_CHAR.search(word) for word in words)
+    ):
+        return IntentPrediction(INTENT_NONSENSE, 0.95, "lexicon")
+
+    return None
+
+
+class NearestCentroidClassifier:
+    """Cosine nearest-centroid model over embedded labelled examples."""
+
+    def __init__(self, embedding: Embeddings, examples: Dict[str, List[str]]):
+        self.labels = list(examples)
+
+        texts = [text for label in self.labels for text in examples[label]]
+        vectors = np.asarray(embedding.embed_documents(texts), dtype=np.float32)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+        centroids = []
+        start = 0
+        for label in self.labels:
+            end = start + len(examples[label])
+            centroids.append(vectors[start:end].mean(axis=0))
+            start = end
+
+        centroids = np.asarray(centroids, dtype=np.float32)
+        centroids /= np.maximum(np.linalg.norm(centroids, axis=1, keepdims=True), 1e-12)
+        self._centroids = centroids
+
+    def similarities(self, query_vector: List[float]) -> Dict[str, float]:
+        query = np.asarray(query_vector, dtype=np.float32)
+        query /= max(float(np.linalg.norm(query)), 1e-12)
+        scores = self._centroids @ query
+        return {label: float(score) for label, score in zip(self.labels, scores)}
+
+
+class FastPathClassifier:
+    """
+    Routes confidently identified greetings and nonsense without the LLM router.
+
+    The lexicon is checked first (no network). Short messages not matched by
+    the lexicon are embedded and compared against label centroids; anything
+    that is not clearly a greeting or nonsense goes to the LLM router.
+    """
+
+    def __init__(
+        self,
+        embedding: Optional[Embeddings] = None,
+        similarity_threshold: float = 0.85,
+        margin: float = 0.05,
+        max_words: int = 6,
+        query_embedder=None,
+        vocabulary: Optional[Callable[[], AbstractSet[str]]] = None,
+    ):
+        self.embedding = embedding
+        self.similarity_threshold = similarity_threshold
+        self.margin = margin
+        self.max_words = max_words
+        self._vocabulary = vocabulary or frozenset
+        self._query_embedder = query_embedder or (lambda text: embedding.embed_query(text))
+
+        self._centroid_model: Optional[NearestCentroidClassifier] = None
+        self._lock = Lock()
+
+    def classify(self, message: str) -> Optional[IntentPrediction]:
+        prediction = match_lexicon(message, self._vocabulary())
+        if prediction is not None:
+            return prediction
+
+        if self.embedding is None or len(message.split()) > self.max_words:
+            return None
+
+        similarities = self._get_centroid_model().similarities(
+            self._query_embedder(message)
+        )
+        best = max(similarities, key=similarities.get)
+        if best == INTENT_SQL_QUERY:
+            return None
+
+        confidence = similarities[best]
+        if (
+            confidence >= self.similarity_threshold
+            and confidence - similarities.get(INTENT_SQL_QUERY, 0.0) >= self.margin
+        ):
+            return IntentPrediction(best, confidence, "centroid")
+        return None
+
+    def _get_centroid_model(self) -> NearestCentroidClassifier:
+        if self._centroid_model is None:
+            with self._lock:
+                if self._centroid_model is None:
+                    self._centroid_model = NearestCentroidClassifier(
+                        self.embedding, LABELLED_EXAMPLES
+                    )
+        return self._centroid_model
+
+
+_classifier: Optional[FastPathClassifier] = None
+_classifier_lock = Lock()
+
+
+def get_fast_path_classifier() -> FastPathClassifier:
+    """Get the global fast-path classifier, configured from agent settings."""
+    global _classifier
+    if _classifier is None:
+        with _classifier_lock:
+            if _classifier is None:
+                from ai_agentic_chatbot.agent.settings import get_agent_settings
+                from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
+                    get_azure_openai_embedding,
+                )
+                from ai_agentic_chatbot.infrastructure.embedding.query_cache import (
+                    get_query_embedding_cache,
+                )
+
+                settings = get_agent_settings().fast_path
+                embedding = get_azure_openai_embedding() if settings.use_embeddings else None
+                _classifier = FastPathClassifier(
+                    embedding=embedding,
+                    similarity_threshold=settings.similarity_threshold,
+                    margin=settings.margin,
+                    max_words=settings.max_words,
+                    query_embedder=(
+                        lambda text: get_query_embedding_cache().embed_query(embedding, text)
+                    )
+                    if embedding is not None
+                    else None,
+                    vocabulary=_catalog_vocabulary,
+                )
+    return _classifier
+
+
+_vocabulary: Optional[Tuple[str, FrozenSet[str]]] = None
+
+
+def _catalog_vocabulary() -> FrozenSet[str]:
+    """Schema vocabulary of the current catalog, rebuilt when its content changes."""
+    global _vocabulary
+    from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+    try:
+        catalog = get_schema_catalog()
+    except Exception as e:
+        logger.warning(f"Schema vocabulary unavailable: {e}")
+        return frozenset()
+
+    cached = _vocabulary
+    if cached is None or cached[0] != catalog.content_hash:
+        cached = (catalog.content_hash, schema_vocabulary(catalog.table_docs))
+        _vocabulary = cached
+    return cached[1]
@@ -1,17 +1,25 @@
 import os
 from pathlib import Path
-from typing import Literal, Optional
+from threading import Lock
+from typing import Literal, Mapping, Optional, Tuple
 
 from ai_agentic_chatbot.logging_config import get_logger
-from ai_agentic_chatbot.schema_extractor.schema_loader import SchemaLoader
-from ai_agentic_chatbot.utils.prompt_loader import get_system_prompt
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+from ai_agentic_chatbot.utils.prompt_loader import (
+    get_date_message_text,
+    get_formatted_date,
+    load_file_content,
+    render_static_system_prompt,
+)
 from langchain_core.messages import AIMessage, SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 
+from ai_agentic_chatbot.agent.history import get_history_manager
 from ai_agentic_chatbot.agent.state import AgentState
 from ai_agentic_chatbot.infrastructure.llm import get_llm
+from ai_agentic_chatbot.infrastructure.llm.usage import usage_config
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 PROMPT_PATH = BASE_DIR / "prompts" / "custom_prompts.md"
@@ -56,31 +64,106 @@ class RouterDecision(BaseModel):
 logger = get_logger(__name__)
 
 
+def _file_fingerprint(path: str) -> Tuple[str, int, int]:
+    stat = os.stat(path)
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+class RouterRuntime:
+    """
+    Router prompt and structured-output runnable compiled for one schema version.
+
+    Prompt files are read and the schema block is rendered once. Messages are
+    laid out static-first (system prompt, router prompt with schema, then the
+    date, then history) so providers can serve the prefix from prompt cache.
+    """
+
+    def __init__(self, key: Tuple, schema_summary: Mapping[str, str], llm):
+        self.key = key
+        self.schema_summary = schema_summary
+
+        self.static_system_prompt = SystemMessage(
+            content=render_static_system_prompt(
+                load_file_content(os.environ["SYSTEM_PROMPT_PATH"])
+            )
+        )
+        with open(os.environ["ROUTER_PROMPT_PATH"], "r") as f:
+            prompt_text = f.read()
+
+        self.schema_text = "\n".join(
+            [f"- {table}: {desc}" for table, desc in schema_summary.items()]
+        )
+        self.router_prompt = SystemMessage(
+            content=prompt_text.format(schema_text=self.schema_text)
+        )
+        self.structured_llm = llm.with_structured_output(RouterDecision, strict=True)
+
+        self._date_message: Optional[Tuple[str, SystemMessage]] = None
+
+    def date_message(self) -> SystemMessage:
+        """Current-date message, re-rendered only when the date changes."""
+        formatted_date = get_formatted_date()
+        cached = self._date_message
+        if cached is None or cached[0] != formatted_date:
+            cached = (
+                formatted_date,
+                SystemMessage(content=get_date_message_text(formatted_date)),
+            )
+            self._date_message = cached
+        return cached[1]
+
+    def build_messages(self, history: list) -> list:
+        return [
+            self.static_system_prompt,
+            self.router_prompt,
+            self.date_message(),
+            *history,
+        ]
+
+
+_runtime: Optional[RouterRuntime] = None
+_runtime_lock = Lock()
+
+
+def get_router_runtime() -> RouterRuntime:
+    """Get the router runtime, rebuilding it only when the schema or prompt files change."""
+    global _runtime
+
+    catalog = get_schema_catalog()
+    key = (
+        catalog.content_hash,
+        _file_fingerprint(os.environ["ROUTER_PROMPT_PATH"]),
+        _file_fingerprint(os.environ["SYSTEM_PROMPT_PATH"]),
+    )
+
+    runtime = _runtime
+    if runtime is not None and runtime.key == key:
+        return runtime
+
+    with _runtime_lock:
+        if _runtime is None or _runtime.key != key:
+            _runtime = RouterRuntime(key, catalog.summary, get_llm())
+            logger.info(f"Router runtime compiled for schema {catalog.schema_version}")
+        return _runtime
+
+
 class RouterNode:
     def __init__(self, state: AgentState):
         self.state: AgentState = state
-        self.llm = get_llm()
+        self.runtime = get_router_runtime()
 
     def classify(self) -> dict:
         logger.debug(f"[ROUTER DEBUG] Sees {len(self.state['messages'])} messages")
         for i, msg in enumerate(self.state["messages"]):
             logger.debug(f"  [{i}] {type(msg).__name__}: {msg.content[:50]}")
 
-        structured_llm = self.llm.with_structured_output(RouterDecision, strict=True)
-        msgs = self.state["messages"]
-
-        with open(os.environ["ROUTER_PROMPT_PATH"], "r") as f:
-            prompt_text = f.read()
-        schema_loader = SchemaLoader()
-        schema_summary = schema_loader.load_schema_summary()
-        schema_summary_text = "\n".join(
-            [f"- {table}: {desc}" for table, desc in schema_summary.items()]
+        msgs = get_history_manager().window(
+            self.state["messages"], self.state.get("history_summary")
         )
-        base_prompt = SystemMessage(content=get_system_prompt())
-        prompt = SystemMessage(
-            content=prompt_text.format(schema_text=schema_summary_text)
+        schema_summary = self.runtime.schema_summary
+        decision = self.runtime.structured_llm.invoke(
+            self.runtime.build_messages(msgs), config=usage_config("router")
         )
-        decision = structured_llm.invoke([base_prompt, prompt] + msgs)
 
         if decision.intent == "greeting":
             return {
@@ -0,0 +1,372 @@
+"""Agent runtime settings loaded from the ``agent`` section of config.yaml."""
+
+import os
+import yaml
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+from pydantic import BaseModel, Field
+
+
+class RetrievalSettings(BaseModel):
+    """Schema retrieval settings for the SQL subgraph."""
+
+    mode: Literal["memory", "pgvector"] = Field(
+        default="memory",
+        description="memory: score the local embedding index; pgvector: ANN search in PostgreSQL",
+    )
+    k: int = Field(default=5, description="Number of tables to retrieve")
+    score_threshold: float = Field(
+        default=0.3, description="Minimum weighted similarity score"
+    )
+    datasource: str = Field(
+        default="postgresql.primary", description="Datasource holding the vectors"
+    )
+    collection_name: str = Field(
+        default="db_schema_vectors", description="pgvector collection name"
+    )
+    ann_index: Literal["hnsw", "ivfflat"] = Field(
+        default="hnsw", description="ANN index type created on ingest"
+    )
+    ivfflat_lists: int = Field(default=100, description="IVFFlat list count")
+    ivfflat_probes: int = Field(
+        default=10, description="IVFFlat lists scanned per search (ivfflat.probes)"
+    )
+    candidate_pool: int = Field(
+        default=100,
+        description=(
+            "Sub-documents fetched from the ANN index before per-table reduction "
+            "(hnsw.ef_search is raised to match)"
+        ),
+    )
+    embedding_dimensions: int = Field(
+        default=1536, description="Embedding vector length (fixed for ANN indexing)"
+    )
+    join_path_depth: int = Field(
+        default=2, description="Max FK hops when adding bridge tables"
+    )
+    max_related_tables: int = Field(
+        default=5, description="Max FK-related tables added to retrieved ones"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class FastPathSettings(BaseModel):
+    """Local intent pre-classifier in front of the LLM router."""
+
+    enabled: bool = Field(default=True, description="Skip the router LLM for trivial turns")
+    use_embeddings: bool = Field(
+        default=True, description="Use the embedding nearest-centroid model after the lexicon"
+    )
+    similarity_threshold: float = Field(
+        default=0.85, description="Min cosine similarity to a greeting/nonsense centroid"
+    )
+    margin: float = Field(
+        default=0.05, description="Required lead over the sql_query centroid"
+    )
+    max_words: int = Field(
+        default=6, description="Longer messages always go to the LLM router"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class HistorySettings(BaseModel):
+    """Conversation history sent to the router, greeting and fallback LLM calls."""
+
+    max_turns: int = Field(default=4, description="Most recent turns kept verbatim")
+    max_tokens: int = Field(
+        default=2000, description="Token budget for summary plus recent turns"
+    )
+    summarize: bool = Field(
+        default=True, description="Fold older turns into a rolling summary"
+    )
+    summary_max_tokens: int = Field(default=300, description="Summary token cap")
+    summary_max_words: int = Field(
+        default=150, description="Summary length requested from the model"
+    )
+    max_background_folds: int = Field(
+        default=1024, description="Max conversations with a pending summary fold (LRU)"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class AnswerCacheSettings(BaseModel):
+    """Cache of validated SQL answers for repeated questions."""
+
+    enabled: bool = Field(default=True, description="Reuse SQL for repeated questions")
+    max_size: int = Field(default=1024, description="Max cached answers (LRU)")
+    ttl_seconds: float = Field(default=3600, description="Entry time to live")
+    similarity_threshold: float = Field(
+        default=0.95,
+        description=(
+            "Min question cosine similarity for an approximate hit; numbers, "
+            "quoted values and dates of the questions must also match"
+        ),
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class ColumnPruningSettings(BaseModel):
+    """Column-level pruning of the DDL sent to SQL generation."""
+
+    enabled: bool = Field(default=True, description="Prune columns irrelevant to the question")
+    max_tokens: int = Field(
+        default=1500, description="Token budget for the schema part of the prompt"
+    )
+    min_columns: int = Field(
+        default=3, description="Best scoring columns always kept per table (besides keys)"
+    )
+    use_embeddings: bool = Field(
+        default=True, description="Score field meanings by embedding similarity"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class FewShotSettings(BaseModel):
+    """Dynamic few-shot examples from past successful queries."""
+
+    enabled: bool = Field(default=True, description="Record and inject verified examples")
+    k: int = Field(default=3, description="Examples injected per generation")
+    min_similarity: float = Field(
+        default=0.75, description="Min question cosine similarity of an example"
+    )
+    max_examples: int = Field(default=5000, description="Examples kept per schema")
+    sqlite_path: Optional[str] = Field(
+        default=None, description="SQLite file (defaults to temp/)"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class TierCost(BaseModel):
+    """Price of a model tier, used to report generation cost."""
+
+    input_per_1k: float = Field(default=0.0, description="Cost per 1K prompt tokens")
+    output_per_1k: float = Field(default=0.0, description="Cost per 1K completion tokens")
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class ModelTierSettings(BaseModel):
+    """FAST-first SQL generation with escalation to SMART."""
+
+    enabled: bool = Field(default=True, description="Try the FAST model on simple questions")
+    min_retrieval_score: float = Field(
+        default=1.6,
+        description=(
+            "Retrieval score counting a table as confidently matched. Weighted "
+            "scale, not cosine: best sub-document cosine x kind weight (question "
+            "2.0, purpose 1.5, field 1.2, search text 1.0) x router/relationship "
+            "boosts; 1.6 is a 0.8 cosine match on an example question"
+        ),
+    )
+    max_fast_tables: int = Field(
+        default=1, description="Max confidently matched tables for the FAST tier"
+    )
+    min_confidence: float = Field(
+        default=0.7, description="FAST results below this confidence are regenerated on SMART"
+    )
+    costs: Dict[str, TierCost] = Field(
+        default_factory=dict, description="Price per tier (fast, smart)"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class CandidateSpec(BaseModel):
+    """Model and temperature of one hedged SQL candidate."""
+
+    model: Literal["fast", "smart"] = Field(default="smart", description="Model tier")
+    temperature: float = Field(default=0.0, description="Sampling temperature")
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class HedgingSettings(BaseModel):
+    """
+    Concurrent SQL candidates, first valid one wins.
+
+    Losing candidates whose LLM call is already in flight still complete, so
+    a request can cost up to one generation per candidate.
+    """
+
+    enabled: bool = Field(default=False, description="Generate candidates concurrently")
+    candidates: List[CandidateSpec] = Field(
+        default_factory=lambda: [
+            CandidateSpec(model="smart", temperature=0.0),
+            CandidateSpec(model="smart", temperature=0.4),
+            CandidateSpec(model="fast", temperature=0.0),
+        ],
+        description="One candidate per entry",
+    )
+    explain_dry_run: bool = Field(
+        default=False, description="Also plan each candidate with EXPLAIN"
+    )
+    timeout: float = Field(default=60.0, description="Seconds to wait for a valid candidate")
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class SQLRepairSettings(BaseModel):
+    """Local repair of unknown identifiers before regenerating with the LLM."""
+
+    enabled: bool = Field(default=True, description="Rename unknown tables/columns locally")
+    max_attempts: int = Field(default=2, description="Local repairs per question")
+    min_similarity: float = Field(
+        default=0.75, description="Minimum name similarity for a replacement"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class SchemaCheckSettings(BaseModel):
+    """Static check of table and column names before execution."""
+
+    enabled: bool = Field(default=True, description="Reject unknown identifiers before execution")
+    suggestion_similarity: float = Field(
+        default=0.5, description="Minimum name similarity for a 'did you mean' hint"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class CostGuardSettings(BaseModel):
+    """EXPLAIN-based cost budget checked before a query runs."""
+
+    enabled: bool = Field(default=True, description="EXPLAIN validated queries before running them")
+    max_examined_rows: int = Field(
+        default=1_000_000, description="Estimated rows examined across all tables"
+    )
+    max_full_scan_rows: int = Field(
+        default=100_000, description="Estimated rows of any single full table scan"
+    )
+    action: Literal["reject", "limit", "warn"] = Field(
+        default="limit",
+        description="Over budget: reject, cap with LIMIT (rejects if a LIMIT cannot help) or warn",
+    )
+    limit_rows: int = Field(default=1000, description="LIMIT injected by the 'limit' action")
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class ExecutionRetrySettings(BaseModel):
+    """Re-running the same SQL when no usable connection could be checked out."""
+
+    max_attempts: int = Field(default=3, description="Executions per query, including the first")
+    base_delay: float = Field(default=0.5, description="Backoff before the first retry (seconds)")
+    max_delay: float = Field(default=4.0, description="Backoff cap (seconds)")
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class AgentSettings(BaseModel):
+    """Global agent settings."""
+
+    retrieval: RetrievalSettings = Field(default_factory=RetrievalSettings)
+    fast_path: FastPathSettings = Field(default_factory=FastPathSettings)
+    history: HistorySettings = Field(default_factory=HistorySettings)
+    answer_cache: AnswerCacheSettings = Field(default_factory=AnswerCacheSettings)
+    column_pruning: ColumnPruningSettings = Field(default_factory=ColumnPruningSettings)
+    few_shot: FewShotSettings = Field(default_factory=FewShotSettings)
+    model_tiers: ModelTierSettings = Field(default_factory=ModelTierSettings)
+    hedging: HedgingSettings = Field(default_factory=HedgingSettings)
+    sql_repair: SQLRepairSettings = Field(default_factory=SQLRepairSettings)
+    schema_check: SchemaCheckSettings = Field(default_factory=SchemaCheckSettings)
+    cost_guard: CostGuardSettings = Field(default_factory=CostGuardSettings)
+    execution_retry: ExecutionRetrySettings = Field(default_factory=ExecutionRetrySettings)
+    async_execution: bool = Field(
+        default=True,
+        description="Run SQL on the async engine (aiomysql/asyncpg) when the graph is streamed",
+    )
+    speculative_retrieval: bool = Field(
+        default=False,
+        description="Retrieve candidate tables concurrently with the router LLM call",
+    )
+    speculative_timeout: float = Field(
+        default=10.0, description="Seconds to wait for speculative retrieval"
+    )
+
+    @classmethod
+    def from_config_file(cls, config_path: Optional[Path] = None) -> "AgentSettings":
+        """Load agent settings from config.yaml with environment variable overrides."""
+        if config_path is None:
+            project_root = Path(__file__).resolve().parent.parent.parent.parent
+            config_path = project_root / "config.yaml"
+
+        config_data: Dict[str, Any] = {}
+        if config_path.exists():
+            with open(config_path, "r") as f:
+                config_data = yaml.safe_load(f) or {}
+
+        return cls._parse_config(config_data)
+
+    @classmethod
+    def _parse_config(cls, config_data: Dict[str, Any]) -> "AgentSettings":
+        """Parse configuration data into AgentSettings object."""
+        agent_config = dict(config_data.get("agent") or {})
+
+        retrieval_config = dict(agent_config.get("retrieval") or {})
+        if "RETRIEVAL_MODE" in os.environ:
+            retrieval_config["mode"] = os.environ["RETRIEVAL_MODE"]
+        agent_config["retrieval"] = retrieval_config
+
+        if "SPECULATIVE_RETRIEVAL" in os.environ:
+            agent_config["speculative_retrieval"] = os.environ[
+                "SPECULATIVE_RETRIEVAL"
+            ].lower() in ("1", "true", "yes")
+
+        return cls(**agent_config)
+
+    class Config:
+        extra = "forbid"
+
+
+# Global settings instance
+_settings: Optional[AgentSettings] = None
+
+
+def get_agent_settings() -> AgentSettings:
+    """Get the global agent settings instance."""
+    global _settings
+    if _settings is None:
+        _settings = AgentSettings.from_config_file()
+    return _settings
+
+
+def reload_agent_settings() -> AgentSettings:
+    """Reload agent settings from config file."""
+    global _settings
+    _settings = AgentSettings.from_config_file()
+    return _settings
@@ -1,4 +1,4 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from langgraph.graph import MessagesState
 
@@ -6,4 +6,7 @@ from langgraph.graph import MessagesState
 class AgentState(MessagesState):
     next_step: str
     relevant_tables: Optional[list[str]]
+    candidate_tables: Optional[List[Tuple[str, str, float]]]
     visualization: Optional[Dict[str, Any]]
+    history_summary: Optional[str]
+    summarized_count: int
@@ -0,0 +1,263 @@
+"""Semantic cache of validated SQL answers, scoped to the schema version."""
+
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_agentic_chatbot.infrastructure.embedding.query_cache import normalize_query
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Question parts that become SQL literals: numbers, quoted values, and
+# calendar and relative date words ("top 10" / "top 20", "in January" /
+# "in February", "this month" / "last month" embed almost identically)
+_QUOTED = re.compile(r"'([^']*)'|\"([^\"]*)\"")
+_WORD = re.compile(r"[a-z0-9]+(?:[.,]\d+)*")
+_PARAMETER_WORDS = frozenset(
+    """
+    january february march april may june july august september october november december
+    jan feb mar apr jun jul aug sep sept oct nov dec
+    monday tuesday wednesday thursday friday saturday sunday
+    today yesterday tomorrow last this next previous current past ytd mtd qtd
+    day days week weeks month months quarter quarters year years
+    one two three four five six seven eight nine ten eleven twelve fifteen twenty
+    thirty fifty hundred thousand million
+    """.split()
+)
+
+
+def question_parameters(question: str) -> Tuple[str, ...]:
+    """Numbers, quoted literals and date words of a question, sorted."""
+    lowered = question.lower()
+    quoted = [first or second for first, second in _QUOTED.findall(lowered)]
+    unquoted = _QUOTED.sub(" ", lowered)
+    parameters = quoted + [
+        word
+        for word in _WORD.findall(unquoted)
+        if word in _PARAMETER_WORDS or any(char.isdigit() for char in word)
+    ]
+    return tuple(sorted(parameters))
+
+
+@dataclass(frozen=True)
+class CachedAnswer:
+    """Generated SQL that was validated and executed successfully."""
+
+    question: str
+    generated_sql: str
+    explanation: str
+    tables_used: Tuple[str, ...]
+    confidence: float
+
+
+@dataclass(frozen=True)
+class AnswerCacheHit:
+    answer: CachedAnswer
+    key: str
+    similarity: float
+    exact: bool
+
+
+class SQLAnswerCache:
+    """
+    LRU/TTL cache of SQL answers keyed by normalized question.
+
+    Exact lookups match the normalized question text. Approximate lookups
+    compare the question embedding against every cached question of the same
+    schema and accept the best match at or above ``similarity_threshold``
+    whose ``question_parameters`` are the same: near-identical questions
+    that differ in a number, quoted value or date ask for different SQL.
+    All entries belong to one schema scope (the catalog content hash); a
+    lookup or store under a different scope drops them.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl_seconds: float = 3600,
+        similarity_threshold: float = 0.95,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+
+        self._scope: Optional[str] = None
+        # key -> (expires_at, answer, unit-normalized question vector, question parameters)
+        self._entries: "OrderedDict[str, Tuple[float, CachedAnswer, Optional[np.ndarray], Tuple[str, ...]]]" = (
+            OrderedDict()
+        )
+        self._matrix: Optional[Tuple[List[str], np.ndarray]] = None
+        self._lock = Lock()
+
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(question: str) -> str:
+        return normalize_query(question)
+
+    def lookup(
+        self,
+        question: str,
+        scope: str,
+        embed_question: Optional[Callable[[], Optional[Sequence[float]]]] = None,
+    ) -> Optional[AnswerCacheHit]:
+        """
+        Exact lookup, then (if ``embed_question`` is given) approximate lookup.
+
+        ``embed_question`` is only called on an exact miss, outside the lock.
+        """
+        key = self.make_key(question)
+
+        with self._lock:
+            self._ensure_scope(scope)
+            self._evict_expired(time.time())
+
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                return AnswerCacheHit(entry[1], key, 1.0, exact=True)
+
+            if embed_question is None or not self._entries:
+                self.misses += 1
+                return None
+
+        query_vector = embed_question()
+
+        with self._lock:
+            hit = None
+            if query_vector is not None and scope == self._scope:
+                hit = self._nearest(_unit(query_vector), question_parameters(question))
+            if hit is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(hit.key)
+            self.semantic_hits += 1
+            return hit
+
+    def store(
+        self,
+        question: str,
+        scope: str,
+        answer: CachedAnswer,
+        query_vector: Optional[Sequence[float]] = None,
+    ) -> None:
+        key = self.make_key(question)
+        vector = _unit(query_vector) if query_vector is not None else None
+
+        with self._lock:
+            self._ensure_scope(scope)
+            self._entries[key] = (
+                time.time() + self.ttl_seconds,
+                answer,
+                vector,
+                question_parameters(question),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            self._matrix = None
+            self.stores += 1
+
+    def invalidate(self, key: str) -> None:
+        """Drop one entry, e.g. when its SQL no longer executes."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._matrix = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._matrix = None
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "size": len(self._entries),
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def _ensure_scope(self, scope: str) -> None:
+        if scope == self._scope:
+            return
+        if self._entries:
+            logger.info(
+                f"[Answer cache] Schema changed, dropping {len(self._entries)} entries"
+            )
+            self.invalidations += 1
+        self._entries.clear()
+        self._matrix = None
+        self._scope = scope
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [key for key, entry in self._entries.items() if entry[0] <= now]
+        for key in expired:
+            del self._entries[key]
+        if expired:
+            self._matrix = None
+
+    def _nearest(
+        self, query: np.ndarray, parameters: Tuple[str, ...]
+    ) -> Optional[AnswerCacheHit]:
+        if self._matrix is None:
+            keys = [key for key, entry in self._entries.items() if entry[2] is not None]
+            if not keys:
+                return None
+            self._matrix = (keys, np.stack([self._entries[key][2] for key in keys]))
+
+        keys, matrix = self._matrix
+        if matrix.shape[1] != query.shape[0]:
+            return None
+
+        similarities = matrix @ query
+        for index in np.argsort(-similarities):
+            similarity = float(similarities[index])
+            if similarity < self.similarity_threshold:
+                break
+            _, answer, _, cached_parameters = self._entries[keys[index]]
+            if cached_parameters == parameters:
+                return AnswerCacheHit(answer, keys[index], similarity, exact=False)
+        return None
+
+
+def _unit(vector: Sequence[float]) -> np.ndarray:
+    array = np.asarray(vector, dtype=np.float32)
+    return array / max(float(np.linalg.norm(array)), 1e-12)
+
+
+_cache: Optional[SQLAnswerCache] = None
+_cache_lock = Lock()
+
+
+def get_answer_cache() -> SQLAnswerCache:
+    """Get the process-wide SQL answer cache, configured from agent settings."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                from ai_agentic_chatbot.agent.settings import get_agent_settings
+
+                settings = get_agent_settings().answer_cache
+                _cache = SQLAnswerCache(
+                    max_size=settings.max_size,
+                    ttl_seconds=settings.ttl_seconds,
+                    similarity_threshold=settings.similarity_threshold,
+                )
+    return _cache
@@ -0,0 +1,292 @@
+"""Column-level pruning of retrieved table DDL under a token budget."""
+
+import re
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from ai_agentic_chatbot.infrastructure.llm.tokens import count_tokens
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.embedding_index import (
+    KIND_FIELD,
+    SchemaEmbeddingIndex,
+)
+from ai_agentic_chatbot.schema_extractor.fk_graph import ForeignKeyGraph
+
+logger = get_logger(__name__)
+
+NAME_MATCH_SCORE = 1.0
+PARTIAL_NAME_MATCH_SCORE = 0.7
+
+# Column name tokens too generic to count as a match on their own
+_GENERIC_TOKENS = {"id", "at", "is", "no", "num", "code", "type", "by"}
+_TOKEN = re.compile(r"[a-z0-9]+")
+_KEY_COLUMNS = re.compile(r"\((.*?)\)")
+
+# Table header added per table by generate_sql ("-- Table: name")
+TABLE_HEADER_TOKENS = 8
+
+
+def _stem(token: str) -> str:
+    return token[:-1] if len(token) > 3 and token.endswith("s") else token
+
+
+def tokenize(text: str) -> Set[str]:
+    return {_stem(token) for token in _TOKEN.findall(text.lower())}
+
+
+@dataclass(frozen=True)
+class ParsedDDL:
+    """``CREATE TABLE`` statement split into column and constraint lines."""
+
+    header: str
+    columns: Tuple[Tuple[str, str], ...]  # (column name, line)
+    constraints: Tuple[str, ...]
+
+    @property
+    def column_names(self) -> List[str]:
+        return [name for name, _ in self.columns]
+
+    @property
+    def primary_key(self) -> List[str]:
+        for line in self.constraints:
+            if line.upper().startswith("PRIMARY KEY"):
+                match = _KEY_COLUMNS.search(line)
+                if match:
+                    return [column.strip() for column in match.group(1).split(",")]
+        return []
+
+    def render(self, keep: Set[str]) -> str:
+        """DDL with only the ``keep`` columns (and constraints on them)."""
+        lines = [f"  {line}" for name, line in self.columns if name in keep]
+        for line in self.constraints:
+            if line.upper().startswith("FOREIGN KEY"):
+                match = _KEY_COLUMNS.search(line)
+                if match and match.group(1).strip() not in keep:
+                    continue
+            lines.append(f"  {line}")
+
+        body = ",\n".join(lines)
+        omitted = len(self.columns) - sum(name in keep for name, _ in self.columns)
+        if omitted:
+            body += f"\n  -- {omitted} more columns omitted"
+        return f"{self.header}\n{body}\n);"
+
+
+def parse_ddl(ddl: str) -> Optional[ParsedDDL]:
+    """Parse DDL as generated by ``SchemaLoader``; None if it has another shape."""
+    lines = ddl.strip().splitlines()
+    if (
+        len(lines) < 3
+        or not lines[0].upper().startswith("CREATE TABLE")
+        or not lines[0].rstrip().endswith("(")
+        or lines[-1].strip() != ");"
+    ):
+        return None
+
+    columns, constraints = [], []
+    for line in lines[1:-1]:
+        line = line.strip().rstrip(",")
+        if not line:
+            continue
+        upper = line.upper()
+        if upper.startswith(("PRIMARY KEY", "FOREIGN KEY", "UNIQUE", "CONSTRAINT", "INDEX", "KEY ")):
+            constraints.append(line)
+        else:
+            columns.append((line.split()[0], line))
+
+    return ParsedDDL(lines[0], tuple(columns), tuple(constraints))
+
+
+def name_match_score(column: str, query_tokens: Set[str]) -> float:
+    tokens = {_stem(token) for token in column.lower().split("_") if token}
+    specific = tokens - _GENERIC_TOKENS
+    if not specific:
+        return 0.0
+    if specific <= query_tokens:
+        return NAME_MATCH_SCORE
+    if specific & query_tokens:
+        return PARTIAL_NAME_MATCH_SCORE
+    return 0.0
+
+
+def join_columns(
+    table: str, other_tables: Sequence[str], fk_graph: ForeignKeyGraph
+) -> Set[str]:
+    """Columns of ``table`` used by foreign keys to any of ``other_tables``."""
+    columns = set()
+    for other in other_tables:
+        if other == table:
+            continue
+        for edge in fk_graph.edges_between(table, other):
+            columns.add(edge.column if edge.table == table else edge.referred_column)
+    return columns
+
+
+class ColumnPruner:
+    """
+    Shrinks retrieved table DDL to the columns relevant to the question.
+
+    Primary keys and columns joining the retrieved tables are always kept,
+    as are the ``min_columns`` best scoring columns per table. Remaining
+    columns are added best score first (name match with the question, or
+    similarity of the field meaning to the question embedding) while the
+    schema fits ``max_tokens``. If the full DDL already fits it is left as is.
+    """
+
+    def __init__(self, max_tokens: int = 1500, min_columns: int = 3):
+        self.max_tokens = max_tokens
+        self.min_columns = min_columns
+
+    def prune(
+        self,
+        tables: List[Tuple[str, str, float]],
+        user_query: str,
+        fk_graph: ForeignKeyGraph,
+        field_similarities: Optional[Mapping[str, Mapping[str, float]]] = None,
+    ) -> List[Tuple[str, str, float]]:
+        full_tokens = sum(count_tokens(ddl) + TABLE_HEADER_TOKENS for _, ddl, _ in tables)
+        if full_tokens <= self.max_tokens:
+            return tables
+
+        field_similarities = field_similarities or {}
+        query_tokens = tokenize(user_query)
+        table_names = [name for name, _, _ in tables]
+
+        parsed: Dict[str, ParsedDDL] = {}
+        keep: Dict[str, Set[str]] = {}
+        candidates = []
+        used = 0
+
+        for position, (name, ddl, _) in enumerate(tables):
+            ddl_parsed = parse_ddl(ddl)
+            if ddl_parsed is None:
+                used += count_tokens(ddl) + TABLE_HEADER_TOKENS
+                continue
+            parsed[name] = ddl_parsed
+
+            similarities = field_similarities.get(name, {})
+            scored = sorted(
+                (
+                    (
+                        max(
+                            name_match_score(column, query_tokens),
+                            similarities.get(column, 0.0),
+                        ),
+                        index,
+                        column,
+                        line,
+                    )
+                    for index, (column, line) in enumerate(ddl_parsed.columns)
+                ),
+                key=lambda item: (-item[0], item[1]),
+            )
+
+            protected = set(ddl_parsed.primary_key) | join_columns(name, table_names, fk_graph)
+            kept = protected & set(ddl_parsed.column_names)
+            best = [column for _, _, column, _ in scored if column not in kept]
+            kept.update(best[: self.min_columns])
+
+            keep[name] = kept
+            used += count_tokens(ddl_parsed.render(kept)) + TABLE_HEADER_TOKENS
+            candidates.extend(
+                (score, position, index, name, column, line)
+                for score, index, column, line in scored
+                if column not in kept
+            )
+
+        for score, _, _, name, column, line in sorted(candidates, key=lambda c: (-c[0], c[1], c[2])):
+            cost = count_tokens(line) + 1
+            if used + cost > self.max_tokens:
+                continue
+            keep[name].add(column)
+            used += cost
+
+        pruned = []
+        for name, ddl, score in tables:
+            if name in parsed:
+                ddl = parsed[name].render(keep[name])
+            pruned.append((name, ddl, score))
+
+        logger.info(
+            f"[Column Pruning] Schema reduced from ~{full_tokens} to ~{used} tokens "
+            f"(budget {self.max_tokens})"
+        )
+        return pruned
+
+
+class FieldMeaningIndex:
+    """Field-meaning embeddings from the schema index, grouped per table column."""
+
+    def __init__(self, index: SchemaEmbeddingIndex, table_docs: Sequence[Mapping]):
+        self.key = index.key
+
+        fields_by_meaning: Dict[Tuple[str, str], List[str]] = {}
+        for table_doc in table_docs:
+            for field in table_doc.get("key_fields") or []:
+                fields_by_meaning.setdefault(
+                    (table_doc["name"], field.get("meaning", "")), []
+                ).append(field.get("field_name", ""))
+
+        rows: List[int] = []
+        self._columns: List[Tuple[str, str]] = []
+        for row, sub_doc in enumerate(index.sub_documents):
+            if sub_doc.kind != KIND_FIELD:
+                continue
+            for column in fields_by_meaning.get((sub_doc.table_name, sub_doc.text), []):
+                rows.append(row)
+                self._columns.append((sub_doc.table_name, column))
+
+        self._matrix = np.zeros((0, 0), np.float32)
+        if rows:
+            matrix = index.matrix[rows]
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            self._matrix = matrix / norms
+
+    def similarities(self, query_vector: Sequence[float]) -> Dict[str, Dict[str, float]]:
+        """table -> column -> cosine similarity of its field meaning to the query."""
+        if not len(self._matrix):
+            return {}
+        query = np.asarray(query_vector, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        result: Dict[str, Dict[str, float]] = {}
+        for (table, column), score in zip(self._columns, self._matrix @ query):
+            columns = result.setdefault(table, {})
+            columns[column] = max(columns.get(column, -1.0), float(score))
+        return result
+
+
+_pruner: Optional[ColumnPruner] = None
+_field_index: Optional[FieldMeaningIndex] = None
+_lock = Lock()
+
+
+def get_column_pruner() -> ColumnPruner:
+    """Get the global column pruner, configured from agent settings."""
+    global _pruner
+    if _pruner is None:
+        with _lock:
+            if _pruner is None:
+                from ai_agentic_chatbot.agent.settings import get_agent_settings
+
+                settings = get_agent_settings().column_pruning
+                _pruner = ColumnPruner(
+                    max_tokens=settings.max_tokens, min_columns=settings.min_columns
+                )
+    return _pruner
+
+
+def get_field_meaning_index(
+    index: SchemaEmbeddingIndex, table_docs: Sequence[Mapping]
+) -> FieldMeaningIndex:
+    """Field meaning vectors for ``index``, rebuilt only when the index changes."""
+    global _field_index
+    field_index = _field_index
+    if field_index is None or field_index.key != index.key:
+        field_index = FieldMeaningIndex(index, table_docs)
+        _field_index = field_index
+    return field_index
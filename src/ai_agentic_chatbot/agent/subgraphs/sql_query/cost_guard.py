@@ -0,0 +1,152 @@
+"""Query cost estimation from EXPLAIN plans and cost budgets."""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+ACTION_REJECT = "reject"
+ACTION_LIMIT = "limit"
+ACTION_WARN = "warn"
+
+# MySQL access_type of a full table scan
+FULL_SCAN = "ALL"
+
+# "Seq Scan on orders o  (cost=0.00..35.50 rows=2550 width=4)",
+# "Index Scan using orders_pkey on orders  (cost=...)"
+_PG_NODE = re.compile(
+    r"(?P<node>[A-Z][A-Za-z ]*?)(?: using \S+)?(?: on (?P<table>\S+))?(?: \S+)?\s+"
+    r"\(cost=(?P<startup>[\d.]+)\.\.(?P<total>[\d.]+) rows=(?P<rows>\d+)"
+)
+
+
+@dataclass(frozen=True)
+class TableScan:
+    table: str
+    access_type: str  # MySQL access_type, or the PostgreSQL scan node
+    rows: float  # estimated rows read per scan
+
+    @property
+    def is_full_scan(self) -> bool:
+        return self.access_type in (FULL_SCAN, "Seq Scan")
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """Estimated cost of a query, from either database's EXPLAIN."""
+
+    examined_rows: float
+    scans: Tuple[TableScan, ...] = ()
+    cost: Optional[float] = None
+
+    @property
+    def full_scans(self) -> List[TableScan]:
+        return [scan for scan in self.scans if scan.is_full_scan]
+
+    def summary(self) -> dict:
+        return {
+            "examined_rows": self.examined_rows,
+            "cost": self.cost,
+            "scans": [
+                {"table": scan.table, "access_type": scan.access_type, "rows": scan.rows}
+                for scan in self.scans
+            ],
+        }
+
+
+def _number(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def parse_mysql_plan(plan: Mapping[str, Any]) -> QueryPlan:
+    """
+    Parse ``EXPLAIN FORMAT=JSON`` output.
+
+    Tables are taken in plan order; rows examined by a joined table are
+    multiplied by the rows produced by the join so far (nested loop).
+    """
+    tables: List[Mapping[str, Any]] = []
+
+    def walk(node: Any) -> None:
+        if isinstance(node, Mapping):
+            for key, value in node.items():
+                if key == "table" and isinstance(value, Mapping):
+                    tables.append(value)
+                walk(value)
+        elif isinstance(node, list):
+            for item in node:
+                walk(item)
+
+    walk(plan)
+
+    scans = []
+    examined, produced = 0.0, 1.0
+    for table in tables:
+        rows = _number(table.get("rows_examined_per_scan"))
+        scans.append(TableScan(table.get("table_name", "?"), table.get("access_type", ""), rows))
+        examined += produced * rows
+        produced = max(_number(table.get("rows_produced_per_join")), 1.0)
+
+    query_block = plan.get("query_block", {}) if isinstance(plan, Mapping) else {}
+    cost = query_block.get("cost_info", {}).get("query_cost")
+    return QueryPlan(examined, tuple(scans), _number(cost) if cost is not None else None)
+
+
+def parse_postgres_plan(lines: Sequence[str]) -> QueryPlan:
+    """
+    Parse text ``EXPLAIN`` output.
+
+    Examined rows are the sum of rows of every scan node; the cost is the
+    total cost of the top node.
+    """
+    scans = []
+    cost = None
+    for line in lines:
+        match = _PG_NODE.search(line)
+        if not match:
+            continue
+        if cost is None:
+            cost = float(match.group("total"))
+        node = match.group("node").strip()
+        if "Scan" in node and match.group("table"):
+            scans.append(TableScan(match.group("table"), node, float(match.group("rows"))))
+
+    return QueryPlan(sum(scan.rows for scan in scans), tuple(scans), cost)
+
+
+@dataclass(frozen=True)
+class CostBudget:
+    max_examined_rows: float = 1_000_000
+    max_full_scan_rows: float = 100_000
+
+
+@dataclass(frozen=True)
+class CostVerdict:
+    plan: QueryPlan
+    violations: Tuple[str, ...] = field(default_factory=tuple)
+
+    @property
+    def within_budget(self) -> bool:
+        return not self.violations
+
+
+def evaluate_plan(plan: QueryPlan, budget: CostBudget) -> CostVerdict:
+    violations = []
+    if plan.examined_rows > budget.max_examined_rows:
+        violations.append(
+            f"~{plan.examined_rows:,.0f} rows examined "
+            f"(budget {budget.max_examined_rows:,.0f})"
+        )
+    for scan in plan.full_scans:
+        if scan.rows > budget.max_full_scan_rows:
+            violations.append(
+                f"full scan of {scan.table} (~{scan.rows:,.0f} rows, "
+                f"budget {budget.max_full_scan_rows:,.0f})"
+            )
+    return CostVerdict(plan, tuple(violations))
@@ -0,0 +1,208 @@
+"""Persistent store of verified (question, SQL) pairs for dynamic few-shot prompts."""
+
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_agentic_chatbot.infrastructure.embedding.query_cache import normalize_query
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent.parent
+DEFAULT_SQLITE_PATH = BASE_DIR / "temp" / "few_shot_examples.sqlite3"
+
+
+@dataclass(frozen=True)
+class FewShotExample:
+    """A question and the SQL that answered it successfully."""
+
+    question: str
+    sql: str
+    tables_used: Tuple[str, ...]
+    similarity: float = 0.0
+
+
+class FewShotStore:
+    """
+    SQLite-backed examples with an in-memory embedding matrix per schema scope.
+
+    Examples are keyed by scope (schema catalog content hash) and normalized
+    question; recording the same question again replaces the SQL. Only
+    examples of the current scope are searched, so SQL written against an
+    older schema is never suggested.
+    """
+
+    def __init__(self, sqlite_path: Path, max_examples: int = 5000):
+        self.max_examples = max_examples
+
+        self._db = self._open_db(Path(sqlite_path))
+        self._db_lock = Lock()
+
+        self._scope: Optional[str] = None
+        self._examples: List[FewShotExample] = []
+        self._matrix = np.zeros((0, 0), np.float32)
+        self._lock = Lock()
+
+    @staticmethod
+    def make_key(question: str, scope: str) -> str:
+        return hashlib.sha256(
+            f"{scope}\x00{normalize_query(question)}".encode("utf-8")
+        ).hexdigest()
+
+    def add(
+        self,
+        question: str,
+        sql: str,
+        scope: str,
+        query_vector: Sequence[float],
+        tables_used: Sequence[str] = (),
+    ) -> None:
+        vector = np.asarray(query_vector, dtype="<f8")
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO few_shot_examples "
+                "(key, scope, question, sql, tables_used, vector, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self.make_key(question, scope),
+                    scope,
+                    question,
+                    sql,
+                    ",".join(tables_used),
+                    vector.tobytes(),
+                    time.time(),
+                ),
+            )
+            # Keep the newest max_examples per scope
+            self._db.execute(
+                "DELETE FROM few_shot_examples WHERE scope = ? AND key NOT IN ("
+                "  SELECT key FROM few_shot_examples WHERE scope = ?"
+                "  ORDER BY created_at DESC LIMIT ?"
+                ")",
+                (scope, scope, self.max_examples),
+            )
+
+        with self._lock:
+            # Reload lazily on the next search
+            if self._scope == scope:
+                self._scope = None
+
+    def search(
+        self,
+        query_vector: Sequence[float],
+        scope: str,
+        k: int = 3,
+        min_similarity: float = 0.0,
+    ) -> List[FewShotExample]:
+        """Top ``k`` examples by question similarity, best first."""
+        with self._lock:
+            if self._scope != scope:
+                self._load(scope)
+            examples, matrix = self._examples, self._matrix
+
+        if not examples or k <= 0:
+            return []
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        if matrix.shape[1] != query.shape[0]:
+            return []
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+        similarities = matrix @ query
+        top = np.argsort(-similarities)[:k]
+        return [
+            FewShotExample(
+                examples[i].question,
+                examples[i].sql,
+                examples[i].tables_used,
+                float(similarities[i]),
+            )
+            for i in top
+            if similarities[i] >= min_similarity
+        ]
+
+    def __len__(self) -> int:
+        with self._db_lock:
+            return self._db.execute("SELECT COUNT(*) FROM few_shot_examples").fetchone()[0]
+
+    def _load(self, scope: str) -> None:
+        with self._db_lock:
+            rows = self._db.execute(
+                "SELECT question, sql, tables_used, vector FROM few_shot_examples "
+                "WHERE scope = ? ORDER BY created_at",
+                (scope,),
+            ).fetchall()
+
+        examples, vectors = [], []
+        for question, sql, tables_used, blob in rows:
+            examples.append(
+                FewShotExample(question, sql, tuple(filter(None, tables_used.split(","))))
+            )
+            vectors.append(np.frombuffer(blob, dtype="<f8"))
+
+        matrix = np.zeros((0, 0), np.float32)
+        if vectors and len({len(vector) for vector in vectors}) == 1:
+            matrix = np.asarray(vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+
+        self._scope = scope
+        self._examples = examples if len(matrix) else []
+        self._matrix = matrix
+        logger.info(f"Loaded {len(self._examples)} few-shot examples for scope {scope[:12]}")
+
+    def _open_db(self, path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        with db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS few_shot_examples ("
+                "  key TEXT PRIMARY KEY,"
+                "  scope TEXT NOT NULL,"
+                "  question TEXT NOT NULL,"
+                "  sql TEXT NOT NULL,"
+                "  tables_used TEXT NOT NULL,"
+                "  vector BLOB NOT NULL,"
+                "  created_at REAL NOT NULL"
+                ")"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS few_shot_examples_scope "
+                "ON few_shot_examples (scope, created_at)"
+            )
+        return db
+
+
+def format_examples(examples: Sequence[FewShotExample]) -> str:
+    return "\n\n".join(
+        f"Question: {example.question}\nSQL: {example.sql}" for example in examples
+    )
+
+
+_store: Optional[FewShotStore] = None
+_store_lock = Lock()
+
+
+def get_few_shot_store() -> FewShotStore:
+    """Get the process-wide few-shot store, configured from agent settings."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                from ai_agentic_chatbot.agent.settings import get_agent_settings
+
+                settings = get_agent_settings().few_shot
+                _store = FewShotStore(
+                    sqlite_path=Path(settings.sqlite_path or DEFAULT_SQLITE_PATH),
+                    max_examples=settings.max_examples,
+                )
+    return _store
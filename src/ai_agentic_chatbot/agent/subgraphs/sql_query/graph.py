@@ -2,6 +2,14 @@
 
 from langgraph.graph import StateGraph, END
 from ai_agentic_chatbot.agent.subgraphs.sql_query.state import SQLSubgraphState
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.answer_cache import (
+    evict_answer_cache_node,
+    lookup_answer_cache_node,
+    store_answer_cache_node,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.few_shot import (
+    record_few_shot_node,
+)
 from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.retrieve_schemas import (
     retrieve_schemas_node,
 )
@@ -11,30 +19,51 @@ from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.generate_sql import (
 from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.validate_query import (
     validate_query_node,
 )
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.check_cost import (
+    check_cost_node,
+)
 from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.execute_query import (
+    aexecute_query_node,
     execute_query_node,
 )
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.repair_sql import (
+    repair_sql_node,
+)
 from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import (
+    route_after_cache_lookup,
     route_after_retrieval,
     route_after_generation,
     route_after_validation,
+    route_after_cost_check,
     route_after_execution,
+    route_after_repair,
 )
 from ai_agentic_chatbot.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
-def create_sql_subgraph():
+def create_sql_subgraph(async_execution: bool = False):
     """
     Build the SQL query processing subgraph.
 
+    With ``async_execution`` the query runs on the datasource's async
+    engine; the graph must then be run with ``ainvoke``/``astream``, which
+    also move the remaining synchronous nodes off the event loop.
+
     Flow:
+    0. lookup_answer: Reuse cached SQL for a repeated question (hit -> 3)
     1. retrieve_schemas: Semantic search for relevant tables
     2. generate_sql: LLM generates SQL query
-    3. validate_query: Safety and syntax validation
-    4. execute_query: Database execution
-    5. (Optional) Retry loop back to generate_sql on error
+    3. validate_query: Safety, syntax and schema identifier validation
+       (unknown identifiers go to 6 like an execution error)
+    4. check_cost: EXPLAIN estimate against the cost budget
+       (reject, cap with a LIMIT, or warn)
+    5. execute_query: Database execution
+    6. repair_sql: Rename unknown tables/columns locally, back to 3 if fixed
+    7. (Optional) Retry loop back to generate_sql on error
+    8. store_answer: Cache SQL that executed successfully
+    9. record_example: Keep the (question, SQL) pair as a few-shot example
 
     This follows the "one action per node" principle for:
     - Proper streaming support
@@ -46,12 +75,26 @@ def create_sql_subgraph():
 
     workflow = StateGraph(SQLSubgraphState)
 
+    workflow.add_node("lookup_answer", lookup_answer_cache_node)
     workflow.add_node("retrieve_schemas", retrieve_schemas_node)
     workflow.add_node("generate_sql", generate_sql_node)
     workflow.add_node("validate_query", validate_query_node)
-    workflow.add_node("execute_query", execute_query_node)
+    workflow.add_node("check_cost", check_cost_node)
+    workflow.add_node(
+        "execute_query", aexecute_query_node if async_execution else execute_query_node
+    )
+    workflow.add_node("repair_sql", repair_sql_node)
+    workflow.add_node("store_answer", store_answer_cache_node)
+    workflow.add_node("evict_answer", evict_answer_cache_node)
+    workflow.add_node("record_example", record_few_shot_node)
+
+    workflow.set_entry_point("lookup_answer")
 
-    workflow.set_entry_point("retrieve_schemas")
+    workflow.add_conditional_edges(
+        "lookup_answer",
+        route_after_cache_lookup,
+        {"validate_query": "validate_query", "retrieve_schemas": "retrieve_schemas"},
+    )
 
     workflow.add_conditional_edges(
         "retrieve_schemas",
@@ -68,17 +111,57 @@ def create_sql_subgraph():
     workflow.add_conditional_edges(
         "validate_query",
         route_after_validation,
-        {"execute_query": "execute_query", "END": END},
+        {
+            "check_cost": "check_cost",
+            "generate_sql": "generate_sql",
+            "repair_sql": "repair_sql",
+            "evict_answer": "evict_answer",
+            "END": END,
+        },
+    )
+
+    workflow.add_conditional_edges(
+        "check_cost",
+        route_after_cost_check,
+        {
+            "execute_query": "execute_query",
+            "generate_sql": "generate_sql",
+            "repair_sql": "repair_sql",
+            "evict_answer": "evict_answer",
+            "END": END,
+        },
     )
 
     workflow.add_conditional_edges(
         "execute_query",
         route_after_execution,
-        {"generate_sql": "generate_sql", "END": END},
+        {
+            "generate_sql": "generate_sql",
+            "repair_sql": "repair_sql",
+            "store_answer": "store_answer",
+            "evict_answer": "evict_answer",
+            "END": END,
+        },
     )
 
+    workflow.add_conditional_edges(
+        "repair_sql",
+        route_after_repair,
+        {
+            "validate_query": "validate_query",
+            "generate_sql": "generate_sql",
+            "evict_answer": "evict_answer",
+            "END": END,
+        },
+    )
+
+    workflow.add_edge("store_answer", "record_example")
+    workflow.add_edge("record_example", END)
+    workflow.add_edge("evict_answer", "retrieve_schemas")
+
     logger.info("SQL subgraph compiled successfully")
     return workflow.compile()
 
 
 sql_subgraph = create_sql_subgraph()
+async_sql_subgraph = create_sql_subgraph(async_execution=True)
@@ -0,0 +1,76 @@
+"""Run candidate tasks concurrently and take the first acceptable result."""
+
+from concurrent.futures import (
+    Executor,
+    ThreadPoolExecutor,
+    TimeoutError as FuturesTimeoutError,
+    as_completed,
+)
+from threading import Event
+from typing import Callable, Generic, List, Optional, Sequence, TypeVar
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+_candidate_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sql-candidate")
+
+
+class HedgeResult(Generic[T]):
+    """
+    The accepted result (if any) and every result that finished before it.
+
+    ``abandoned`` counts the tasks that were still running when the result
+    was taken; their results are discarded.
+    """
+
+    def __init__(self, winner: Optional[T], completed: List[T], abandoned: int = 0):
+        self.winner = winner
+        self.completed = completed
+        self.abandoned = abandoned
+
+
+def first_accepted(
+    tasks: Sequence[Callable[[], T]],
+    accept: Callable[[T], bool],
+    timeout: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    cancel: Optional[Event] = None,
+) -> HedgeResult[T]:
+    """
+    Start all ``tasks`` and return as soon as one result passes ``accept``.
+
+    Tasks that have not started yet are cancelled. Threads cannot be
+    interrupted, so running tasks are only signalled through ``cancel`` and
+    stop at their next check of it; work already in flight (an LLM request)
+    still completes, so N tasks can cost up to N times one. Failed tasks are
+    logged and skipped.
+    """
+    executor = executor or _candidate_pool
+    futures = [executor.submit(task) for task in tasks]
+    completed: List[T] = []
+    winner: Optional[T] = None
+
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            try:
+                value = future.result()
+            except Exception as e:
+                logger.warning(f"[Hedging] Candidate failed: {e}")
+                continue
+            completed.append(value)
+            if accept(value):
+                winner = value
+                break
+    except FuturesTimeoutError:
+        logger.warning(f"[Hedging] No acceptable candidate within {timeout}s")
+    finally:
+        if cancel is not None:
+            cancel.set()
+        abandoned = sum(1 for future in futures if not future.cancel() and not future.done())
+
+    if abandoned:
+        logger.info(f"[Hedging] {abandoned} running candidate(s) abandoned")
+    return HedgeResult(winner, completed, abandoned)
@@ -0,0 +1,125 @@
+"""Top-level LIMIT handling on the lexed query (CTEs, UNION and subqueries aware)."""
+
+from typing import Any, List, Optional, Tuple
+
+from sqlparse import lexer
+from sqlparse import tokens as T
+
+# Top-level clauses a LIMIT cannot cut short: every row is read first
+_BLOCKING_KEYWORDS = {"GROUP BY", "ORDER BY", "DISTINCT", "HAVING", "UNION", "UNION ALL"}
+_AGGREGATES = {"COUNT", "SUM", "AVG", "MIN", "MAX", "GROUP_CONCAT"}
+
+
+def top_level_tokens(sql: str) -> List[Tuple[int, Any, str]]:
+    """(depth, ttype, value) of every lexer token."""
+    result = []
+    depth = 0
+    for ttype, value in lexer.tokenize(sql):
+        if ttype in T.Punctuation and value == ")":
+            depth -= 1
+        result.append((depth, ttype, value))
+        if ttype in T.Punctuation and value == "(":
+            depth += 1
+    return result
+
+
+def is_limitable(sql: str) -> bool:
+    """
+    Whether a LIMIT stops the query early.
+
+    Grouping, ordering, DISTINCT and top-level aggregates read every row
+    before the first one is returned, so a LIMIT does not reduce their cost.
+    """
+    tokens = top_level_tokens(sql)
+    for index, (depth, ttype, value) in enumerate(tokens):
+        if depth != 0:
+            continue
+        upper = " ".join(value.upper().split())
+        if ttype in T.Keyword and upper in _BLOCKING_KEYWORDS:
+            return False
+        if (
+            upper in _AGGREGATES
+            and index + 1 < len(tokens)
+            and tokens[index + 1][2] == "("
+        ):
+            return False
+    return True
+
+
+def apply_limit(sql: str, limit: int) -> str:
+    """
+    Cap the top-level row count at ``limit``.
+
+    An existing top-level LIMIT (``n``, ``offset, n`` or ``n OFFSET m``) is
+    lowered if larger, and PostgreSQL's ``LIMIT ALL`` counts as no limit.
+    A top-level ``FETCH FIRST|NEXT n ROWS ONLY`` is an existing limit too and
+    ``n`` is lowered the same way. Without either, a LIMIT is appended. LIMITs inside
+    subqueries and CTE bodies are left alone; an appended LIMIT applies to
+    the main query, or to the whole UNION.
+    """
+    tokens = top_level_tokens(sql)
+    values = [value for _, _, value in tokens]
+
+    limit_index = fetch_index = None
+    for index, (depth, ttype, value) in enumerate(tokens):
+        if depth == 0 and ttype in T.Keyword and value.upper() == "LIMIT":
+            limit_index = index
+        elif depth == 0 and ttype in T.Keyword and value.upper() == "FETCH":
+            fetch_index = index
+
+    if fetch_index is not None and limit_index is None:
+        # "FETCH FIRST|NEXT n ROW[S] ONLY"; without n it fetches a single row
+        first_index = _next_significant(tokens, fetch_index)
+        count_index = _next_significant(tokens, first_index)
+        if (
+            first_index is not None
+            and values[first_index].upper() in ("FIRST", "NEXT")
+            and count_index is not None
+            and tokens[count_index][1] in T.Literal.Number.Integer
+            and int(values[count_index]) > limit
+        ):
+            values[count_index] = str(limit)
+        return "".join(values)
+
+    if limit_index is None:
+        # Append after the last statement token, dropping a trailing ";" and comments
+        end = len(tokens)
+        while end and (
+            tokens[end - 1][1] in T.Whitespace
+            or tokens[end - 1][1] in T.Text.Whitespace
+            or tokens[end - 1][1] in T.Comment
+            or tokens[end - 1][2] == ";"
+        ):
+            end -= 1
+        return "".join(values[:end]) + f"\nLIMIT {limit}"
+
+    # Count is the last integer of "LIMIT n" / "LIMIT offset, n"
+    count_index = None
+    for index in range(limit_index + 1, len(tokens)):
+        _, ttype, value = tokens[index]
+        if count_index is None and value.upper() == "ALL":
+            values[index] = str(limit)
+            break
+        if ttype in T.Literal.Number.Integer:
+            count_index = index
+        elif ttype in T.Whitespace or ttype in T.Text.Whitespace or value == ",":
+            continue
+        else:
+            break
+
+    if count_index is not None and int(values[count_index]) > limit:
+        values[count_index] = str(limit)
+    return "".join(values)
+
+
+def _next_significant(
+    tokens: List[Tuple[int, Any, str]], index: Optional[int]
+) -> Optional[int]:
+    """Index of the first non-whitespace, non-comment token after ``index``."""
+    if index is None:
+        return None
+    for next_index in range(index + 1, len(tokens)):
+        ttype = tokens[next_index][1]
+        if not (ttype in T.Whitespace or ttype in T.Text.Whitespace or ttype in T.Comment):
+            return next_index
+    return None
@@ -0,0 +1,72 @@
+"""Model tier policy for SQL generation: FAST first, SMART on failure."""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ai_agentic_chatbot.infrastructure.llm.types import ModelType
+
+TIER_FAST = ModelType.FAST.value
+TIER_SMART = ModelType.SMART.value
+
+
+@dataclass(frozen=True)
+class TierCall:
+    """Latency, tokens and cost of one generation call."""
+
+    tier: str
+    latency_ms: float
+    prompt_tokens: int
+    cached_tokens: int
+    completion_tokens: int
+    cost: float
+    confidence: Optional[float] = None
+    reason: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def select_tier(
+    retrieved_tables: List[Tuple[str, str, float]],
+    previous_tier: Optional[str],
+    generation_attempts: int,
+    enabled: bool = True,
+    min_retrieval_score: float = 1.6,
+    max_fast_tables: int = 1,
+) -> Tuple[ModelType, str]:
+    """
+    Pick the model tier for the next generation call, with the reason.
+
+    FAST is only used for the first attempt of a question whose retrieval is
+    confident and narrow: at most ``max_fast_tables`` tables score at or above
+    ``min_retrieval_score`` (FK-expanded neighbours score below it). Any
+    further attempt, after a failed validation or execution, goes to SMART.
+
+    Scores are retrieval scores, not cosine similarities: the best cosine of
+    a table's sub-documents times the sub-document weight (up to 2.0 for an
+    example question) and the router/relationship boosts. The default 1.6
+    is a 0.8 cosine match on an example question.
+    """
+    if not enabled:
+        return ModelType.SMART, "tiering disabled"
+    if previous_tier == TIER_FAST:
+        return ModelType.SMART, "escalation after fast tier failure"
+    if generation_attempts > 0:
+        return ModelType.SMART, "retry"
+
+    confident = [score for _, _, score in retrieved_tables if score >= min_retrieval_score]
+    if not confident:
+        top_score = max((score for _, _, score in retrieved_tables), default=0.0)
+        return ModelType.SMART, f"low retrieval score {top_score:.2f}"
+    if len(confident) > max_fast_tables:
+        return ModelType.SMART, f"{len(confident)} confidently matched tables"
+    return ModelType.FAST, f"{len(confident)} table(s), retrieval score {max(confident):.2f}"
+
+
+def call_cost(
+    prompt_tokens: int,
+    completion_tokens: int,
+    input_per_1k: float,
+    output_per_1k: float,
+) -> float:
+    return prompt_tokens / 1000 * input_per_1k + completion_tokens / 1000 * output_per_1k
@@ -0,0 +1,97 @@
+"""Answer cache nodes: reuse validated SQL for repeated questions."""
+
+from typing import List, Optional
+
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.answer_cache import (
+    CachedAnswer,
+    get_answer_cache,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.retrieve_schemas import (
+    embed_user_query,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+logger = get_logger(__name__)
+
+
+def _question_vector(user_query: str) -> Optional[List[float]]:
+    # Same cached embedding schema retrieval uses, so a miss costs no extra call
+    try:
+        return embed_user_query(user_query)
+    except Exception as e:
+        logger.warning(f"[Answer Cache] Embedding unavailable, exact lookup only: {e}")
+        return None
+
+
+def lookup_answer_cache_node(state: dict) -> dict:
+    """
+    Reuse validated SQL for the same (or a near-identical) question.
+
+    A hit fills the generation fields and skips retrieval and generation;
+    the cached SQL is still validated and executed.
+    """
+    if not get_agent_settings().answer_cache.enabled:
+        return {"cache_hit": False}
+
+    user_query = state["user_query"]
+    scope = get_schema_catalog().content_hash
+
+    hit = get_answer_cache().lookup(
+        user_query, scope, lambda: _question_vector(user_query)
+    )
+    if hit is None:
+        return {"cache_hit": False}
+
+    logger.info(
+        f"[Answer Cache] {'Exact' if hit.exact else 'Semantic'} hit "
+        f"(similarity: {hit.similarity:.3f}) for: {hit.answer.question}"
+    )
+    return {
+        "cache_hit": True,
+        "cache_key": hit.key,
+        "generated_sql": hit.answer.generated_sql,
+        "explanation": hit.answer.explanation,
+        "tables_used": list(hit.answer.tables_used),
+        "confidence": hit.answer.confidence,
+    }
+
+
+def store_answer_cache_node(state: dict) -> dict:
+    """Cache SQL that was generated, validated and executed successfully."""
+    if not get_agent_settings().answer_cache.enabled or state.get("cache_hit"):
+        return {}
+
+    user_query = state["user_query"]
+    try:
+        get_answer_cache().store(
+            user_query,
+            get_schema_catalog().content_hash,
+            CachedAnswer(
+                question=user_query,
+                generated_sql=state["generated_sql"],
+                explanation=state.get("explanation") or "",
+                tables_used=tuple(state.get("tables_used") or []),
+                confidence=state.get("confidence", 0.0),
+            ),
+            _question_vector(user_query),
+        )
+    except Exception as e:
+        logger.warning(f"[Answer Cache] Store failed: {e}")
+    return {}
+
+
+def evict_answer_cache_node(state: dict) -> dict:
+    """Drop a cached answer whose SQL failed, then fall back to generation."""
+    logger.warning(
+        f"[Answer Cache] Cached SQL failed, regenerating: {state.get('execution_error')}"
+    )
+    if state.get("cache_key"):
+        get_answer_cache().invalidate(state["cache_key"])
+    return {
+        "cache_hit": False,
+        "cache_key": None,
+        "generated_sql": None,
+        "execution_error": None,
+    }
@@ -0,0 +1,106 @@
+"""Cost guard node: estimate a validated query with EXPLAIN before running it."""
+
+import json
+from typing import Optional
+
+from sqlalchemy import text
+
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.cost_guard import (
+    ACTION_LIMIT,
+    ACTION_WARN,
+    CostBudget,
+    QueryPlan,
+    evaluate_plan,
+    parse_mysql_plan,
+    parse_postgres_plan,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.limits import apply_limit, is_limitable
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.execute_query import (
+    QUERY_DATASOURCE,
+)
+from ai_agentic_chatbot.infrastructure.datasource.factory import get_engine
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def check_cost_node(state: dict) -> dict:
+    """
+    Compare the query's EXPLAIN estimate with the configured budget.
+
+    Over budget, the query is rejected (and regenerated with the reason),
+    rewritten with a tighter LIMIT when a LIMIT can stop it early, or only
+    logged, depending on ``cost_guard.action``. If EXPLAIN itself fails
+    the query runs unchanged, so execution reports the real error.
+    """
+    settings = get_agent_settings().cost_guard
+    if not settings.enabled:
+        return {"cost_verdict": "skipped"}
+
+    sql_query = state["generated_sql"]
+    try:
+        plan = explain_plan(sql_query)
+    except Exception as e:
+        logger.warning(f"[Cost Guard] EXPLAIN failed, running unchecked: {e}")
+        return {"cost_verdict": "skipped"}
+    if plan is None:
+        return {"cost_verdict": "skipped"}
+
+    verdict = evaluate_plan(
+        plan,
+        CostBudget(
+            max_examined_rows=settings.max_examined_rows,
+            max_full_scan_rows=settings.max_full_scan_rows,
+        ),
+    )
+    update = {"query_plan": plan.summary()}
+    if verdict.within_budget:
+        logger.info(f"[Cost Guard] Within budget (~{plan.examined_rows:,.0f} rows examined)")
+        return {**update, "cost_verdict": "ok"}
+
+    reasons = "; ".join(verdict.violations)
+    if settings.action == ACTION_WARN:
+        logger.warning(f"[Cost Guard] Over budget, running anyway: {reasons}")
+        return {**update, "cost_verdict": "warn"}
+
+    if settings.action == ACTION_LIMIT and is_limitable(sql_query):
+        limited = apply_limit(sql_query, settings.limit_rows)
+        logger.warning(f"[Cost Guard] Over budget ({reasons}), capped to LIMIT {settings.limit_rows}")
+        # Re-estimate, so the recorded plan describes the query that runs
+        try:
+            limited_plan = explain_plan(limited)
+        except Exception as e:
+            logger.warning(f"[Cost Guard] EXPLAIN of the capped query failed: {e}")
+            limited_plan = None
+        if limited_plan is not None:
+            logger.info(
+                f"[Cost Guard] Capped query: ~{limited_plan.examined_rows:,.0f} rows examined"
+            )
+            update = {"query_plan": limited_plan.summary()}
+        else:
+            update = {"query_plan": {**plan.summary(), "estimated_before_limit": True}}
+        return {**update, "cost_verdict": "limited", "generated_sql": limited}
+
+    logger.warning(f"[Cost Guard] Rejected: {reasons}")
+    return {
+        **update,
+        "cost_verdict": "rejected",
+        "execution_error": f"Query too expensive: {reasons}",
+        "error_category": "cost",
+    }
+
+
+def explain_plan(sql_query: str, datasource: str = QUERY_DATASOURCE) -> Optional[QueryPlan]:
+    """EXPLAIN estimate of a query; None for databases without a plan parser."""
+    engine = get_engine(datasource)
+    statement = sql_query.strip().rstrip(";")
+
+    with engine.connect() as conn:
+        if engine.dialect.name == "mysql":
+            raw = conn.execute(text(f"EXPLAIN FORMAT=JSON {statement}")).scalar()
+            return parse_mysql_plan(json.loads(raw))
+        if engine.dialect.name == "postgresql":
+            rows = conn.execute(text(f"EXPLAIN {statement}")).fetchall()
+            return parse_postgres_plan([row[0] for row in rows])
+    return None
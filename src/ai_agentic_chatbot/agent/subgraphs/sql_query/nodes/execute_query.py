@@ -1,15 +1,26 @@
 """Query execution node for database operations."""
 
 from sqlalchemy import create_engine, text
-from ai_agentic_chatbot.infrastructure.datasource.factory import get_engine
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.retry_policy import (
+    acall_with_retry,
+    call_with_retry,
+)
+from ai_agentic_chatbot.infrastructure.datasource.factory import (
+    get_async_engine,
+    get_engine,
+)
 from ai_agentic_chatbot.logging_config import get_logger
 import time
+from typing import List, Optional, Tuple
 
 logger = get_logger(__name__)
 
 # Configuration constants
 QUERY_TIMEOUT = 30  # seconds
 MAX_QUERY_RESULTS = 1000
+# Datasource generated SQL runs against; the cost guard EXPLAINs on it too
+QUERY_DATASOURCE = "mysql.primary"
 
 
 def execute_query_node(state: dict) -> dict:
@@ -19,68 +30,239 @@ def execute_query_node(state: dict) -> dict:
     """
     logger.info("[Execute Query] Running SQL")
 
+    skipped = _check_executable(state)
+    if skipped is not None:
+        return skipped
+
+    sql_query = state["generated_sql"]
+    retry_settings = get_agent_settings().execution_retry
+
+    try:
+        start_time = time.time()
+
+        # Only a query that never reached the database is re-run, on a
+        # fresh pooled connection
+        data, has_more = call_with_retry(
+            lambda: _run_query(sql_query),
+            is_transient=_is_retryable,
+            max_attempts=retry_settings.max_attempts,
+            base_delay=retry_settings.base_delay,
+            max_delay=retry_settings.max_delay,
+        )
+
+        return _execution_result(data, has_more, time.time() - start_time)
+
+    except Exception as e:
+        return _execution_failure(e)
+
+
+async def aexecute_query_node(state: dict) -> dict:
+    """
+    Node 4, async: Execute validated SQL query on the async engine.
+    The event loop keeps serving other streams while the query runs.
+    """
+    logger.info("[Execute Query] Running SQL (async)")
+
+    skipped = _check_executable(state)
+    if skipped is not None:
+        return skipped
+
+    sql_query = state["generated_sql"]
+    retry_settings = get_agent_settings().execution_retry
+
+    try:
+        start_time = time.time()
+
+        data, has_more = await acall_with_retry(
+            lambda: _arun_query(sql_query),
+            is_transient=_is_retryable,
+            max_attempts=retry_settings.max_attempts,
+            base_delay=retry_settings.base_delay,
+            max_delay=retry_settings.max_delay,
+        )
+
+        return _execution_result(data, has_more, time.time() - start_time)
+
+    except Exception as e:
+        return _execution_failure(e)
+
+
+def _check_executable(state: dict) -> Optional[dict]:
+    """State update skipping execution, or None if the query can run."""
     # Check if query is safe
     if not state.get("is_safe", False):
         logger.warning("Skipping execution - query not validated")
         return {"execution_error": "Query failed safety validation"}
 
-    sql_query = state.get("generated_sql")
-
-    if not sql_query:
+    if not state.get("generated_sql"):
         return {"execution_error": "No SQL query to execute"}
 
-    try:
-        engine = get_engine("mysql.primary")
+    return None
 
-        start_time = time.time()
 
-        with engine.connect() as conn:
+def _execution_result(data: List[dict], has_more: bool, execution_time: float) -> dict:
+    logger.info(
+        f"✅ Query executed successfully: {len(data)} rows in {execution_time:.2f}s"
+    )
+
+    return {
+        "query_result": data,
+        "execution_error": None,
+        "execution_time": execution_time,
+        "row_count": len(data),
+        "has_more_results": has_more,
+    }
+
+
+def _execution_failure(e: Exception) -> dict:
+    error_msg = str(e)
+    logger.error(f"❌ Query execution failed: {error_msg}")
+    if isinstance(e, ConnectionUnavailable):
+        error_category = "connection"
+    else:
+        error_category = _categorize_error(error_msg)
+    return {
+        "query_result": None,
+        "execution_error": error_msg,
+        "error_category": error_category,
+    }
+
+
+class ConnectionUnavailable(Exception):
+    """No usable connection: the query was never sent, so it is safe to re-run."""
+
+
+# MySQL 2006: the pooled connection died while idle, before the query was
+# sent. "Lost connection ... during query" (2013) is not here: the query may
+# have run, and re-running a runaway query is what the retry must not do.
+_STALE_CONNECTION_INDICATORS = ("server has gone away", "(2006,")
+
+
+def _is_stale_connection(error: Exception) -> bool:
+    error_lower = str(error).lower()
+    return any(indicator in error_lower for indicator in _STALE_CONNECTION_INDICATORS)
+
+
+def _is_retryable(error: Exception) -> bool:
+    return isinstance(error, ConnectionUnavailable)
+
+
+def _run_query(sql_query: str, datasource: str = QUERY_DATASOURCE) -> Tuple[List[dict], bool]:
+    """
+    Execute once and return (serialized rows, whether rows were truncated).
+
+    Failures to check out a connection, or a stale pooled connection, raise
+    ConnectionUnavailable; errors of the query itself (timeouts included)
+    are raised as is.
+    """
+    engine = get_engine(datasource)
+
+    try:
+        conn = engine.connect()
+    except Exception as e:
+        raise ConnectionUnavailable(str(e)) from e
+
+    with conn:
+        try:
             result = conn.execute(text(sql_query).execution_options(autocommit=True))
+            rows, has_more = _fetch_capped(result)
+        except Exception as e:
+            if _is_stale_connection(e):
+                # Drop the DBAPI connection so a retry checks out a new one
+                conn.invalidate()
+                raise ConnectionUnavailable(str(e)) from e
+            raise
+
+        data = _serialize_rows(result.keys(), rows)
+
+    return data, has_more
 
-            rows = result.fetchmany(MAX_QUERY_RESULTS)
-
-            has_more = len(rows) == MAX_QUERY_RESULTS
-            if has_more:
-                extra_row = result.fetchone()
-                if extra_row:
-                    logger.warning(
-                        f"Query returned more than {MAX_QUERY_RESULTS} rows - truncated"
-                    )
-
-            execution_time = time.time() - start_time
-
-            if rows and result.keys():
-                data = [
-                    {
-                        key: _serialize_value(value)
-                        for key, value in zip(result.keys(), row)
-                    }
-                    for row in rows
-                ]
-            else:
-                data = []
-
-            logger.info(
-                f"✅ Query executed successfully: {len(data)} rows in {execution_time:.2f}s"
+
+async def _arun_query(
+    sql_query: str, datasource: str = QUERY_DATASOURCE
+) -> Tuple[List[dict], bool]:
+    """
+    Async ``_run_query``.
+
+    The result is streamed (server-side cursor) and only the capped rows are
+    fetched, so a query without an effective LIMIT is not loaded into memory.
+    """
+    engine = get_async_engine(datasource)
+
+    conn = engine.connect()
+    try:
+        await conn.start()
+    except Exception as e:
+        raise ConnectionUnavailable(str(e)) from e
+
+    try:
+        try:
+            result = await conn.stream(text(sql_query))
+            try:
+                rows, has_more = await _afetch_capped(result)
+            finally:
+                await result.close()
+        except Exception as e:
+            if _is_stale_connection(e):
+                await conn.invalidate()
+                raise ConnectionUnavailable(str(e)) from e
+            raise
+
+        data = _serialize_rows(result.keys(), rows)
+    finally:
+        await conn.close()
+
+    return data, has_more
+
+
+def _fetch_capped(result) -> Tuple[list, bool]:
+    rows = result.fetchmany(MAX_QUERY_RESULTS)
+
+    has_more = len(rows) == MAX_QUERY_RESULTS
+    if has_more:
+        extra_row = result.fetchone()
+        if extra_row:
+            logger.warning(
+                f"Query returned more than {MAX_QUERY_RESULTS} rows - truncated"
             )
+    return rows, has_more
+
+
+async def _afetch_capped(result) -> Tuple[list, bool]:
+    rows = await result.fetchmany(MAX_QUERY_RESULTS)
+
+    has_more = len(rows) == MAX_QUERY_RESULTS
+    if has_more:
+        extra_row = await result.fetchone()
+        if extra_row:
+            logger.warning(
+                f"Query returned more than {MAX_QUERY_RESULTS} rows - truncated"
+            )
+    return rows, has_more
+
+
+def _serialize_rows(keys, rows) -> List[dict]:
+    if not rows or not keys:
+        return []
+    return [
+        {key: _serialize_value(value) for key, value in zip(keys, row)}
+        for row in rows
+    ]
 
-            return {
-                "query_result": data,
-                "execution_error": None,
-                "execution_time": execution_time,
-                "row_count": len(data),
-                "has_more_results": has_more,
-            }
 
+def explain_query(sql_query: str, datasource: str = QUERY_DATASOURCE) -> Optional[str]:
+    """
+    Dry-run a query with EXPLAIN (planned, not executed).
+
+    Returns the database error, or None if the query plans successfully.
+    """
+    try:
+        engine = get_engine(datasource)
+        with engine.connect() as conn:
+            conn.execute(text(f"EXPLAIN {sql_query.strip().rstrip(';')}")).fetchall()
+        return None
     except Exception as e:
-        error_msg = str(e)
-        logger.error(f"❌ Query execution failed: {error_msg}")
-        error_category = _categorize_error(error_msg)
-        return {
-            "query_result": None,
-            "execution_error": error_msg,
-            "error_category": error_category,
-        }
+        return str(e)
 
 
 def _serialize_value(value):
@@ -0,0 +1,37 @@
+"""Records successful generations as few-shot examples."""
+
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.few_shot_store import (
+    get_few_shot_store,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.retrieve_schemas import (
+    embed_user_query,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+logger = get_logger(__name__)
+
+
+def record_few_shot_node(state: dict) -> dict:
+    """
+    Store the (question, SQL) pair after a successful execution.
+
+    Answers served from the answer cache were recorded when first generated.
+    """
+    if not get_agent_settings().few_shot.enabled or state.get("cache_hit"):
+        return {}
+
+    user_query = state["user_query"]
+    try:
+        get_few_shot_store().add(
+            user_query,
+            state["generated_sql"],
+            get_schema_catalog().content_hash,
+            embed_user_query(user_query),
+            tables_used=state.get("tables_used") or [],
+        )
+        logger.info("[Few-shot] Recorded verified example")
+    except Exception as e:
+        logger.warning(f"[Few-shot] Could not record example: {e}")
+    return {}
@@ -1,10 +1,54 @@
 """SQL generation node with structured LLM output."""
 
+import threading
+import time
+from dataclasses import dataclass, replace
+
 from ai_agentic_chatbot.infrastructure.llm.factory import get_llm
 from ai_agentic_chatbot.infrastructure.llm.types import LLMProvider, ModelType
-from langchain_core.messages import SystemMessage
+from ai_agentic_chatbot.infrastructure.llm.usage import (
+    TokenUsageCollector,
+    usage_config,
+)
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from ai_agentic_chatbot.agent.settings import (
+    CandidateSpec,
+    HedgingSettings,
+    get_agent_settings,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.hedging import first_accepted
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.execute_query import (
+    explain_query,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.validate_query import (
+    check_query_safety,
+    check_query_schema,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import get_retry_strategy
+from ai_agentic_chatbot.agent.subgraphs.sql_query.column_pruning import (
+    get_column_pruner,
+    get_field_meaning_index,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.model_tiers import (
+    TierCall,
+    call_cost,
+    select_tier,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.few_shot_store import (
+    FewShotExample,
+    format_examples,
+    get_few_shot_store,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes.retrieve_schemas import (
+    embed_user_query,
+)
+from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
+    get_azure_openai_embedding,
+)
+from ai_agentic_chatbot.schema_extractor.embedding_index import load_or_build_index
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
 from ai_agentic_chatbot.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -31,31 +75,70 @@ def generate_sql_node(state: dict) -> dict:
     if not retrieved_tables:
         return {"validation_errors": ["Cannot generate SQL without table schemas"]}
 
-    schema_text = "\n\n".join(
-        [
-            f"-- Table: {name} (Relevance: {score:.2f})\n{ddl}"
-            for name, ddl, score in retrieved_tables
-        ]
-    )
-
     user_query = state["user_query"]
 
-    previous_error = state.get("execution_error")
+    # Execution error of the last attempt, or why the fast tier's SQL was rejected
+    previous_error = state.get("execution_error") or state.get("escalation_reason")
     generation_attempts = state.get("generation_attempts", 0)
 
-    try:
-        llm = get_llm(LLMProvider.AZURE_OPENAI, ModelType.SMART)
-        structured_llm = llm.with_structured_output(SQLGeneration, strict=True)
+    # Execution retries get a category-specific focus and temperature
+    retry_strategy = None
+    if state.get("execution_error") and generation_attempts > 0:
+        retry_strategy = get_retry_strategy(
+            state.get("error_category") or "unknown", generation_attempts
+        )
+    temperature = retry_strategy["temperature"] if retry_strategy else None
+
+    # Retries get the full DDL: the failed query may have needed a pruned column
+    if generation_attempts == 0:
+        retrieved_tables = _prune_columns(retrieved_tables, user_query)
+
+    # Retrieval order already conveys relevance; per-query scores are left out
+    # so retries (and repeated table sets) share the cached prompt prefix
+    schema_text = "\n\n".join(
+        [f"-- Table: {name}\n{ddl}" for name, ddl, _ in retrieved_tables]
+    )
 
-        prompt_content = _create_generation_prompt(
+    tier_settings = get_agent_settings().model_tiers
+    tier, reason = select_tier(
+        state.get("retrieved_tables") or [],
+        state.get("model_tier"),
+        generation_attempts,
+        enabled=tier_settings.enabled,
+        min_retrieval_score=tier_settings.min_retrieval_score,
+        max_fast_tables=tier_settings.max_fast_tables,
+    )
+    tier_calls: List[TierCall] = []
+
+    try:
+        messages = _create_generation_messages(
             schema_text=schema_text,
             user_query=user_query,
+            examples=_few_shot_examples(user_query),
             previous_error=previous_error,
             generation_attempts=generation_attempts,
+            retry_focus=retry_strategy["focus"] if retry_strategy else None,
         )
 
-        prompt = SystemMessage(content=prompt_content)
-        result: SQLGeneration = structured_llm.invoke([prompt])
+        hedging = get_agent_settings().hedging
+        if hedging.enabled:
+            return _generate_hedged(messages, generation_attempts, hedging)
+
+        try:
+            result = _generate(messages, tier, reason, tier_calls, temperature)
+        except Exception as e:
+            if tier != ModelType.FAST:
+                raise
+            logger.warning(f"Fast tier generation failed, escalating: {e}")
+            result, reason = None, "fast tier error"
+
+        if tier == ModelType.FAST and (
+            result is None or result.confidence < tier_settings.min_confidence
+        ):
+            if result is not None:
+                reason = f"fast tier confidence {result.confidence:.2f}"
+            tier = ModelType.SMART
+            result = _generate(messages, tier, reason, tier_calls, temperature)
 
         logger.info(f"Generated SQL: {result.query}")
         logger.info(f"Confidence: {result.confidence}")
@@ -66,6 +149,9 @@ def generate_sql_node(state: dict) -> dict:
             "confidence": result.confidence,
             "tables_used": result.tables_used,
             "generation_attempts": generation_attempts + 1,
+            "model_tier": tier.value,
+            "escalation_reason": None,
+            "tier_calls": [call.to_dict() for call in tier_calls],
         }
 
     except Exception as e:
@@ -73,24 +159,221 @@ def generate_sql_node(state: dict) -> dict:
         return {
             "validation_errors": [f"Generation error: {str(e)}"],
             "generation_attempts": generation_attempts + 1,
+            "tier_calls": [call.to_dict() for call in tier_calls],
         }
 
 
-def _create_generation_prompt(
-    schema_text: str,
-    user_query: str,
-    previous_error: Optional[str] = None,
-    generation_attempts: int = 0,
-) -> str:
-    """Create the SQL generation prompt."""
+def _generate(
+    messages: List[BaseMessage],
+    tier: ModelType,
+    reason: str,
+    tier_calls: List[TierCall],
+    temperature: Optional[float] = None,
+) -> SQLGeneration:
+    """Run one generation call on ``tier`` and append its latency, tokens and cost."""
+    logger.info(f"[Generate SQL] Using {tier.value} model ({reason})")
 
-    base_prompt = f"""You are an expert SQL query generator (For a chatbot with more than one capability of representing the data to the user). Generate a SQL query based on the user's request and the provided database schema.
+    llm = get_llm(LLMProvider.AZURE_OPENAI, tier)
+    if temperature is not None:
+        # Shallow copy: shares the HTTP client, only the sampling parameter differs
+        llm = llm.model_copy(update={"temperature": temperature})
+    structured_llm = llm.with_structured_output(SQLGeneration, strict=True)
 
-DATABASE SCHEMA:
-{schema_text}
+    collector = TokenUsageCollector()
+    start = time.perf_counter()
+    try:
+        result: SQLGeneration = structured_llm.invoke(
+            messages,
+            config=usage_config(f"generate_sql.{tier.value}", {"callbacks": [collector]}),
+        )
+    finally:
+        costs = get_agent_settings().model_tiers.costs.get(tier.value)
+        tier_calls.append(
+            TierCall(
+                tier=tier.value,
+                latency_ms=(time.perf_counter() - start) * 1000,
+                prompt_tokens=collector.prompt_tokens,
+                cached_tokens=collector.cached_tokens,
+                completion_tokens=collector.completion_tokens,
+                cost=call_cost(
+                    collector.prompt_tokens,
+                    collector.completion_tokens,
+                    costs.input_per_1k if costs else 0.0,
+                    costs.output_per_1k if costs else 0.0,
+                ),
+                reason=reason,
+            )
+        )
+
+    tier_calls[-1] = replace(tier_calls[-1], confidence=result.confidence)
+    return result
+
+
+@dataclass
+class _Candidate:
+    """One hedged generation: the SQL, its check results and its calls."""
 
-USER REQUEST:
-{user_query}
+    index: int
+    tier: ModelType
+    result: SQLGeneration
+    errors: List[str]
+    calls: List[TierCall]
+
+
+def _generate_hedged(
+    messages: List[BaseMessage], generation_attempts: int, settings: HedgingSettings
+) -> dict:
+    """
+    Generate one candidate per configured (model, temperature) concurrently.
+
+    Each candidate is safety- and schema-checked (and optionally planned with EXPLAIN)
+    in its own worker; the first one that passes is returned. Without a
+    passing candidate the most confident one is returned so validation
+    reports its errors.
+
+    Candidates still running once a winner is taken are abandoned: they skip
+    their EXPLAIN, and the usage of their in-flight LLM call is logged when
+    it completes, since it is no longer part of the returned ``tier_calls``.
+    """
+    abandon = threading.Event()
+
+    def make_task(index: int, spec: CandidateSpec):
+        def run() -> Optional[_Candidate]:
+            if abandon.is_set():
+                return None
+            calls: List[TierCall] = []
+            tier = ModelType(spec.model)
+            try:
+                result = _generate(
+                    messages,
+                    tier,
+                    f"hedged candidate {index + 1}, temperature {spec.temperature}",
+                    calls,
+                    temperature=spec.temperature,
+                )
+            finally:
+                if abandon.is_set():
+                    _log_abandoned_calls(index, calls)
+            if abandon.is_set():
+                return None
+
+            errors = check_query_safety(result.query) or check_query_schema(result.query)
+            if not errors and settings.explain_dry_run:
+                explain_error = explain_query(result.query)
+                if explain_error:
+                    errors = [f"EXPLAIN failed: {explain_error}"]
+            return _Candidate(index, tier, result, errors, calls)
+
+        return run
+
+    hedge = first_accepted(
+        [make_task(i, spec) for i, spec in enumerate(settings.candidates)],
+        accept=lambda candidate: not candidate.errors,
+        timeout=settings.timeout,
+        cancel=abandon,
+    )
+    tier_calls = [call.to_dict() for c in hedge.completed for call in c.calls]
+
+    chosen = hedge.winner or max(
+        hedge.completed, key=lambda c: c.result.confidence, default=None
+    )
+    if chosen is None:
+        return {
+            "validation_errors": ["Generation error: no SQL candidate completed"],
+            "generation_attempts": generation_attempts + 1,
+            "tier_calls": tier_calls,
+        }
+
+    logger.info(
+        f"[Generate SQL] Hedged: candidate {chosen.index + 1} "
+        f"({'passed' if hedge.winner else 'best of failed'}) after "
+        f"{len(hedge.completed)}/{len(settings.candidates)} completed, "
+        f"{hedge.abandoned} abandoned"
+    )
+    return {
+        "generated_sql": chosen.result.query,
+        "explanation": chosen.result.explanation,
+        "confidence": chosen.result.confidence,
+        "tables_used": chosen.result.tables_used,
+        "generation_attempts": generation_attempts + 1,
+        # Not escalated again: all configured candidates already ran
+        "model_tier": chosen.tier.value if hedge.winner else None,
+        "escalation_reason": None,
+        "tier_calls": tier_calls,
+    }
+
+
+def _log_abandoned_calls(index: int, calls: List[TierCall]) -> None:
+    for call in calls:
+        logger.info(
+            f"[Generate SQL] Abandoned hedged candidate {index + 1} finished: {call.tier}, "
+            f"{call.prompt_tokens}+{call.completion_tokens} tokens, cost {call.cost:.5f}"
+        )
+
+
+def _prune_columns(
+    retrieved_tables: List[Tuple[str, str, float]], user_query: str
+) -> List[Tuple[str, str, float]]:
+    """Drop columns irrelevant to the question from the DDL (keys and join columns stay)."""
+    settings = get_agent_settings().column_pruning
+    if not settings.enabled:
+        return retrieved_tables
+
+    try:
+        catalog = get_schema_catalog()
+
+        field_similarities = None
+        if settings.use_embeddings and catalog.table_docs:
+            try:
+                index = load_or_build_index(
+                    catalog.table_docs,
+                    catalog.schema_version,
+                    catalog.content_hash,
+                    get_azure_openai_embedding(),
+                )
+                query_vector = embed_user_query(user_query)
+                field_similarities = get_field_meaning_index(
+                    index, catalog.table_docs
+                ).similarities(query_vector)
+            except Exception as e:
+                logger.warning(f"Field meaning similarity unavailable, name matching only: {e}")
+
+        return get_column_pruner().prune(
+            retrieved_tables, user_query, catalog.fk_graph, field_similarities
+        )
+    except Exception as e:
+        logger.warning(f"Column pruning failed, using full DDL: {e}")
+        return retrieved_tables
+
+
+def _few_shot_examples(user_query: str) -> List[FewShotExample]:
+    """Verified examples most similar to the question."""
+    settings = get_agent_settings().few_shot
+    if not settings.enabled:
+        return []
+
+    try:
+        examples = get_few_shot_store().search(
+            embed_user_query(user_query),
+            get_schema_catalog().content_hash,
+            k=settings.k,
+            min_similarity=settings.min_similarity,
+        )
+    except Exception as e:
+        logger.warning(f"Few-shot examples unavailable: {e}")
+        return []
+
+    if examples:
+        logger.info(
+            f"Using {len(examples)} few-shot examples "
+            f"(best similarity: {examples[0].similarity:.3f})"
+        )
+    return examples
+
+
+# Static instructions go first so every generation call shares the same
+# prompt prefix; schema, request and retry feedback follow.
+SQL_GENERATION_INSTRUCTIONS = """You are an expert SQL query generator (For a chatbot with more than one capability of representing the data to the user). Generate a SQL query based on the user's request and the provided database schema.
 
 REQUIREMENTS:
 1. Generate ONLY SELECT queries - no INSERT, UPDATE, DELETE, DROP, etc.
@@ -111,22 +394,51 @@ RESPONSE FORMAT:
 - warnings: Any potential issues or limitations (optional)
 
 EXAMPLE RESPONSE:
-{{
+{
     "query": "SELECT customer_name, SUM(order_total) as total_spent FROM customers c JOIN orders o ON c.id = o.customer_id WHERE o.order_date >= '2024-01-01' GROUP BY customer_name ORDER BY total_spent DESC LIMIT 100;",
     "explanation": "This query finds the total amount spent by each customer since January 1st, 2024, ordered by highest spenders first.",
     "confidence": 0.95,
     "tables_used": ["customers", "orders"],
     "warnings": ["Results limited to top 100 customers"]
-}}"""
+}
+
+The database schema and the user's request follow."""
+
+
+def _create_generation_messages(
+    schema_text: str,
+    user_query: str,
+    previous_error: Optional[str] = None,
+    generation_attempts: int = 0,
+    examples: Optional[List[FewShotExample]] = None,
+    retry_focus: Optional[str] = None,
+) -> List[BaseMessage]:
+    """Create the SQL generation messages (static prefix, then per-request content)."""
+
+    messages: List[BaseMessage] = [
+        SystemMessage(content=SQL_GENERATION_INSTRUCTIONS),
+        SystemMessage(content=f"DATABASE SCHEMA:\n{schema_text}"),
+    ]
+
+    if examples:
+        messages.append(
+            SystemMessage(
+                content="VERIFIED EXAMPLES (similar questions answered correctly "
+                "against this schema):\n" + format_examples(examples)
+            )
+        )
+
+    messages.append(HumanMessage(content=f"USER REQUEST:\n{user_query}"))
 
     # Add error feedback if retrying
     if previous_error and generation_attempts > 0:
-        base_prompt += f"""
-
-PREVIOUS ATTEMPT FAILED WITH ERROR:
+        focus = f"\nFocus: {retry_focus}" if retry_focus else ""
+        messages.append(
+            SystemMessage(
+                content=f"""PREVIOUS ATTEMPT FAILED WITH ERROR:
 {previous_error}
 
-Generate a CORRECTED query that fixes this error.
+Generate a CORRECTED query that fixes this error.{focus}
 Common fixes:
 - Check column names and spelling (use exact names from schema)
 - Verify JOIN conditions match foreign key relationships
@@ -141,5 +453,7 @@ This is attempt #{generation_attempts + 1}. Be extra careful with:
 2. Table relationship correctness
 3. SQL syntax validation
 """
+            )
+        )
 
-    return base_prompt
+    return messages
@@ -0,0 +1,47 @@
+"""Local repair node: fix unknown identifiers without an LLM call."""
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.answer_cache import get_answer_cache
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_repair import get_sql_repairer
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+logger = get_logger(__name__)
+
+
+def repair_sql_node(state: dict) -> dict:
+    """
+    Rename an unknown table or column to the closest name in the schema.
+
+    On success the repaired SQL goes back through validation and execution;
+    otherwise ``last_repair`` stays empty and the regular LLM retry runs.
+    """
+    sql_query = state.get("generated_sql") or ""
+    execution_error = state.get("execution_error") or ""
+    update = {"repair_attempts": state.get("repair_attempts", 0) + 1, "last_repair": None}
+
+    try:
+        repair = get_sql_repairer(get_schema_catalog()).repair(sql_query, execution_error)
+    except Exception as e:
+        logger.warning(f"[Repair SQL] Repair failed: {e}")
+        repair = None
+
+    if repair is None:
+        logger.info("[Repair SQL] No local repair found - falling back to regeneration")
+        return update
+
+    logger.info(f"[Repair SQL] Repaired {repair.describe()}: {repair.sql}")
+    update.update(
+        {
+            "generated_sql": repair.sql,
+            "execution_error": None,
+            "last_repair": repair.describe(),
+        }
+    )
+
+    if state.get("cache_hit"):
+        # Replace the broken cached SQL with the repaired one once it executes
+        if state.get("cache_key"):
+            get_answer_cache().invalidate(state["cache_key"])
+        update.update({"cache_hit": False, "cache_key": None})
+
+    return update
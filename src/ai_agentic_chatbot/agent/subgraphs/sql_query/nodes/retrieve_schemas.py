@@ -1,16 +1,37 @@
 """Schema retrieval node for semantic table search."""
 
 import os
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
 from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
     get_azure_openai_embedding,
 )
+from ai_agentic_chatbot.infrastructure.embedding.batcher import get_embedding_batcher
+from ai_agentic_chatbot.infrastructure.embedding.query_cache import (
+    get_query_embedding_cache,
+)
+from ai_agentic_chatbot.infrastructure.embedding.settings import (
+    get_embedding_settings,
+)
 from ai_agentic_chatbot.infrastructure.llm.config import AzureOpenAIEmbeddingConfig
+from langchain_core.embeddings import Embeddings
 from langchain_core.runnables import RunnableConfig
-from ai_agentic_chatbot.schema_extractor.schema_loader import get_schema_loader
+from ai_agentic_chatbot.schema_extractor.schema_catalog import (
+    SchemaCatalog,
+    get_schema_catalog,
+)
 from ai_agentic_chatbot.infrastructure.llm.factory import get_embedding
 from ai_agentic_chatbot.infrastructure.llm.types import LLMProvider, ModelType
 from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.embedding_index import load_or_build_index
+from ai_agentic_chatbot.agent.subgraphs.sql_query.scoring import (
+    ROUTER_HINT_BOOST,
+    get_table_scorer,
+    reduce_sub_document_matches,
+)
+from ai_agentic_chatbot.agent.settings import RetrievalSettings, get_agent_settings
+from ai_agentic_chatbot.infrastructure.vector_store.pgvector_store import (
+    get_pgvector_schema_store,
+)
 from langchain_openai import AzureOpenAIEmbeddings
 
 logger = get_logger(__name__)
@@ -19,17 +40,36 @@ logger = get_logger(__name__)
 def retrieve_schemas_node(state: dict, config: RunnableConfig) -> dict:
     """
     Semantic retrieval of relevant table schemas.
+
+    Uses ``candidate_tables`` when the router already retrieved them
+    speculatively; router hints are applied on top either way.
     """
     logger.info("[Retrieve Schemas] Starting semantic search")
 
     user_query = state["user_query"]
-    router_hints = state.get("router_table_hints", [])
+    router_hints = state.get("router_table_hints") or []
 
     try:
-        schema_loader = get_schema_loader()
-        table_docs = schema_loader.get_table_docs_for_search()
-
-        retrieved = _semantic_search(user_query, table_docs, router_hints)
+        settings = get_agent_settings().retrieval
+        catalog = get_schema_catalog()
+
+        candidates = state.get("candidate_tables")
+        if candidates is not None:
+            logger.info(f"Using {len(candidates)} speculatively retrieved candidates")
+        else:
+            candidates = retrieve_candidates(user_query)
+
+        if candidates is None:
+            # Fallback to router hints if available
+            retrieved = [
+                (name, catalog.get_ddl(name), 0.8)
+                for name in router_hints
+                if catalog.get_ddl(name) is not None
+            ][: settings.k]
+        else:
+            retrieved = _rank_candidates(
+                candidates, router_hints, settings.k, settings.score_threshold
+            )
 
         if not retrieved:
             logger.warning("No tables retrieved from semantic search")
@@ -41,7 +81,12 @@ def retrieve_schemas_node(state: dict, config: RunnableConfig) -> dict:
         for table_name, _, score in retrieved:
             logger.info(f"  Retrieved: {table_name} (score: {score:.3f})")
 
-        expanded = _expand_related_tables(table_docs, retrieved)
+        expanded = _expand_related_tables(
+            catalog,
+            retrieved,
+            max_depth=settings.join_path_depth,
+            max_related=settings.max_related_tables,
+        )
         if len(expanded) > len(retrieved):
             logger.info(f"Expanded to {len(expanded)} tables (including related)")
             retrieved = expanded
@@ -59,6 +104,58 @@ def retrieve_schemas_node(state: dict, config: RunnableConfig) -> dict:
         }
 
 
+def retrieve_candidates(user_query: str) -> Optional[List[Tuple[str, str, float]]]:
+    """
+    Score tables against the query without router hints.
+
+    The threshold is lowered by ``ROUTER_HINT_BOOST`` so every table that
+    could pass it once hints are known is kept; ``_rank_candidates`` applies
+    the hints and the real threshold. Returns None if retrieval failed.
+    Safe to run before the router has decided (speculative retrieval).
+    """
+    settings = get_agent_settings().retrieval
+    catalog = get_schema_catalog()
+    score_threshold = settings.score_threshold / ROUTER_HINT_BOOST
+
+    try:
+        if settings.mode == "pgvector":
+            return _pgvector_search(
+                user_query,
+                catalog,
+                settings,
+                k=settings.candidate_pool,
+                score_threshold=score_threshold,
+            )
+        return _semantic_search(
+            user_query,
+            catalog.table_docs,
+            catalog.schema_version,
+            catalog.content_hash,
+            k=len(catalog.table_docs),
+            score_threshold=score_threshold,
+        )
+    except Exception as e:
+        logger.error(f"Enhanced semantic search failed: {e}")
+        return None
+
+
+def _rank_candidates(
+    candidates: List[Tuple[str, str, float]],
+    router_hints: List[str],
+    k: int,
+    score_threshold: float,
+) -> List[Tuple[str, str, float]]:
+    """Apply the router hint boost, then threshold and top-k."""
+    hints = set(router_hints)
+    ranked = [
+        (name, ddl, score * ROUTER_HINT_BOOST if name in hints else score)
+        for name, ddl, score in candidates
+    ]
+    ranked = [candidate for candidate in ranked if candidate[2] >= score_threshold]
+    ranked.sort(key=lambda x: x[2], reverse=True)
+    return ranked[:k]
+
+
 # def _semantic_search(
 #     query: str,
 #     table_docs: List[Dict[str, Any]],
@@ -83,7 +180,8 @@ def retrieve_schemas_node(state: dict, config: RunnableConfig) -> dict:
 def _semantic_search(
     query: str,
     table_docs: List[Dict[str, Any]],
-    router_hints: List[str],
+    schema_version: str,
+    content_hash: str,
     k: int = 5,
     score_threshold: float = 0.3,
 ) -> List[Tuple[str, str, float]]:
@@ -91,143 +189,118 @@ def _semantic_search(
     Enhanced semantic search using your preprocessed schema with business context.
     Leverages example questions, business purpose, and field meanings for better matching.
     """
-    try:
-        # TODO: Get embedding model from factory
-        embedding_model = get_azure_openai_embedding()
-
-        query_embedding = embedding_model.embed_query(query)
-
-        # Calculate similarity scores with enhanced context matching
-        similarities = []
-        for table_doc in table_docs:
-            # Multi-level semantic matching
-            scores = []
-
-            # 1. Match against example questions (highest weight)
-            example_questions = table_doc.get("example_questions", [])
-            if example_questions:
-                for question in example_questions:
-                    question_embedding = embedding_model.embed_query(question)
-                    question_score = _cosine_similarity(
-                        query_embedding, question_embedding
-                    )
-                    scores.append(
-                        question_score * 2.0
-                    )  # 2x weight for example questions
-
-            # 2. Match against business purpose (high weight)
-            business_purpose = table_doc.get("business_purpose", "")
-            if business_purpose:
-                purpose_embedding = embedding_model.embed_query(business_purpose)
-                purpose_score = _cosine_similarity(query_embedding, purpose_embedding)
-                scores.append(purpose_score * 1.5)  # 1.5x weight for business purpose
-
-            # 3. Match against full search text (base weight)
-            search_text = table_doc.get("search_text", "")
-            if search_text:
-                text_embedding = embedding_model.embed_query(search_text)
-                text_score = _cosine_similarity(query_embedding, text_embedding)
-                scores.append(text_score)
-
-            # 4. Match against key field meanings (medium weight)
-            key_fields = table_doc.get("key_fields", [])
-            for field in key_fields:
-                field_meaning = field.get("meaning", "")
-                if field_meaning:
-                    field_embedding = embedding_model.embed_query(field_meaning)
-                    field_score = _cosine_similarity(query_embedding, field_embedding)
-                    scores.append(field_score * 1.2)  # 1.2x weight for field meanings
-
-            # Take the maximum score from all matches
-            final_score = max(scores) if scores else 0.0
-
-            # Router hint boost
-            if router_hints and table_doc["name"] in router_hints:
-                final_score *= 1.3  # 30% boost for router suggestions
-                logger.info(
-                    f"Router hint boost for {table_doc['name']}: {final_score:.3f}"
-                )
-
-            # Relationship boost - if query mentions related tables
-            relationships = table_doc.get("relationships", [])
-            if relationships:
-                query_lower = query.lower()
-                for rel in relationships:
-                    related_table = rel.get("related_table", "").lower()
-                    if related_table in query_lower:
-                        final_score *= 1.2  # 20% boost for relationship context
-                        logger.info(
-                            f"Relationship boost for {table_doc['name']} -> {related_table}"
-                        )
-
-            similarities.append((table_doc["name"], table_doc["ddl"], final_score))
-
-        # Sort by score and filter
-        similarities.sort(key=lambda x: x[2], reverse=True)
-        filtered = [
-            (name, ddl, score)
-            for name, ddl, score in similarities
-            if score >= score_threshold
-        ]
-
-        # Log top matches for debugging
-        logger.info("Top semantic matches:")
-        for name, _, score in filtered[:3]:
-            logger.info(f"  {name}: {score:.3f}")
-
-        # Return top k results
-        return filtered[:k]
+    embedding_model = get_azure_openai_embedding()
 
-    except Exception as e:
-        logger.error(f"Enhanced semantic search failed: {e}")
-        # Fallback to router hints if available
-        if router_hints:
-            fallback_results = []
-            for table_doc in table_docs:
-                if table_doc["name"] in router_hints:
-                    fallback_results.append((table_doc["name"], table_doc["ddl"], 0.8))
-            return fallback_results[:k]
+    # Table-doc embeddings are precomputed; only the user query is embedded here
+    index = load_or_build_index(table_docs, schema_version, content_hash, embedding_model)
+    scorer = get_table_scorer(index, table_docs)
+    query_embedding = embed_user_query(query)
+
+    # Multi-level semantic matching (example questions, business purpose,
+    # search text, key field meanings), then relationship boosts
+    scores = scorer.score(query_embedding)
+    scores = scorer.apply_boosts(scores, query, None)
+
+    ddl_by_name = {table_doc["name"]: table_doc["ddl"] for table_doc in table_docs}
+    filtered = [
+        (name, ddl_by_name[name], score)
+        for name, score in scorer.top_k(scores, k, score_threshold)
+    ]
+
+    # Log top matches for debugging
+    logger.info("Top semantic matches:")
+    for name, _, score in filtered[:3]:
+        logger.info(f"  {name}: {score:.3f}")
+
+    return filtered
+
+
+def embed_user_query(query: str) -> List[float]:
+    """Query embedding through the shared cache (and micro-batcher)."""
+    return get_query_embedding_cache().embed_query(_get_query_embedding(), query)
 
 
-def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    import math
+def _get_query_embedding() -> Embeddings:
+    """Query embeddings go through the micro-batcher unless it is disabled."""
+    if get_embedding_settings().batching.enabled:
+        return get_embedding_batcher()
+    return get_azure_openai_embedding()
 
-    # Calculate dot product
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
 
-    # Calculate magnitudes
-    magnitude1 = math.sqrt(sum(a * a for a in vec1))
-    magnitude2 = math.sqrt(sum(a * a for a in vec2))
+def _pgvector_search(
+    query: str,
+    catalog: SchemaCatalog,
+    settings: RetrievalSettings,
+    k: int,
+    score_threshold: float,
+) -> List[Tuple[str, str, float]]:
+    """
+    ANN retrieval against the db_schema_vectors collection.
+
+    Nearest sub-documents are fetched with database/schema_version metadata
+    filters, then reduced per table with the same multi-weight scoring as
+    the in-memory index.
+    """
+    database, schema_version = catalog.database_name, catalog.version
 
-    # Avoid division by zero
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
+    store = get_pgvector_schema_store(
+        collection_name=settings.collection_name,
+        datasource=settings.datasource,
+        embedding_dimensions=settings.embedding_dimensions,
+    )
+    query_embedding = embed_user_query(query)
 
-    return dot_product / (magnitude1 * magnitude2)
+    matches = store.search_sub_documents(
+        query_embedding,
+        k=settings.candidate_pool,
+        database=database,
+        schema_version=schema_version,
+        ivfflat_probes=settings.ivfflat_probes,
+    )
+    results = reduce_sub_document_matches(matches, query, None, k, score_threshold)
+
+    logger.info(f"pgvector matches: {len(matches)} sub-documents -> {len(results)} tables")
+    return results
 
 
 def _expand_related_tables(
-    table_docs: List[Dict[str, Any]], retrieved: List[Tuple[str, str, float]]
+    catalog: SchemaCatalog,
+    retrieved: List[Tuple[str, str, float]],
+    max_depth: int = 2,
+    max_related: int = 5,
 ) -> List[Tuple[str, str, float]]:
-    """Helper: Add FK-related tables."""
-    retrieved_names = {name for name, _, _ in retrieved}
+    """
+    Helper: Add FK-related tables from the catalog's foreign-key graph.
+
+    Bridge tables on join paths (up to ``max_depth`` hops) between retrieved
+    tables come first, then direct FK neighbours of retrieved tables, ranked
+    by how many retrieved tables they connect to.
+    """
+    fk_graph = catalog.fk_graph
+    retrieved_names = [name for name, _, _ in retrieved]
     expanded = list(retrieved)
 
-    # Find tables that reference or are referenced by retrieved tables
-    for table_doc in table_docs:
-        if table_doc["name"] in retrieved_names:
+    candidates = [(name, 0.6) for name in fk_graph.bridge_tables(retrieved_names, max_depth)]
+
+    neighbor_counts: Dict[str, int] = {}
+    for name in retrieved_names:
+        for neighbor in fk_graph.neighbors(name):
+            if neighbor not in retrieved_names:
+                neighbor_counts[neighbor] = neighbor_counts.get(neighbor, 0) + 1
+    candidates += [
+        (name, 0.5)
+        for name in sorted(neighbor_counts, key=neighbor_counts.get, reverse=True)
+    ]
+
+    added = set(retrieved_names)
+    for name, score in candidates:
+        if len(expanded) - len(retrieved) >= max_related:
+            break
+        ddl = catalog.get_ddl(name)
+        if name in added or ddl is None:
             continue
-
-        # Check if this table has relationships with retrieved tables
-        table_ddl = table_doc["ddl"].upper()
-        for retrieved_name, _, _ in retrieved:
-            if f"REFERENCES {retrieved_name.upper()}" in table_ddl:
-                # This table references a retrieved table
-                expanded.append((table_doc["name"], table_doc["ddl"], 0.5))
-                logger.info(
-                    f"Added related table: {table_doc['name']} -> {retrieved_name}"
-                )
-                break
+        expanded.append((name, ddl, score))
+        added.add(name)
+        logger.info(f"Added related table: {name} (score: {score})")
 
     return expanded
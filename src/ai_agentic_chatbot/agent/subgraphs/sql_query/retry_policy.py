@@ -0,0 +1,81 @@
+"""Retry of transient failures with jittered exponential backoff."""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """
+    Full-jitter delay before retry ``attempt`` (1-based).
+
+    Uniform in [0, min(max_delay, base_delay * 2 ** (attempt - 1))], so
+    concurrent requests failing together do not retry in lockstep.
+    """
+    return rng() * min(max_delay, base_delay * 2 ** (attempt - 1))
+
+
+def call_with_retry(
+    fn: Callable[[], T],
+    is_transient: Callable[[Exception], bool],
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 4.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> T:
+    """
+    Call ``fn``, retrying transient failures up to ``max_attempts`` calls in total.
+
+    Non-transient failures and the last transient one are re-raised.
+    """
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= max_attempts or not is_transient(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(
+                f"Transient failure (attempt {attempt}/{max_attempts}), "
+                f"retrying in {delay:.2f}s: {e}"
+            )
+            sleep(delay)
+            attempt += 1
+
+
+async def acall_with_retry(
+    fn: Callable[[], Awaitable[T]],
+    is_transient: Callable[[Exception], bool],
+    max_attempts: int = 3,
+    base_delay: float = 0.5,
+    max_delay: float = 4.0,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+) -> T:
+    """``call_with_retry`` for coroutines; the backoff does not block the event loop."""
+    attempt = 1
+    while True:
+        try:
+            return await fn()
+        except Exception as e:
+            if attempt >= max_attempts or not is_transient(e):
+                raise
+            delay = backoff_delay(attempt, base_delay, max_delay)
+            logger.warning(
+                f"Transient failure (attempt {attempt}/{max_attempts}), "
+                f"retrying in {delay:.2f}s: {e}"
+            )
+            await sleep(delay)
+            attempt += 1
@@ -1,11 +1,21 @@
 """Routing logic for SQL query subgraph with retry mechanism."""
 
 from typing import Literal
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.model_tiers import TIER_FAST
 from ai_agentic_chatbot.logging_config import get_logger
 
 logger = get_logger(__name__)
 
 
+def route_after_cache_lookup(state: dict) -> Literal["validate_query", "retrieve_schemas"]:
+    """Route after the answer cache lookup."""
+    if state.get("cache_hit") and state.get("generated_sql"):
+        logger.info("Answer cache hit - skipping retrieval and generation")
+        return "validate_query"
+    return "retrieve_schemas"
+
+
 def route_after_retrieval(state: dict) -> Literal["generate_sql", "END"]:
     """Route after schema retrieval."""
     retrieved_tables = state.get("retrieved_tables", [])
@@ -35,40 +45,109 @@ def route_after_generation(state: dict) -> Literal["validate_query", "END"]:
     return "validate_query"
 
 
-def route_after_validation(state: dict) -> Literal["execute_query", "END"]:
+def route_after_validation(
+    state: dict,
+) -> Literal["check_cost", "generate_sql", "repair_sql", "evict_answer", "END"]:
     """Route after validation."""
     is_safe = state.get("is_safe", False)
     validation_errors = state.get("validation_errors", [])
 
+    if state.get("schema_errors"):
+        logger.warning("Unknown identifiers found before execution")
+        return _route_failure(state)
+
+    if not is_safe and state.get("model_tier") == TIER_FAST:
+        logger.warning(
+            f"Fast tier query rejected ({state.get('escalation_reason')}) - escalating to smart model"
+        )
+        return "generate_sql"
+
     if not is_safe:
         logger.warning(f"Query unsafe: {validation_errors} - ending subgraph")
         return "END"
 
-    logger.info("Query validated successfully - proceeding to execution")
+    logger.info("Query validated successfully - estimating cost")
+    return "check_cost"
+
+
+def route_after_cost_check(
+    state: dict,
+) -> Literal["execute_query", "generate_sql", "repair_sql", "evict_answer", "END"]:
+    """Route after the EXPLAIN cost guard."""
+    if state.get("cost_verdict") == "rejected":
+        logger.warning(f"Query over cost budget: {state.get('execution_error')}")
+        return _route_failure(state)
+
+    logger.info("Query within cost budget - proceeding to execution")
     return "execute_query"
 
 
-def route_after_execution(state: dict) -> Literal["generate_sql", "END"]:
+def route_after_execution(
+    state: dict,
+) -> Literal["generate_sql", "repair_sql", "store_answer", "evict_answer", "END"]:
     """Route after execution - implements retry logic."""
     execution_error = state.get("execution_error")
-    generation_attempts = state.get("generation_attempts", 0)
-    max_retries = state.get("max_retries", 2)
     error_category = state.get("error_category", "unknown")
 
     if not execution_error:
-        logger.info("✅ Execution successful - ending subgraph")
-        return "END"
+        logger.info("✅ Execution successful - caching answer")
+        return "store_answer"
 
-    if generation_attempts >= max_retries:
-        logger.warning(f"Max retries ({max_retries}) exceeded - ending subgraph")
-        return "END"
+    return _route_failure(state)
+
+
+def _route_failure(state: dict) -> Literal["generate_sql", "repair_sql", "evict_answer", "END"]:
+    """Repair or regenerate a query that failed (or would fail) to execute."""
+    error_category = state.get("error_category", "unknown")
 
+    # Regenerating SQL cannot fix access rights or an unreachable database;
+    # connection failures were already retried on the same SQL by execute_query
     if not _is_retryable_error(error_category):
         logger.warning(
             f"Non-retryable error category '{error_category}' - ending subgraph"
         )
         return "END"
 
+    repair_settings = get_agent_settings().sql_repair
+    if (
+        repair_settings.enabled
+        and error_category == "not_found"
+        and state.get("repair_attempts", 0) < repair_settings.max_attempts
+    ):
+        logger.info("Unknown identifier - trying local repair before regeneration")
+        return "repair_sql"
+
+    return _route_retry(state)
+
+
+def route_after_repair(
+    state: dict,
+) -> Literal["validate_query", "generate_sql", "evict_answer", "END"]:
+    """Route after local repair: re-run the repaired SQL or fall back to the LLM."""
+    if state.get("last_repair"):
+        logger.info(f"Repaired {state['last_repair']} - re-validating")
+        return "validate_query"
+    return _route_retry(state)
+
+
+def _route_retry(state: dict) -> Literal["generate_sql", "evict_answer", "END"]:
+    """Regenerate after a failed execution, within the retry budget."""
+    generation_attempts = state.get("generation_attempts", 0)
+    max_retries = state.get("max_retries", 2)
+    error_category = state.get("error_category", "unknown")
+
+    # An escalation from the fast tier does not use up a retry
+    if any(call.get("tier") == TIER_FAST for call in state.get("tier_calls") or []):
+        max_retries += 1
+
+    if generation_attempts >= max_retries:
+        logger.warning(f"Max retries ({max_retries}) exceeded - ending subgraph")
+        return "END"
+
+    if state.get("cache_hit"):
+        logger.warning("Cached SQL failed - falling back to generation")
+        return "evict_answer"
+
     logger.info(
         f"Retrying generation (attempt {generation_attempts + 1}/{max_retries}) for {error_category} error"
     )
@@ -77,7 +156,7 @@ def route_after_execution(state: dict) -> Literal["generate_sql", "END"]:
 
 def _is_retryable_error(error_category: str) -> bool:
     """Determine if an error category is worth retrying."""
-    retryable_categories = {"syntax", "not_found", "type", "unknown"}
+    retryable_categories = {"syntax", "not_found", "type", "cost", "unknown"}
 
     non_retryable_categories = {"permission", "connection"}
 
@@ -129,6 +208,11 @@ def get_retry_strategy(error_category: str, attempt: int) -> dict:
             "focus": "Fix data type mismatches and casting issues",
             "temperature": 0.1,
         },
+        "cost": {
+            "focus": "Reduce the rows read: filter on indexed columns, avoid "
+            "unfiltered joins of large tables, aggregate before joining",
+            "temperature": 0.2,
+        },
         "unknown": {
             "focus": "Review the entire query for potential issues",
             "temperature": 0.3,
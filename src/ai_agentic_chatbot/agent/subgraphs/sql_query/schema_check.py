@@ -0,0 +1,169 @@
+"""Static check of generated SQL against the extracted schema's identifiers."""
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Set, Tuple
+
+from sqlparse import tokens as T
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_repair import (
+    KIND_COLUMN,
+    KIND_TABLE,
+    SchemaIdentifiers,
+    closest_identifier,
+    scan_references,
+    significant_tokens,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class IdentifierError:
+    """A table or column of the query that the schema does not have."""
+
+    kind: str
+    name: str
+    qualifier: Optional[str] = None  # alias or table the column was written with
+    tables: Tuple[str, ...] = ()  # schema tables the column was looked up in
+    suggestion: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        # Same leading wording as MySQL errors, so local repair can parse it
+        hint = f"; did you mean {self.suggestion}?" if self.suggestion else ""
+        if self.kind == KIND_TABLE:
+            return f"Table '{self.name}' doesn't exist{hint}"
+        if self.qualifier:
+            return (
+                f"Unknown column '{self.qualifier}.{self.name}': "
+                f"{self.tables[0]}.{self.name} does not exist{hint}"
+            )
+        return (
+            f"Unknown column '{self.name}': not a column of "
+            f"{', '.join(self.tables)}{hint}"
+        )
+
+
+def _is_name(token) -> bool:
+    # Exact type: Name.Builtin covers keywords such as INTERVAL
+    return token.ttype is T.Name
+
+
+def _follows(tokens: Sequence, index: int, value: str) -> bool:
+    return index > 0 and tokens[index - 1].match(T.Punctuation, value)
+
+
+def _precedes(tokens: Sequence, index: int, value: str) -> bool:
+    return index + 1 < len(tokens) and tokens[index + 1].match(T.Punctuation, value)
+
+
+class SchemaChecker:
+    """
+    Resolves the tables, aliases and columns of a query against the schema.
+
+    Tables after FROM/JOIN must exist. ``alias.column`` must exist in the
+    aliased table. Unqualified columns are checked only when every source
+    of the query is a known table with a complete column list (no
+    subqueries or CTEs), against the columns of all of them; select-list
+    aliases are not flagged.
+    """
+
+    def __init__(self, identifiers: SchemaIdentifiers, suggestion_similarity: float = 0.5):
+        self.identifiers = identifiers
+        self.suggestion_similarity = suggestion_similarity
+
+    def check(self, sql: str) -> List[IdentifierError]:
+        if not self.identifiers.columns_by_table:
+            return []
+
+        tokens = significant_tokens(sql)
+        references = scan_references(tokens)
+        errors: List[IdentifierError] = []
+
+        resolved = {}
+        for key, table in references.tables.items():
+            schema_table = self.identifiers.resolve_table(table)
+            if schema_table is not None:
+                resolved[key] = schema_table
+            elif key == table.lower() and not references.derived:
+                errors.append(
+                    IdentifierError(
+                        KIND_TABLE, table, suggestion=self._suggest(table, self.identifiers.tables)
+                    )
+                )
+
+        qualified: Set[int] = set()
+        for index in range(2, len(tokens)):
+            if not (_is_name(tokens[index]) and _follows(tokens, index, ".")):
+                continue
+            qualifier_token = tokens[index - 2]
+            qualified.update((index - 2, index))
+            if index in references.positions or _precedes(tokens, index, "."):
+                continue
+            qualifier = qualifier_token.value.strip("`")
+            table = resolved.get(qualifier.lower())
+            column = tokens[index].value.strip("`")
+            if table is None or self.identifiers.has_column(table, column):
+                continue
+            errors.append(
+                IdentifierError(
+                    KIND_COLUMN,
+                    column,
+                    qualifier=qualifier,
+                    tables=(table,),
+                    suggestion=self._suggest(column, self.identifiers.columns_by_table[table]),
+                )
+            )
+
+        all_known = len(resolved) == len(references.tables) and all(
+            self.identifiers.is_complete(table) for table in resolved.values()
+        )
+        if references.tables and all_known and not references.derived:
+            errors.extend(self._check_unqualified(tokens, references, resolved, qualified))
+
+        return errors
+
+    def _check_unqualified(self, tokens, references, resolved, qualified) -> List[IdentifierError]:
+        tables = tuple(sorted(set(resolved.values())))
+        columns = self.identifiers.columns_of(tables)
+        known = {column.lower() for column in columns} | set(references.tables)
+
+        # Output aliases: "expr AS name" or implicit "expr name" after a token
+        # that ends an expression (name, literal, ")" or CASE ... END)
+        aliases = {
+            tokens[index].value.strip("`").lower()
+            for index in range(1, len(tokens))
+            if _is_name(tokens[index])
+            and (
+                tokens[index - 1].match(T.Keyword, "AS")
+                or tokens[index - 1].match(T.Punctuation, ")")
+                or tokens[index - 1].match(T.Keyword, "END")
+                or _is_name(tokens[index - 1])
+                or tokens[index - 1].ttype in T.Literal
+            )
+        }
+
+        errors: List[IdentifierError] = []
+        seen: Set[str] = set()
+        for index, token in enumerate(tokens):
+            if (
+                not _is_name(token)
+                or index in qualified
+                or index in references.positions
+                or _precedes(tokens, index, "(")
+            ):
+                continue
+            name = token.value.strip("`")
+            if name.lower() in known or name.lower() in aliases or name.lower() in seen:
+                continue
+            seen.add(name.lower())
+            errors.append(
+                IdentifierError(
+                    KIND_COLUMN, name, tables=tables, suggestion=self._suggest(name, columns)
+                )
+            )
+        return errors
+
+    def _suggest(self, name: str, candidates: Sequence[str]) -> Optional[str]:
+        return closest_identifier(name, candidates, self.suggestion_similarity)
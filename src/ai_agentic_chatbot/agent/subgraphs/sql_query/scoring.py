@@ -0,0 +1,182 @@
+"""Vectorized multi-vector table scoring for schema retrieval."""
+
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ai_agentic_chatbot.schema_extractor.embedding_index import (
+    KIND_FIELD,
+    KIND_PURPOSE,
+    KIND_QUESTION,
+    KIND_SEARCH_TEXT,
+    SchemaEmbeddingIndex,
+)
+
+# Score multipliers per matched sub-document kind
+SUBDOC_WEIGHTS = {
+    KIND_QUESTION: 2.0,
+    KIND_PURPOSE: 1.5,
+    KIND_SEARCH_TEXT: 1.0,
+    KIND_FIELD: 1.2,
+}
+
+ROUTER_HINT_BOOST = 1.3
+RELATIONSHIP_BOOST = 1.2
+
+
+class TableScorer:
+    """
+    Scores every table against a query embedding in one matrix-vector product.
+
+    Sub-document vectors are pre-normalized and ordered so each table owns a
+    contiguous row segment; per-kind weights are a precomputed row vector and
+    the max-per-table reduction is a single ``np.maximum.reduceat``.
+    """
+
+    def __init__(
+        self,
+        index: SchemaEmbeddingIndex,
+        table_docs: Sequence[Mapping[str, Any]],
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        weights = weights or SUBDOC_WEIGHTS
+
+        self.key = index.key
+        self.table_names: List[str] = [doc["name"] for doc in table_docs]
+        self._position = {name: i for i, name in enumerate(self.table_names)}
+
+        row_tables = np.array(
+            [self._position.get(sub_doc.table_name, -1) for sub_doc in index.sub_documents],
+            dtype=np.int64,
+        )
+        keep = np.flatnonzero(row_tables >= 0)
+        order = keep[np.argsort(row_tables[keep], kind="stable")]
+
+        matrix = index.matrix[order] if len(order) else np.zeros((0, 0), np.float32)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True) if len(order) else None
+        if norms is not None:
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+        self._matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+
+        self._weights = np.array(
+            [weights.get(index.sub_documents[i].kind, 1.0) for i in order],
+            dtype=np.float32,
+        )
+
+        # Segment boundaries: first row of every table that has at least one vector
+        sorted_tables = row_tables[order]
+        self._segment_tables, self._segment_starts = np.unique(
+            sorted_tables, return_index=True
+        )
+
+        # Inverted relationship lookup: related table name -> scored table positions
+        self._related: Dict[str, List[int]] = {}
+        for position, doc in enumerate(table_docs):
+            for rel in doc.get("relationships") or []:
+                related_table = rel.get("related_table", "").lower()
+                if related_table:
+                    self._related.setdefault(related_table, []).append(position)
+
+    def score(self, query_vector: Sequence[float]) -> np.ndarray:
+        """Weighted max cosine similarity per table, aligned with ``table_names``."""
+        scores = np.zeros(len(self.table_names), dtype=np.float32)
+        if not len(self._matrix):
+            return scores
+
+        query = np.asarray(query_vector, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return scores
+
+        weighted = (self._matrix @ (query / query_norm)) * self._weights
+        scores[self._segment_tables] = np.maximum.reduceat(weighted, self._segment_starts)
+        return scores
+
+    def apply_boosts(
+        self, scores: np.ndarray, query: str, router_hints: Optional[List[str]]
+    ) -> np.ndarray:
+        """Router hint boost and relationship boost for related tables named in the query."""
+        boost = np.ones_like(scores)
+
+        hinted = [self._position[name] for name in router_hints or [] if name in self._position]
+        boost[hinted] *= ROUTER_HINT_BOOST
+
+        query_lower = query.lower()
+        for related_table, positions in self._related.items():
+            if related_table in query_lower:
+                np.multiply.at(boost, positions, RELATIONSHIP_BOOST)
+
+        return scores * boost
+
+    def top_k(
+        self, scores: np.ndarray, k: int, score_threshold: float
+    ) -> List[Tuple[str, float]]:
+        """Top-k tables above the threshold, best first, via argpartition."""
+        if k <= 0:
+            return []
+
+        candidates = np.flatnonzero(scores >= score_threshold)
+        if len(candidates) > k:
+            partitioned = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[partitioned]
+
+        ranked = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(self.table_names[i], float(scores[i])) for i in ranked]
+
+
+def reduce_sub_document_matches(
+    matches: List[Tuple[Dict, float]],
+    query: str,
+    router_hints: Optional[List[str]],
+    k: int,
+    score_threshold: float,
+    weights: Optional[Dict[str, float]] = None,
+) -> List[Tuple[str, str, float]]:
+    """
+    Weighted max-per-table reduction for ANN sub-document matches.
+
+    ``matches`` are (metadata, cosine_similarity) pairs whose metadata carries
+    table_name, kind, ddl and related_tables. Applies the same weights and
+    boosts as ``TableScorer`` and returns (name, ddl, score) tuples.
+    """
+    weights = weights or SUBDOC_WEIGHTS
+
+    best: Dict[str, Tuple[float, Dict]] = {}
+    for metadata, similarity in matches:
+        name = metadata["table_name"]
+        score = similarity * weights.get(metadata.get("kind"), 1.0)
+        if name not in best or score > best[name][0]:
+            best[name] = (score, metadata)
+
+    query_lower = query.lower()
+    scored = []
+    for name, (score, metadata) in best.items():
+        if router_hints and name in router_hints:
+            score *= ROUTER_HINT_BOOST
+        for related_table in metadata.get("related_tables") or []:
+            if related_table in query_lower:
+                score *= RELATIONSHIP_BOOST
+        if score >= score_threshold:
+            scored.append((name, metadata.get("ddl", ""), score))
+
+    scored.sort(key=lambda x: x[2], reverse=True)
+    return scored[:k]
+
+
+_scorer: Optional[TableScorer] = None
+_scorer_lock = Lock()
+
+
+def get_table_scorer(index: SchemaEmbeddingIndex, table_docs: Sequence[Mapping[str, Any]]) -> TableScorer:
+    """Get the scorer for an index, rebuilding it only when the index changes."""
+    global _scorer
+
+    if _scorer is not None and _scorer.key == index.key:
+        return _scorer
+
+    with _scorer_lock:
+        if _scorer is None or _scorer.key != index.key:
+            _scorer = TableScorer(index, table_docs)
+        return _scorer
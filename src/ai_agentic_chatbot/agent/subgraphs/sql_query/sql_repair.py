@@ -0,0 +1,372 @@
+"""Local repair of misspelled table and column names in generated SQL."""
+
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import Dict, FrozenSet, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlparse import lexer
+from sqlparse import tokens as T
+from sqlparse.sql import Token
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.column_pruning import parse_ddl
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.schema_catalog import SchemaCatalog
+
+logger = get_logger(__name__)
+
+KIND_TABLE = "table"
+KIND_COLUMN = "column"
+
+# MySQL and PostgreSQL wordings
+_UNKNOWN_COLUMN = (
+    re.compile(r"unknown column '([^']+)'", re.IGNORECASE),
+    re.compile(r'column "([^"]+)" does not exist', re.IGNORECASE),
+)
+_UNKNOWN_TABLE = (
+    re.compile(r"table '([^']+)' doesn't exist", re.IGNORECASE),
+    re.compile(r"unknown table '([^']+)'", re.IGNORECASE),
+    re.compile(r'relation "([^"]+)" does not exist', re.IGNORECASE),
+)
+
+_QUOTES = "`\"["
+_TABLE_CLAUSE_KEYWORDS = {"AS"}
+
+
+@dataclass(frozen=True)
+class UnknownIdentifier:
+    """Identifier a database error reported as missing."""
+
+    kind: str
+    name: str
+    qualifier: Optional[str] = None  # table alias for columns, schema for tables
+
+
+@dataclass(frozen=True)
+class SQLRepair:
+    sql: str
+    kind: str
+    original: str
+    replacement: str
+
+    def describe(self) -> str:
+        return f"{self.kind} {self.original} -> {self.replacement}"
+
+
+def parse_unknown_identifier(error: str) -> Optional[UnknownIdentifier]:
+    """Extract the missing table or column from a database error message."""
+    for kind, patterns in ((KIND_COLUMN, _UNKNOWN_COLUMN), (KIND_TABLE, _UNKNOWN_TABLE)):
+        for pattern in patterns:
+            match = pattern.search(error)
+            if match:
+                qualifier, _, name = match.group(1).rpartition(".")
+                return UnknownIdentifier(kind, name, qualifier or None)
+    return None
+
+
+def name_similarity(left: str, right: str) -> float:
+    """
+    Character similarity of two names, or the share of their ``_``-separated
+    words in common if higher (``total_amount`` / ``order_total``: 0.5).
+    """
+    left, right = left.lower(), right.lower()
+    left_words, right_words = set(left.split("_")) - {""}, set(right.split("_")) - {""}
+    shared = len(left_words & right_words) / max(len(left_words), len(right_words), 1)
+    return max(SequenceMatcher(None, left, right).ratio(), shared)
+
+
+def closest_identifier(
+    name: str, candidates: Sequence[str], min_similarity: float
+) -> Optional[str]:
+    """
+    Most similar candidate by name, case-insensitive.
+
+    None if no candidate reaches ``min_similarity`` or the best two tie,
+    since guessing between equally close names would be arbitrary.
+    """
+    scored = sorted(
+        (
+            (name_similarity(name, candidate), candidate)
+            for candidate in set(candidates)
+            if candidate.lower() != name.lower()
+        ),
+        reverse=True,
+    )
+    if not scored or scored[0][0] < min_similarity:
+        return None
+    if len(scored) > 1 and scored[1][0] == scored[0][0]:
+        return None
+    return scored[0][1]
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] in _QUOTES:
+        return value[1:-1]
+    return value
+
+
+def _is_identifier(token) -> bool:
+    return token.ttype in T.Name or token.ttype in T.String.Symbol or token.ttype in T.Keyword
+
+
+def lex(sql: str) -> List[Token]:
+    """All tokens of ``sql`` (whitespace included), from one lexer pass."""
+    return [Token(ttype, value) for ttype, value in lexer.tokenize(sql)]
+
+
+def significant_tokens(sql: str) -> List[Token]:
+    return [
+        token
+        for token in lex(sql)
+        if not token.is_whitespace and token.ttype not in T.Comment
+    ]
+
+
+@dataclass(frozen=True)
+class QueryReferences:
+    """Tables a query reads, as found by ``scan_references``."""
+
+    tables: Dict[str, str]  # lowercase alias or table name -> table as written
+    positions: FrozenSet[int]  # token indexes of the table names and aliases
+    derived: bool  # reads a subquery or a CTE, so not every source is a table
+
+
+def scan_references(tokens: Sequence[Token]) -> QueryReferences:
+    """
+    Tables named after FROM/JOIN in significant ``tokens``.
+
+    Tables of subqueries (``FROM (SELECT ...)``, ``IN (SELECT ...)``,
+    ``EXISTS (...)``) are collected too, and mark the query as ``derived``;
+    only plain (optionally schema-qualified) table references are resolved.
+    FROM inside a function call (``EXTRACT(YEAR FROM d)``) is not a table
+    clause; only Name tokens before ``(`` count as function names.
+    """
+    references: Dict[str, str] = {}
+    positions: Set[int] = set()
+    derived = False
+
+    in_from = False
+    calls: List[bool] = []  # open parentheses: True for function calls
+    index = 0
+    while index < len(tokens):
+        token = tokens[index]
+        if token.match(T.Punctuation, "("):
+            subquery = index + 1 < len(tokens) and (
+                tokens[index + 1].match(T.Keyword.DML, "SELECT")
+                or tokens[index + 1].ttype in T.Keyword.CTE
+            )
+            # IN (SELECT ...), EXISTS (...), ANY (...): a subquery, not a call
+            derived = derived or subquery
+            calls.append(not subquery and index > 0 and tokens[index - 1].ttype in T.Name)
+        elif token.match(T.Punctuation, ")") and calls:
+            calls.pop()
+        if token.ttype in T.Keyword.CTE:
+            derived = True
+
+        keyword = token.normalized if token.ttype in T.Keyword else None
+        if keyword == "FROM" and calls and calls[-1]:
+            keyword = None
+        expects_table = keyword == "FROM" or (keyword or "").endswith("JOIN") or (
+            in_from and token.match(T.Punctuation, ",")
+        )
+        if keyword == "FROM":
+            in_from = True
+        elif keyword and keyword not in _TABLE_CLAUSE_KEYWORDS and not keyword.endswith("JOIN"):
+            in_from = False
+
+        index += 1
+        if not expects_table or index >= len(tokens):
+            continue
+        if tokens[index].match(T.Punctuation, "("):
+            derived = True
+            continue
+        if not _is_identifier(tokens[index]):
+            continue
+
+        # schema.table -> table
+        positions.add(index)
+        table = _unquote(tokens[index].value)
+        while (
+            index + 2 < len(tokens)
+            and tokens[index + 1].match(T.Punctuation, ".")
+            and _is_identifier(tokens[index + 2])
+        ):
+            index += 2
+            positions.add(index)
+            table = _unquote(tokens[index].value)
+        index += 1
+        references[table.lower()] = table
+
+        if index < len(tokens) and tokens[index].match(T.Keyword, "AS"):
+            index += 1
+        if index < len(tokens) and (
+            tokens[index].ttype in T.Name or tokens[index].ttype in T.String.Symbol
+        ):
+            positions.add(index)
+            references[_unquote(tokens[index].value).lower()] = table
+            index += 1
+
+    return QueryReferences(references, frozenset(positions), derived)
+
+
+def table_references(sql: str) -> Dict[str, str]:
+    """Tables named after FROM/JOIN, keyed by lowercase alias and table name."""
+    return scan_references(significant_tokens(sql)).tables
+
+
+def rename_identifier(
+    sql: str, old: str, new: str, qualifier: Optional[str] = None
+) -> str:
+    """
+    Replace identifier tokens named ``old`` (case-insensitive) with ``new``.
+
+    Quoting is preserved. With a ``qualifier`` only ``qualifier.old``
+    occurrences are replaced.
+    """
+    tokens = lex(sql)
+    significant = [i for i, token in enumerate(tokens) if not token.is_whitespace]
+
+    parts = [token.value for token in tokens]
+    for position, i in enumerate(significant):
+        token = tokens[i]
+        if not _is_identifier(token) or _unquote(token.value).lower() != old.lower():
+            continue
+        if qualifier is not None:
+            if position < 2:
+                continue
+            dot, owner = tokens[significant[position - 1]], tokens[significant[position - 2]]
+            if not dot.match(T.Punctuation, ".") or _unquote(owner.value).lower() != qualifier.lower():
+                continue
+        quote = token.value[0] if token.value[0] in _QUOTES else ""
+        closing = {"[": "]"}.get(quote, quote)
+        parts[i] = f"{quote}{new}{closing}"
+
+    return "".join(parts)
+
+
+class SchemaIdentifiers:
+    """Table and column names of the extracted schema."""
+
+    def __init__(
+        self,
+        columns_by_table: Mapping[str, Sequence[str]],
+        partial_tables: Sequence[str] = (),
+    ):
+        self.columns_by_table = {table: tuple(columns) for table, columns in columns_by_table.items()}
+        self._tables = {table.lower(): table for table in self.columns_by_table}
+        self._columns = {
+            table: {column.lower() for column in columns}
+            for table, columns in self.columns_by_table.items()
+        }
+        # Tables whose listed columns are only a subset of the real ones
+        self._partial = frozenset(partial_tables)
+
+    @classmethod
+    def from_catalog(cls, catalog: SchemaCatalog) -> "SchemaIdentifiers":
+        """
+        Raw extracted schema, falling back to the documented table DDL.
+
+        Documented DDL lists only key fields and important dates, so those
+        tables are partial: their columns are repair candidates, but a
+        column missing from them is not reported as unknown.
+        """
+        columns_by_table: Dict[str, List[str]] = {}
+        for table in catalog.raw_schema.get("tables", ()):
+            columns_by_table[table.get("table_name", "")] = [
+                column.get("name", "") for column in table.get("columns", ())
+            ]
+        partial = []
+        for table_doc in catalog.table_docs:
+            if table_doc["name"] in columns_by_table:
+                continue
+            parsed = parse_ddl(table_doc.get("ddl") or "")
+            columns_by_table[table_doc["name"]] = parsed.column_names if parsed else []
+            partial.append(table_doc["name"])
+        return cls(columns_by_table, partial)
+
+    @property
+    def tables(self) -> List[str]:
+        return list(self.columns_by_table)
+
+    def resolve_table(self, name: str) -> Optional[str]:
+        return self._tables.get(name.lower())
+
+    def is_complete(self, table: str) -> bool:
+        """Whether every column of resolved ``table`` is known."""
+        return bool(self._columns.get(table)) and table not in self._partial
+
+    def has_column(self, table: str, column: str) -> bool:
+        """Whether resolved ``table`` has ``column``; True if its columns are not all known."""
+        return not self.is_complete(table) or column.lower() in self._columns[table]
+
+    def columns_of(self, tables: Sequence[str]) -> List[str]:
+        columns: List[str] = []
+        for table in tables:
+            resolved = self.resolve_table(table)
+            if resolved:
+                columns.extend(self.columns_by_table[resolved])
+        return columns
+
+
+class SQLRepairer:
+    """
+    Fixes "unknown table/column" errors by renaming to the closest real name.
+
+    Column candidates are limited to the tables the query references (or to
+    the aliased table when the error names one), so a repair never pulls in
+    a column from a table the query does not join.
+    """
+
+    def __init__(self, identifiers: SchemaIdentifiers, min_similarity: float = 0.75):
+        self.identifiers = identifiers
+        self.min_similarity = min_similarity
+
+    def repair(self, sql: str, error: str) -> Optional[SQLRepair]:
+        unknown = parse_unknown_identifier(error)
+        if unknown is None:
+            return None
+
+        qualifier = None
+        if unknown.kind == KIND_TABLE:
+            candidates = self.identifiers.tables
+        else:
+            references = table_references(sql)
+            if unknown.qualifier and unknown.qualifier.lower() in references:
+                qualifier = unknown.qualifier
+                tables: Set[str] = {references[unknown.qualifier.lower()]}
+            else:
+                tables = set(references.values())
+            candidates = self.identifiers.columns_of(sorted(tables))
+
+        replacement = closest_identifier(unknown.name, candidates, self.min_similarity)
+        if replacement is None:
+            return None
+
+        repaired = rename_identifier(sql, unknown.name, replacement, qualifier)
+        if repaired == sql:
+            return None
+        return SQLRepair(repaired, unknown.kind, unknown.name, replacement)
+
+
+# (schema content hash, identifiers), swapped as one reference
+_identifiers: Optional[Tuple[str, SchemaIdentifiers]] = None
+
+
+def get_schema_identifiers(catalog: SchemaCatalog) -> SchemaIdentifiers:
+    """Identifier index of ``catalog``, rebuilt only when the schema changes."""
+    global _identifiers
+    current = _identifiers
+    if current is None or current[0] != catalog.content_hash:
+        current = (catalog.content_hash, SchemaIdentifiers.from_catalog(catalog))
+        _identifiers = current
+    return current[1]
+
+
+def get_sql_repairer(catalog: SchemaCatalog) -> SQLRepairer:
+    """SQL repairer over the identifiers of ``catalog``."""
+    from ai_agentic_chatbot.agent.settings import get_agent_settings
+
+    return SQLRepairer(
+        get_schema_identifiers(catalog),
+        min_similarity=get_agent_settings().sql_repair.min_similarity,
+    )
@@ -0,0 +1,321 @@
+"""Token-based safety validation of generated SQL."""
+
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlparse import lexer
+from sqlparse import tokens as T
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Keywords that change data, schema, privileges or session state. Transaction
+# words (START, COMMIT, ROLLBACK) are left out: they are common column names and
+# cannot run inside the single SELECT statement that is allowed.
+_DANGEROUS_KEYWORDS = frozenset(
+    {
+        "INSERT",
+        "UPDATE",
+        "DELETE",
+        "MERGE",
+        "CREATE",
+        "ALTER",
+        "DROP",
+        "TRUNCATE",
+        "RENAME",
+        "GRANT",
+        "REVOKE",
+        "EXEC",
+        "EXECUTE",
+        "BULK",
+        "OUTFILE",
+        "DUMPFILE",
+        "WAITFOR",
+        "HANDLER",
+        "CALL",
+    }
+)
+# Write keywords that are only dangerous when they start a statement or CTE body
+_STATEMENT_KEYWORDS = frozenset({"REPLACE", "UPSERT"})
+_DENIED_FUNCTIONS = frozenset(
+    {
+        "SLEEP",
+        "BENCHMARK",
+        "PG_SLEEP",
+        "LOAD_FILE",
+        "PG_READ_FILE",
+        "PG_READ_BINARY_FILE",
+        "PG_LS_DIR",
+        "GET_LOCK",
+        "RELEASE_LOCK",
+        "SYS_EXEC",
+        "SYS_EVAL",
+        "DBLINK",
+        "XP_CMDSHELL",
+        "SP_EXECUTESQL",
+        "OPENROWSET",
+        "OPENDATASOURCE",
+    }
+)
+_SYSTEM_SCHEMAS = frozenset(
+    {"information_schema", "performance_schema", "mysql", "sys", "pg_catalog"}
+)
+
+
+@dataclass(frozen=True)
+class SQLToken:
+    ttype: object
+    value: str
+    depth: int  # parenthesis depth the token is at
+
+    @property
+    def upper(self) -> str:
+        return self.value.upper()
+
+    def is_keyword(self, *values: str) -> bool:
+        return self.ttype in T.Keyword and self.upper in values
+
+    def is_punctuation(self, value: str) -> bool:
+        return self.ttype in T.Punctuation and self.value == value
+
+    @property
+    def is_name(self) -> bool:
+        return self.ttype in T.Name or self.ttype in T.Keyword
+
+    @property
+    def is_literal(self) -> bool:
+        return self.ttype in T.Literal.Number or self.ttype in T.Literal.String.Single
+
+
+class TokenizedQuery:
+    """
+    Query lexed once into significant tokens (whitespace dropped).
+
+    Lexing is a single linear pass; rules then scan the token list without
+    backtracking, so validation time grows linearly with the query length.
+    """
+
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.tokens: List[SQLToken] = []
+        self.statements = 0
+
+        depth = 0
+        statement_open = False
+        for ttype, value in lexer.tokenize(sql):
+            if ttype in T.Whitespace or ttype in T.Text.Whitespace or not value.strip():
+                continue
+            if ttype in T.Punctuation and value == ")":
+                depth -= 1
+            self.tokens.append(SQLToken(ttype, value, depth))
+            if ttype in T.Punctuation and value == "(":
+                depth += 1
+
+            if ttype in T.Punctuation and value == ";":
+                statement_open = False
+            elif ttype not in T.Comment and not statement_open:
+                statement_open = True
+                self.statements += 1
+        self.final_depth = depth
+        self.code_tokens = [token for token in self.tokens if token.ttype not in T.Comment]
+
+    @staticmethod
+    def followed_by(tokens: Sequence[SQLToken], index: int, value: str) -> bool:
+        return index + 1 < len(tokens) and tokens[index + 1].is_punctuation(value)
+
+
+Rule = Callable[[TokenizedQuery], List[str]]
+
+
+def check_not_empty(query: TokenizedQuery) -> List[str]:
+    return [] if query.code_tokens else ["Empty query"]
+
+
+def check_single_statement(query: TokenizedQuery) -> List[str]:
+    if query.statements > 1:
+        return ["Multiple statements detected - only one statement allowed"]
+    return []
+
+
+def check_select_only(query: TokenizedQuery) -> List[str]:
+    tokens = query.code_tokens
+    if not tokens:
+        return []
+    first = tokens[0]
+    if first.ttype in T.Keyword.DML and first.upper == "SELECT":
+        return []
+    if first.ttype in T.Keyword.CTE and any(
+        token.ttype in T.Keyword.DML and token.upper == "SELECT" for token in tokens
+    ):
+        return []
+    return ["Only SELECT queries are allowed"]
+
+
+def check_dangerous_keywords(query: TokenizedQuery) -> List[str]:
+    """Write, DDL and DCL keywords; function calls of the same name are allowed."""
+    tokens = query.code_tokens
+    found: List[str] = []
+    for index, token in enumerate(tokens):
+        if not token.is_name or TokenizedQuery.followed_by(tokens, index, "("):
+            continue
+        starts_statement = index == 0 or tokens[index - 1].value in (";", "(")
+        dangerous = token.upper in _DANGEROUS_KEYWORDS or (
+            starts_statement and token.upper in _STATEMENT_KEYWORDS
+        )
+        if dangerous and token.upper not in found:
+            found.append(token.upper)
+    return [f"Dangerous keyword detected: {keyword}" for keyword in found]
+
+
+def check_denied_functions(query: TokenizedQuery) -> List[str]:
+    tokens = query.code_tokens
+    return [
+        f"Function not allowed: {token.value}"
+        for index, token in enumerate(tokens)
+        if token.is_name
+        and token.upper in _DENIED_FUNCTIONS
+        and TokenizedQuery.followed_by(tokens, index, "(")
+    ]
+
+
+def check_system_catalog(query: TokenizedQuery) -> List[str]:
+    """References to system schemas (``information_schema.x``) or ``pg_*`` tables."""
+    tokens = query.code_tokens
+    found: List[str] = []
+    for index, token in enumerate(tokens):
+        if token.ttype not in T.Name:
+            continue
+        name = token.value.strip('`"').lower()
+        if (name in _SYSTEM_SCHEMAS and TokenizedQuery.followed_by(tokens, index, ".")) or (
+            name.startswith("pg_") and not TokenizedQuery.followed_by(tokens, index, "(")
+        ):
+            if name not in found:
+                found.append(name)
+    return [f"System catalog access not allowed: {name}" for name in found]
+
+
+def check_comments(query: TokenizedQuery) -> List[str]:
+    # Block comments can carry MySQL executable code (/*! ... */)
+    if any(token.ttype in T.Comment.Multiline for token in query.tokens):
+        return ["Block comments not allowed for security"]
+    return []
+
+
+def check_tautologies(query: TokenizedQuery) -> List[str]:
+    """``literal = same literal`` (``1 = 1``, ``'a' = 'a'``)."""
+    tokens = query.code_tokens
+    for index in range(1, len(tokens) - 1):
+        left, operator, right = tokens[index - 1], tokens[index], tokens[index + 1]
+        if (
+            operator.ttype in T.Operator.Comparison
+            and operator.value == "="
+            and left.is_literal
+            and right.is_literal
+            and left.value == right.value
+        ):
+            return ["Potential tautology injection"]
+    return []
+
+
+def check_syntax(query: TokenizedQuery) -> List[str]:
+    errors = []
+    if query.final_depth != 0 or any(token.depth < 0 for token in query.tokens):
+        errors.append("Unbalanced parentheses")
+    if any(token.ttype in T.Error for token in query.tokens):
+        errors.append("Unterminated string or invalid character")
+
+    tokens = query.code_tokens
+    has_from = any(token.is_keyword("FROM") for token in tokens)
+    if tokens and not has_from:
+        # Constants and functions need no FROM; column references do
+        references_columns = any(
+            token.ttype in T.Name
+            and not TokenizedQuery.followed_by(tokens, index, "(")
+            and not (index > 0 and tokens[index - 1].is_keyword("AS"))
+            for index, token in enumerate(tokens)
+        )
+        if references_columns:
+            errors.append("SELECT requires FROM clause")
+    return errors
+
+
+DEFAULT_RULES: Tuple[Tuple[str, Rule], ...] = (
+    ("not_empty", check_not_empty),
+    ("single_statement", check_single_statement),
+    ("select_only", check_select_only),
+    ("dangerous_keywords", check_dangerous_keywords),
+    ("denied_functions", check_denied_functions),
+    ("system_catalog", check_system_catalog),
+    ("comments", check_comments),
+    ("tautologies", check_tautologies),
+    ("syntax", check_syntax),
+)
+
+
+class SQLValidator:
+    """
+    Runs a fixed rule set over one tokenization of the query.
+
+    Each rule is timed; cumulative calls, failures and time per rule are
+    available from ``stats`` for profiling.
+    """
+
+    def __init__(self, rules: Sequence[Tuple[str, Rule]] = DEFAULT_RULES):
+        self.rules = tuple(rules)
+        self._stats: Dict[str, List[float]] = {
+            name: [0, 0, 0.0, 0.0] for name in ["tokenize", *(name for name, _ in self.rules)]
+        }
+        self._lock = Lock()
+
+    def validate(self, sql: str) -> List[str]:
+        timings: List[Tuple[str, float, bool]] = []
+
+        start = time.perf_counter()
+        query = TokenizedQuery(sql)
+        timings.append(("tokenize", time.perf_counter() - start, False))
+
+        errors: List[str] = []
+        for name, rule in self.rules:
+            start = time.perf_counter()
+            rule_errors = rule(query)
+            timings.append((name, time.perf_counter() - start, bool(rule_errors)))
+            errors.extend(rule_errors)
+
+        with self._lock:
+            for name, elapsed, failed in timings:
+                stats = self._stats[name]
+                stats[0] += 1
+                stats[1] += failed
+                stats[2] += elapsed
+                stats[3] = max(stats[3], elapsed)
+        return errors
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                name: {
+                    "calls": calls,
+                    "failures": failures,
+                    "total_ms": total * 1000,
+                    "avg_ms": total * 1000 / calls if calls else 0.0,
+                    "max_ms": max_elapsed * 1000,
+                }
+                for name, (calls, failures, total, max_elapsed) in self._stats.items()
+            }
+
+
+_validator: Optional[SQLValidator] = None
+_validator_lock = Lock()
+
+
+def get_sql_validator() -> SQLValidator:
+    """Get the process-wide SQL validator."""
+    global _validator
+    if _validator is None:
+        with _validator_lock:
+            if _validator is None:
+                _validator = SQLValidator()
+    return _validator
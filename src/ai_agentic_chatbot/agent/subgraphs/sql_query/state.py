@@ -12,7 +12,12 @@ class SQLSubgraphState(TypedDict):
     user_query: str
     router_table_hints: Optional[List[str]]
     
+    # Answer cache
+    cache_hit: bool
+    cache_key: Optional[str]
+
     # Schema Retrieval
+    candidate_tables: Optional[List[Tuple[str, str, float]]]  # speculative, before router hints
     retrieved_tables: Optional[List[Tuple[str, str, float]]]  # (name, ddl, score)
     
     # Generation
@@ -20,14 +25,27 @@ class SQLSubgraphState(TypedDict):
     explanation: Optional[str]
     confidence: float
     tables_used: List[str]
+    model_tier: Optional[str]  # tier of the last generation call
+    escalation_reason: Optional[str]  # why the fast tier's SQL was rejected
+    tier_calls: Annotated[List[dict], add]  # latency, tokens and cost per call
     
     # Validation
     is_safe: bool
     validation_errors: Annotated[List[str], add]
+    schema_errors: List[str]  # unknown tables/columns, with suggestions
     
+    # Cost guard
+    cost_verdict: Optional[str]  # ok, warn, limited, rejected or skipped
+    query_plan: Optional[dict]  # EXPLAIN estimate (rows examined, scans)
+
     # Execution
     query_result: Optional[List[dict]]
     execution_error: Optional[str]
+    error_category: Optional[str]  # see execute_query._categorize_error
+
+    # Local repair
+    repair_attempts: int
+    last_repair: Optional[str]  # e.g. "column custmer_id -> customer_id"
     
     # Retry tracking
     generation_attempts: int
@@ -1,6 +1,10 @@
 from pathlib import Path
 
+from ai_agentic_chatbot.agent.settings import get_agent_settings
+from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import get_azure_openai_embedding
 from ai_agentic_chatbot.infrastructure.vector_store.pgvector_store import PgVectorSchemaStore
+from ai_agentic_chatbot.schema_extractor.schema_catalog import load_schema_catalog
+from ai_agentic_chatbot.schema_extractor.embedding_index import load_or_build_index
 from ai_agentic_chatbot.schema_extractor.vector_schema_builder import VectorSchemaBuilder
 from ai_agentic_chatbot.utils.utils import get_db_connection_string
 
@@ -15,13 +19,48 @@ def ingest_schema(schema_path: str, pg_conn_str: str) -> None:
     table_chunks = builder.build_all_tables(schema)
 
     # Infrastructure logic
+    retrieval = get_agent_settings().retrieval
     store = PgVectorSchemaStore(
         connection_string=pg_conn_str,
-        collection_name="db_schema_vectors"
+        collection_name=retrieval.collection_name,
+        datasource=retrieval.datasource,
+        embedding_dimensions=retrieval.embedding_dimensions,
     )
 
     store.ingest(table_chunks)
 
+    # Precompute table-doc embeddings for the schema being ingested
+    catalog = load_schema_catalog(schema_path)
+    table_docs = catalog.table_docs
+    index = load_or_build_index(
+        table_docs,
+        catalog.schema_version,
+        catalog.content_hash,
+        get_azure_openai_embedding(),
+    )
+
+    # Publish the same vectors to pgvector for ANN retrieval
+
+    store.ingest_sub_documents(
+        sub_documents=[
+            (sub_doc.table_name, sub_doc.kind, sub_doc.text)
+            for sub_doc in index.sub_documents
+        ],
+        vectors=index.matrix.tolist(),
+        ddl_by_table={doc["name"]: doc["ddl"] for doc in table_docs},
+        related_tables={
+            doc["name"]: [
+                rel.get("related_table", "").lower()
+                for rel in doc.get("relationships") or []
+                if rel.get("related_table")
+            ]
+            for doc in table_docs
+        },
+        database=catalog.database_name,
+        schema_version=catalog.version,
+    )
+    store.ensure_ann_index(retrieval.ann_index, retrieval.ivfflat_lists)
+
 
 # if __name__ == "__main__":
 #     ingest_schema(
@@ -8,6 +8,8 @@ import yaml
 from pydantic import ValidationError
 
 from ai_agentic_chatbot.infrastructure.llm import get_llm
+from ai_agentic_chatbot.infrastructure.llm.usage import usage_config
+from langchain_core.messages import HumanMessage, SystemMessage
 from ai_agentic_chatbot.schema_extractor.table_schema_documentation import (
     TableSchemaDocumentation,
 )
@@ -24,22 +26,25 @@ YAML_OUT_PATH = BASE_DIR / "temp"
 def transform_schema_to_text() -> None:
     llm = get_llm()
     db_schema_json = json.loads(Path(DB_SCHEMA_JSON_PATH).read_text(encoding="utf-8"))
-    system_prompt = load_file_content(SCHEMA_TO_TEXT_PROMPT_PATH)
+    # Static system prompt and instruction template first, table JSON last,
+    # so every per-table call shares the cached prompt prefix
+    system_prompt = SystemMessage(content=load_file_content(SCHEMA_TO_TEXT_PROMPT_PATH))
+    user_prompt_template = load_file_content(USER_SCHEMA_TO_TEXT_PROMPT_PATH)
+    structured_llm = llm.with_structured_output(TableSchemaDocumentation, strict=True)
     validated_tables: List[TableSchemaDocumentation] = []
     schema_summary = {}
 
     for table in db_schema_json["tables"]:
         table_json = json.dumps(table, indent=2)
 
-        user_prompt = load_file_content(USER_SCHEMA_TO_TEXT_PROMPT_PATH).format(
-            table_json=table_json
-        )
-        structured_llm = llm.with_structured_output(
-            TableSchemaDocumentation, strict=True
+        user_prompt = HumanMessage(
+            content=user_prompt_template.format(table_json=table_json)
         )
 
         # decision = structured_llm.invoke([system_prompt, user_prompt, db_schema_json])
-        decision = structured_llm.invoke([system_prompt, user_prompt])
+        decision = structured_llm.invoke(
+            [system_prompt, user_prompt], config=usage_config("transform_schema_to_text")
+        )
         try:
             table_doc = TableSchemaDocumentation.model_validate(decision)
             validated_tables.append(table_doc)
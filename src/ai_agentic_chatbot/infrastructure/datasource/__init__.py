@@ -5,6 +5,7 @@ from .factory import (
     DataSourceConfiguration,
     get_datasource_factory,
     get_engine,
+    get_async_engine,
     get_session,
     register_mysql_datasource,
     register_postgresql_datasource,
@@ -15,6 +16,7 @@ __all__ = [
     "DataSourceConfiguration", 
     "get_datasource_factory",
     "get_engine",
+    "get_async_engine",
     "get_session",
     "register_mysql_datasource",
     "register_postgresql_datasource",
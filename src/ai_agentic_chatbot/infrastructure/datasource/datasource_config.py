@@ -1,5 +1,6 @@
 """Datasource configuration models for multiple database providers."""
 
+import ssl
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any, Union
 from pydantic import BaseModel, Field, field_validator
@@ -41,6 +42,14 @@ class BaseDatasourceConfig(BaseModel, ABC):
         """Get SQLAlchemy engine initialization arguments."""
         pass
 
+    def get_async_connection_string(self) -> str:
+        """Get database connection string for an asyncio driver."""
+        raise ValueError(f"{type(self).__name__} has no async driver")
+
+    def get_async_engine_kwargs(self) -> Dict[str, Any]:
+        """Get SQLAlchemy async engine initialization arguments."""
+        raise ValueError(f"{type(self).__name__} has no async driver")
+
     class Config:
         frozen = True
         extra = "forbid"
@@ -84,6 +93,27 @@ class MySQLConfig(BaseDatasourceConfig):
             },
         }
 
+    def get_async_connection_string(self) -> str:
+        """Get MySQL connection string for aiomysql."""
+        return f"mysql+aiomysql://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+    def get_async_engine_kwargs(self) -> Dict[str, Any]:
+        """Get MySQL async engine initialization arguments."""
+        connect_args: Dict[str, Any] = {
+            "connect_timeout": self.connect_timeout,
+            "charset": self.charset,
+        }
+        if self.ssl_ca:
+            # aiomysql takes an SSLContext rather than certificate paths
+            connect_args["ssl"] = ssl.create_default_context(cafile=self.ssl_ca)
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "connect_args": connect_args,
+        }
+
 
 class PostgreSQLConfig(BaseDatasourceConfig):
     """Configuration for PostgreSQL databases."""
@@ -111,6 +141,24 @@ class PostgreSQLConfig(BaseDatasourceConfig):
             },
         }
 
+    def get_async_connection_string(self) -> str:
+        """Get PostgreSQL connection string for asyncpg."""
+        return f"postgresql+asyncpg://{self.username}:{self.password}@{self.host}:{self.port}/{self.database}"
+
+    def get_async_engine_kwargs(self) -> Dict[str, Any]:
+        """Get PostgreSQL async engine initialization arguments."""
+        return {
+            "pool_size": self.pool_size,
+            "max_overflow": self.max_overflow,
+            "pool_timeout": self.pool_timeout,
+            "pool_recycle": self.pool_recycle,
+            "connect_args": {
+                "timeout": self.connect_timeout,
+                "ssl": self.sslmode,
+                "server_settings": {"application_name": self.application_name},
+            },
+        }
+
 
 class AzureSQLConfig(BaseDatasourceConfig):
     """Configuration for Azure SQL Database."""
@@ -3,6 +3,7 @@
 from typing import Dict, Optional, Any
 from threading import Lock
 from sqlalchemy import create_engine, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 
 from .datasource_config import (
@@ -49,6 +50,7 @@ class DataSourceFactory:
         """Initialize the factory if not already done."""
         if not getattr(self, "_initialized", False):
             self._engines: Dict[str, Engine] = {}
+            self._async_engines: Dict[str, AsyncEngine] = {}
             self._session_makers: Dict[str, sessionmaker] = {}
             self._configurations: Dict[str, DataSourceConfiguration] = {}
             self._initialized = True
@@ -101,6 +103,39 @@ class DataSourceFactory:
 
         return engine
 
+    def get_async_engine(self, datasource_name: str) -> AsyncEngine:
+        """
+        Get a SQLAlchemy async engine (aiomysql/asyncpg) for the specified datasource.
+
+        Pooled connections belong to the event loop that opened them, so the
+        engine is meant to be used from the application's serving loop.
+
+        Args:
+            datasource_name: Name of the registered datasource
+
+        Returns:
+            AsyncEngine: SQLAlchemy async engine instance
+
+        Raises:
+            ValueError: If datasource is not registered or its provider has
+                no async driver
+        """
+        if datasource_name not in self._configurations:
+            raise ValueError(f"Datasource '{datasource_name}' is not registered")
+
+        if datasource_name in self._async_engines:
+            return self._async_engines[datasource_name]
+
+        config_obj = self._configurations[datasource_name]
+        connection_string = config_obj.config.get_async_connection_string()
+        engine_kwargs = config_obj.config.get_async_engine_kwargs()
+
+        engine = create_async_engine(connection_string, **engine_kwargs)
+
+        self._async_engines[datasource_name] = engine
+
+        return engine
+
     def get_session(self, datasource_name: str) -> Session:
         """
         Get a SQLAlchemy session for the specified datasource.
@@ -182,6 +217,13 @@ class DataSourceFactory:
         self._engines.clear()
         self._session_makers.clear()
 
+    async def close_all_async_connections(self):
+        """Close all async database connections and clear cache."""
+        for engine in self._async_engines.values():
+            await engine.dispose()
+
+        self._async_engines.clear()
+
     def test_connection(self, datasource_name: str) -> bool:
         """
         Test connection to a datasource.
@@ -231,6 +273,24 @@ def get_engine(datasource_name: str) -> Engine:
     return get_datasource_factory().get_engine(datasource_name)
 
 
+def get_async_engine(datasource_name: str) -> AsyncEngine:
+    """
+    Convenience function to get a SQLAlchemy async engine.
+
+    Args:
+        datasource_name: Name of the registered datasource
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine instance
+
+    Example:
+        >>> engine = get_async_engine("primary_db")
+        >>> async with engine.connect() as conn:
+        ...     result = await conn.execute(text("SELECT * FROM users"))
+    """
+    return get_datasource_factory().get_async_engine(datasource_name)
+
+
 def get_session(datasource_name: str) -> Session:
     """
     Convenience function to get a SQLAlchemy session.
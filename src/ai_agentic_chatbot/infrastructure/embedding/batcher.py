@@ -0,0 +1,155 @@
+"""Micro-batching wrapper that coalesces concurrent embed_query calls."""
+
+import asyncio
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.embeddings import Embeddings
+
+from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
+    get_azure_openai_embedding,
+    get_embedding_model_name,
+)
+from ai_agentic_chatbot.infrastructure.embedding.settings import (
+    get_embedding_settings,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class EmbeddingBatcher(Embeddings):
+    """
+    Collects ``embed_query`` calls for up to ``max_wait_ms`` or
+    ``max_batch_size`` items and sends them as one ``embed_documents`` request.
+
+    Sync callers block on their own future; async callers await it without
+    holding the event loop. Up to ``max_concurrent_batches`` requests are in
+    flight at once. ``embed_documents`` calls pass straight through.
+    """
+
+    def __init__(
+        self,
+        embedding: Embeddings,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+        max_concurrent_batches: int = 4,
+    ):
+        self.embedding = embedding
+        self.model = get_embedding_model_name(embedding)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_batches, thread_name_prefix="embedding-batch"
+        )
+        self._worker: Optional[Thread] = None
+        self._worker_lock = Lock()
+
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, text: str) -> Future:
+        """Queue a query for the next batch."""
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((text, future))
+        return future
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.submit(text).result()
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return await asyncio.wrap_future(self.submit(text))
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embedding.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embedding.aembed_documents(texts)
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+        }
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = Thread(
+                    target=self._run, name="embedding-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch: List[Tuple[str, Future]]) -> None:
+        # Identical concurrent queries are embedded once
+        texts = list(dict.fromkeys(text for text, _ in batch))
+
+        try:
+            vectors = self.embedding.embed_documents(texts)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"Embedding returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+        except Exception as e:
+            logger.error(f"Embedding batch of {len(texts)} failed: {e}")
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, vectors))
+        for text, future in batch:
+            try:
+                future.set_result(by_text[text])
+            except Exception as e:
+                # Never leave a caller blocked on an unresolved future
+                if not future.done():
+                    future.set_exception(e)
+
+        self.batches += 1
+        self.items += len(batch)
+        logger.debug(f"Embedded batch of {len(texts)} unique / {len(batch)} queries")
+
+
+_batcher: Optional[EmbeddingBatcher] = None
+_batcher_lock = Lock()
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    """Get the process-wide embedding batcher around the configured client."""
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                settings = get_embedding_settings().batching
+                _batcher = EmbeddingBatcher(
+                    get_azure_openai_embedding(),
+                    max_batch_size=settings.max_batch_size,
+                    max_wait_ms=settings.max_wait_ms,
+                    max_concurrent_batches=settings.max_concurrent_batches,
+                )
+    return _batcher
@@ -1,13 +1,47 @@
 import os
+from threading import Lock
+from typing import Optional
 
 from dotenv import load_dotenv
+from langchain_core.embeddings import Embeddings
 from langchain_openai import AzureOpenAIEmbeddings
 
+from ai_agentic_chatbot.infrastructure.embedding.http_pool import (
+    get_async_http_client,
+    get_http_client,
+)
+from ai_agentic_chatbot.infrastructure.llm.factory import get_llm_factory
+
 load_dotenv()
 
 
-def get_azure_openai_embedding():
-    """Create Azure OpenAI embedding client."""
+_embedding: Optional[Embeddings] = None
+_embedding_lock = Lock()
+
+
+def get_azure_openai_embedding() -> Embeddings:
+    """
+    Get the process-wide embedding client.
+
+    Uses the ``llm.azure_openai.embedding`` model from config.yaml when present
+    (cached by the LLM factory), otherwise the EMBEDDING_* environment
+    variables. Either way the client is built once and shares the keep-alive
+    HTTP pool.
+    """
+    global _embedding
+    if _embedding is None:
+        with _embedding_lock:
+            if _embedding is None:
+                factory = get_llm_factory()
+                if factory.has_embedding_model():
+                    _embedding = factory.get_embedding()
+                else:
+                    _embedding = _create_env_embedding()
+    return _embedding
+
+
+def _create_env_embedding() -> AzureOpenAIEmbeddings:
+    """Create Azure OpenAI embedding client from EMBEDDING_* environment variables."""
     model = os.getenv("EMBEDDING_MODEL_NAME")
     api_key = (os.getenv("EMBEDDING_API_KEY"))
     endpoint = os.getenv("EMBEDDING_ENDPOINT")
@@ -20,6 +54,19 @@ def get_azure_openai_embedding():
         azure_endpoint=endpoint,
         api_key=api_key,
         openai_api_version=api_version,
+        timeout=float(timeout) if timeout else None,
+        max_retries=int(max_retries) if max_retries else 2,
+        http_client=get_http_client(),
+        http_async_client=get_async_http_client(),
     )
 
     return embeddings
+
+
+def get_embedding_model_name(embedding: Embeddings) -> str:
+    """Best-effort name of the model behind a LangChain embedding client."""
+    return (
+        getattr(embedding, "deployment", None)
+        or getattr(embedding, "model", None)
+        or type(embedding).__name__
+    )
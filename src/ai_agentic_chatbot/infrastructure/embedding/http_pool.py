@@ -0,0 +1,56 @@
+"""Shared keep-alive HTTP connection pool for embedding clients."""
+
+from threading import Lock
+from typing import Optional
+
+import httpx
+
+from ai_agentic_chatbot.infrastructure.embedding.settings import (
+    get_embedding_settings,
+)
+
+_http_client: Optional[httpx.Client] = None
+_async_http_client: Optional[httpx.AsyncClient] = None
+_pool_lock = Lock()
+
+
+def _get_limits() -> httpx.Limits:
+    settings = get_embedding_settings().http
+    return httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+    )
+
+
+def get_http_client() -> httpx.Client:
+    """Get the process-wide sync HTTP client (connections are reused across requests)."""
+    global _http_client
+    if _http_client is None:
+        with _pool_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(limits=_get_limits())
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """Get the process-wide async HTTP client."""
+    global _async_http_client
+    if _async_http_client is None:
+        with _pool_lock:
+            if _async_http_client is None:
+                _async_http_client = httpx.AsyncClient(limits=_get_limits())
+    return _async_http_client
+
+
+async def close_http_clients() -> None:
+    """Close the shared HTTP clients (application shutdown)."""
+    global _http_client, _async_http_client
+    with _pool_lock:
+        http_client, _http_client = _http_client, None
+        async_http_client, _async_http_client = _async_http_client, None
+
+    if http_client is not None:
+        http_client.close()
+    if async_http_client is not None:
+        await async_http_client.aclose()
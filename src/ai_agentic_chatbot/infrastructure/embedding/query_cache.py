@@ -0,0 +1,201 @@
+"""Bounded LRU/TTL cache for query embeddings with an optional SQLite tier."""
+
+import hashlib
+import re
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
+    get_embedding_model_name,
+)
+from ai_agentic_chatbot.infrastructure.embedding.settings import (
+    get_embedding_settings,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_SQLITE_PATH = BASE_DIR / "temp" / "query_embedding_cache.sqlite3"
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING_PUNCTUATION = re.compile(r"[\s?!.]+$")
+
+
+def normalize_query(query: str) -> str:
+    """Normalize query text so trivially different phrasings share a cache entry."""
+    normalized = unicodedata.normalize("NFKC", query).casefold()
+    normalized = _WHITESPACE.sub(" ", normalized).strip()
+    return _TRAILING_PUNCTUATION.sub("", normalized)
+
+
+class QueryEmbeddingCache:
+    """
+    Thread-safe LRU cache of query embeddings keyed by model + normalized text.
+
+    Entries expire after ``ttl_seconds``. When ``sqlite_path`` is set, misses
+    fall through to a SQLite table before calling the embedding client, so
+    repeated queries survive process restarts.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2048,
+        ttl_seconds: float = 86400,
+        sqlite_path: Optional[Path] = None,
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+
+        self._entries: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._lock = Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = Lock()
+        if sqlite_path is not None:
+            self._db = self._open_db(Path(sqlite_path))
+
+    @staticmethod
+    def make_key(query: str, model_name: str) -> str:
+        normalized = normalize_query(query)
+        return hashlib.sha256(f"{model_name}\x00{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[float]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, vector = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return vector
+                del self._entries[key]
+
+        vector = self._db_get(key, now)
+        with self._lock:
+            if vector is not None:
+                self.disk_hits += 1
+                self._put_memory(key, vector, now)
+            else:
+                self.misses += 1
+        return vector
+
+    def put(self, key: str, vector: List[float]) -> None:
+        now = time.time()
+        with self._lock:
+            self._put_memory(key, vector, now)
+        self._db_put(key, vector, now)
+
+    def embed_query(self, embedding: Embeddings, query: str) -> List[float]:
+        """Return the cached embedding for ``query``, embedding it on a miss."""
+        key = self.make_key(query, get_embedding_model_name(embedding))
+
+        vector = self.get(key)
+        if vector is None:
+            vector = embedding.embed_query(query)
+            self.put(key, vector)
+
+        logger.debug(f"Query embedding cache: {self.stats()}")
+        return vector
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._db is not None:
+            with self._db_lock, self._db:
+                self._db.execute("DELETE FROM query_embeddings")
+
+    def _put_memory(self, key: str, vector: List[float], now: float) -> None:
+        self._entries[key] = (now + self.ttl_seconds, vector)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _open_db(self, path: Path) -> sqlite3.Connection:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False)
+        with db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                "  key TEXT PRIMARY KEY,"
+                "  vector BLOB NOT NULL,"
+                "  created_at REAL NOT NULL"
+                ")"
+            )
+        return db
+
+    def _db_get(self, key: str, now: float) -> Optional[List[float]]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT vector FROM query_embeddings WHERE key = ? AND created_at > ?",
+                    (key, now - self.ttl_seconds),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Query embedding cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        return np.frombuffer(row[0], dtype="<f8").tolist()
+
+    def _db_put(self, key: str, vector: List[float], now: float) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock, self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (key, vector, created_at) "
+                    "VALUES (?, ?, ?)",
+                    (key, np.asarray(vector, dtype="<f8").tobytes(), now),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Query embedding cache write failed: {e}")
+
+
+_cache: Optional[QueryEmbeddingCache] = None
+_cache_lock = Lock()
+
+
+def get_query_embedding_cache() -> QueryEmbeddingCache:
+    """Get the process-wide query embedding cache, configured from config.yaml."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                settings = get_embedding_settings().query_cache
+                sqlite_path = None
+                if settings.persist:
+                    sqlite_path = Path(settings.sqlite_path or DEFAULT_SQLITE_PATH)
+                _cache = QueryEmbeddingCache(
+                    max_size=settings.max_size,
+                    ttl_seconds=settings.ttl_seconds,
+                    sqlite_path=sqlite_path,
+                )
+    return _cache
@@ -0,0 +1,105 @@
+"""Embedding settings loaded from the ``embedding`` section of config.yaml."""
+
+import os
+import yaml
+from pathlib import Path
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, Field
+
+
+class QueryCacheSettings(BaseModel):
+    """Query embedding cache settings."""
+
+    max_size: int = Field(default=2048, description="Max in-memory entries (LRU)")
+    ttl_seconds: float = Field(default=86400, description="Entry time to live")
+    persist: bool = Field(
+        default=False, description="Keep a SQLite tier that survives restarts"
+    )
+    sqlite_path: Optional[str] = Field(
+        default=None, description="SQLite file (defaults to temp/)"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class BatchingSettings(BaseModel):
+    """Query embedding micro-batching settings."""
+
+    enabled: bool = Field(default=True, description="Coalesce concurrent queries")
+    max_batch_size: int = Field(default=64, description="Flush at this many queries")
+    max_wait_ms: float = Field(default=5.0, description="Flush after this window")
+    max_concurrent_batches: int = Field(
+        default=4, description="Batches in flight at once"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class HttpPoolSettings(BaseModel):
+    """Keep-alive HTTP pool shared by embedding clients."""
+
+    max_connections: int = Field(default=20, description="Max open connections")
+    max_keepalive_connections: int = Field(
+        default=10, description="Idle connections kept alive"
+    )
+    keepalive_expiry: float = Field(
+        default=60.0, description="Seconds an idle connection is kept"
+    )
+
+    class Config:
+        frozen = True
+        extra = "forbid"
+
+
+class EmbeddingSettings(BaseModel):
+    """Global embedding settings."""
+
+    query_cache: QueryCacheSettings = Field(default_factory=QueryCacheSettings)
+    batching: BatchingSettings = Field(default_factory=BatchingSettings)
+    http: HttpPoolSettings = Field(default_factory=HttpPoolSettings)
+
+    @classmethod
+    def from_config_file(cls, config_path: Optional[Path] = None) -> "EmbeddingSettings":
+        """Load embedding settings from config.yaml with environment variable overrides."""
+        if config_path is None:
+            project_root = Path(__file__).resolve().parent.parent.parent.parent.parent
+            config_path = project_root / "config.yaml"
+
+        config_data: Dict[str, Any] = {}
+        if config_path.exists():
+            with open(config_path, "r") as f:
+                config_data = yaml.safe_load(f) or {}
+
+        return cls._parse_config(config_data)
+
+    @classmethod
+    def _parse_config(cls, config_data: Dict[str, Any]) -> "EmbeddingSettings":
+        """Parse configuration data into EmbeddingSettings object."""
+        embedding_config = dict(config_data.get("embedding") or {})
+
+        query_cache = dict(embedding_config.get("query_cache") or {})
+        if "EMBEDDING_CACHE_PATH" in os.environ:
+            query_cache["persist"] = True
+            query_cache["sqlite_path"] = os.environ["EMBEDDING_CACHE_PATH"]
+        embedding_config["query_cache"] = query_cache
+
+        return cls(**embedding_config)
+
+    class Config:
+        extra = "forbid"
+
+
+# Global settings instance
+_settings: Optional[EmbeddingSettings] = None
+
+
+def get_embedding_settings() -> EmbeddingSettings:
+    """Get the global embedding settings instance."""
+    global _settings
+    if _settings is None:
+        _settings = EmbeddingSettings.from_config_file()
+    return _settings
@@ -6,6 +6,11 @@ from langchain_core.language_models import BaseChatModel
 from langchain_core.embeddings import Embeddings
 from langchain_openai import AzureChatOpenAI, ChatOpenAI, AzureOpenAIEmbeddings
 
+from ai_agentic_chatbot.infrastructure.embedding.http_pool import (
+    get_async_http_client,
+    get_http_client,
+)
+
 from .config import AzureOpenAIConfig, AzureOpenAIEmbeddingConfig
 from .settings import get_settings, ModelConfiguration
 from .types import LLMProvider, ModelType
@@ -111,16 +116,20 @@ class LLMFactory:
         if model_key in self._embeddings:
             return self._embeddings[model_key]
 
-        # Get embedding configuration from settings
-        embedding_config = self._get_embedding_config(
-            provider or LLMProvider.AZURE_OPENAI
-        )
-        embedding_client = self._create_embedding_client(
-            provider or LLMProvider.AZURE_OPENAI, embedding_config
-        )
+        with self._lock:
+            if model_key in self._embeddings:
+                return self._embeddings[model_key]
 
-        self._embeddings[model_key] = embedding_client
-        return embedding_client
+            # Get embedding configuration from settings
+            embedding_config = self._get_embedding_config(
+                provider or LLMProvider.AZURE_OPENAI
+            )
+            embedding_client = self._create_embedding_client(
+                provider or LLMProvider.AZURE_OPENAI, embedding_config
+            )
+
+            self._embeddings[model_key] = embedding_client
+            return embedding_client
 
     def _get_embedding_config(
         self, provider: LLMProvider
@@ -129,7 +138,10 @@ class LLMFactory:
         if provider == LLMProvider.AZURE_OPENAI:
             # Get embedding config from settings
             embedding_model_config = self._settings.get_model_config("embedding")
-            config_data = embedding_model_config.config.model_dump()
+            # The model block is parsed as a chat config; keep only embedding fields
+            config_data = embedding_model_config.config.model_dump(
+                include=set(AzureOpenAIEmbeddingConfig.model_fields)
+            )
             return AzureOpenAIEmbeddingConfig(**config_data)
         else:
             raise ValueError(f"Unsupported provider for embeddings: {provider}")
@@ -146,8 +158,16 @@ class LLMFactory:
     def _create_azure_openai_embedding_client(
         self, config: AzureOpenAIEmbeddingConfig
     ) -> AzureOpenAIEmbeddings:
-        """Create Azure OpenAI embedding client."""
-        return AzureOpenAIEmbeddings(**config.get_client_kwargs())
+        """Create Azure OpenAI embedding client on the shared keep-alive HTTP pool."""
+        return AzureOpenAIEmbeddings(
+            **config.get_client_kwargs(),
+            http_client=get_http_client(),
+            http_async_client=get_async_http_client(),
+        )
+
+    def has_embedding_model(self) -> bool:
+        """Whether an embedding model is configured in config.yaml."""
+        return "embedding" in self._settings.models
 
     def get_available_models(self) -> list[str]:
         """Get list of available model keys."""
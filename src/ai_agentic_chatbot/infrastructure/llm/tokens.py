@@ -0,0 +1,72 @@
+"""Approximate prompt token counting for budget enforcement."""
+
+from functools import lru_cache
+from typing import Iterable, Optional
+
+from langchain_core.messages import BaseMessage
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_ENCODING = "o200k_base"
+
+# Per-message overhead of the chat format (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(name: str):
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding(name)
+    except Exception as e:
+        # tiktoken missing or its BPE file not downloadable (offline)
+        logger.warning(f"Token encoding {name} unavailable, estimating by length: {e}")
+        return None
+
+
+def count_tokens(text: str, encoding: str = DEFAULT_ENCODING) -> int:
+    """Token count of ``text``; falls back to ~4 characters per token."""
+    if not text:
+        return 0
+    enc = _get_encoding(encoding)
+    if enc is None:
+        return (len(text) + 3) // 4
+    return len(enc.encode(text, disallowed_special=()))
+
+
+def truncate_to_tokens(text: str, max_tokens: int, encoding: str = DEFAULT_ENCODING) -> str:
+    """Cut ``text`` to at most ``max_tokens`` tokens."""
+    if max_tokens <= 0:
+        return ""
+    enc = _get_encoding(encoding)
+    if enc is None:
+        return text[: max_tokens * 4]
+    tokens = enc.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return enc.decode(tokens[:max_tokens])
+
+
+def _message_text(message: BaseMessage) -> str:
+    content = message.content
+    if isinstance(content, str):
+        return content
+    # Multimodal content blocks: count the text parts only
+    return " ".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def count_message_tokens(
+    messages: Iterable[BaseMessage], encoding: Optional[str] = None
+) -> int:
+    """Approximate prompt tokens of a list of chat messages."""
+    return sum(
+        count_tokens(_message_text(message), encoding or DEFAULT_ENCODING)
+        + MESSAGE_OVERHEAD_TOKENS
+        for message in messages
+    )
@@ -0,0 +1,119 @@
+"""Token and prompt-cache usage recording for LLM call sites."""
+
+from dataclasses import asdict, dataclass
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import RunnableConfig
+
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CallSiteUsage:
+    """Accumulated token usage of one LLM call site."""
+
+    calls: int = 0
+    prompt_tokens: int = 0
+    cached_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def cached_ratio(self) -> float:
+        return self.cached_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+
+def extract_token_usage(response: LLMResult) -> Tuple[int, int, int]:
+    """(prompt_tokens, cached_tokens, completion_tokens) from an LLM response."""
+    for generations in response.generations:
+        for generation in generations:
+            message = getattr(generation, "message", None)
+            usage = getattr(message, "usage_metadata", None)
+            if usage:
+                details = usage.get("input_token_details") or {}
+                return (
+                    usage.get("input_tokens", 0),
+                    details.get("cache_read", 0) or 0,
+                    usage.get("output_tokens", 0),
+                )
+
+    token_usage = (response.llm_output or {}).get("token_usage") or {}
+    details = token_usage.get("prompt_tokens_details") or {}
+    return (
+        token_usage.get("prompt_tokens", 0),
+        details.get("cached_tokens", 0) or 0,
+        token_usage.get("completion_tokens", 0),
+    )
+
+
+_usage: Dict[str, CallSiteUsage] = {}
+_usage_lock = Lock()
+
+
+def record_usage(
+    call_site: str, prompt_tokens: int, cached_tokens: int, completion_tokens: int
+) -> None:
+    with _usage_lock:
+        usage = _usage.setdefault(call_site, CallSiteUsage())
+        usage.calls += 1
+        usage.prompt_tokens += prompt_tokens
+        usage.cached_tokens += cached_tokens
+        usage.completion_tokens += completion_tokens
+
+
+def get_usage_stats() -> Dict[str, Dict[str, Any]]:
+    """Usage per call site, including the share of prompt tokens served from cache."""
+    with _usage_lock:
+        return {
+            call_site: {**asdict(usage), "cached_ratio": usage.cached_ratio}
+            for call_site, usage in _usage.items()
+        }
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """Records prompt, cached and completion tokens of every call at a call site."""
+
+    def __init__(self, call_site: str):
+        self.call_site = call_site
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        prompt_tokens, cached_tokens, completion_tokens = extract_token_usage(response)
+        record_usage(self.call_site, prompt_tokens, cached_tokens, completion_tokens)
+        logger.debug(
+            f"[LLM usage] {self.call_site}: prompt={prompt_tokens} "
+            f"cached={cached_tokens} completion={completion_tokens}"
+        )
+
+
+class TokenUsageCollector(BaseCallbackHandler):
+    """Collects token usage of the calls made with it (e.g. one request's calls)."""
+
+    def __init__(self):
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        prompt_tokens, cached_tokens, completion_tokens = extract_token_usage(response)
+        self.prompt_tokens += prompt_tokens
+        self.cached_tokens += cached_tokens
+        self.completion_tokens += completion_tokens
+
+
+_handlers: Dict[str, UsageCallbackHandler] = {}
+
+
+def usage_config(call_site: str, config: Optional[RunnableConfig] = None) -> RunnableConfig:
+    """Runnable config that records token usage under ``call_site``."""
+    handler = _handlers.get(call_site)
+    if handler is None:
+        handler = _handlers.setdefault(call_site, UsageCallbackHandler(call_site))
+
+    config = dict(config or {})
+    config["callbacks"] = [*(config.get("callbacks") or []), handler]
+    config.setdefault("run_name", call_site)
+    return config
@@ -1,10 +1,21 @@
-from typing import List, Dict
+import json
+from threading import Lock
+from typing import List, Dict, Optional, Tuple
 
 from langchain_core.documents import Document
 from langchain_postgres import PGVector
+from sqlalchemy import text
 
 from ai_agentic_chatbot.infrastructure.datasource import get_engine
 from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import get_azure_openai_embedding
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SUBDOC_OBJECT_TYPE = "table_subdoc"
+
+# pgvector's default hnsw.ef_search; an HNSW scan never returns more rows
+HNSW_DEFAULT_EF_SEARCH = 40
 
 
 class PgVectorSchemaStore:
@@ -12,6 +23,7 @@ class PgVectorSchemaStore:
     Infrastructure service responsible for:
     - Embedding schema text
     - Storing vectors in PostgreSQL (pgvector)
+    - ANN search over table sub-documents for online retrieval
     """
 
     def __init__(
@@ -19,17 +31,21 @@ class PgVectorSchemaStore:
             connection_string: str,
             collection_name: str = "db_schema_vectors",
             embedding_model: str = "text-embedding-3-small",
+            datasource: str = "postgresql.primary",
+            embedding_dimensions: Optional[int] = None,
     ):
         # self._embedding = OpenAIEmbeddings(model=embedding_model)
         # self._embedding = get_embedding(provider=LLMProvider.AZURE_OPENAI,model=ModelType.EMBEDDING)
 
-        self._engine = get_engine("postgresql.primary")
+        self._engine = get_engine(datasource)
+        self._iterative_scan: Optional[bool] = None
         self._embedding = get_azure_openai_embedding()
 
         self._vectorstore = PGVector(
             connection=self._engine,
             collection_name=collection_name,
             embeddings=self._embedding,
+            embedding_length=embedding_dimensions,
         )
 
     def ingest(self, table_chunks: List[Dict]) -> None:
@@ -44,3 +60,215 @@ class PgVectorSchemaStore:
             )
 
         self._vectorstore.add_documents(documents)
+
+    def ingest_sub_documents(
+            self,
+            sub_documents: List[Tuple[str, str, str]],
+            vectors: List[List[float]],
+            ddl_by_table: Dict[str, str],
+            related_tables: Dict[str, List[str]],
+            database: str,
+            schema_version: str,
+    ) -> None:
+        """
+        Store precomputed (table_name, kind, text) sub-document vectors.
+
+        Each row carries the table DDL and related table names in its metadata
+        so retrieval never needs the table docs in process.
+
+        Previous sub-documents of the same database are replaced, so the ANN
+        index only ever holds the current schema. Vectors are reused as-is;
+        nothing is re-embedded.
+        """
+        self._delete_sub_documents(database)
+
+        metadatas = [
+            {
+                "database": database,
+                "schema_version": schema_version,
+                "table_name": table_name,
+                "kind": kind,
+                "ddl": ddl_by_table.get(table_name, ""),
+                "related_tables": related_tables.get(table_name, []),
+                "object_type": SUBDOC_OBJECT_TYPE,
+            }
+            for table_name, kind, _ in sub_documents
+        ]
+        ids = [
+            f"{database}:{schema_version}:{SUBDOC_OBJECT_TYPE}:{position}"
+            for position in range(len(sub_documents))
+        ]
+
+        self._vectorstore.add_embeddings(
+            texts=[text_ for _, _, text_ in sub_documents],
+            embeddings=vectors,
+            metadatas=metadatas,
+            ids=ids,
+        )
+        logger.info(
+            f"Stored {len(sub_documents)} sub-document vectors for {database} ({schema_version})"
+        )
+
+    def search_sub_documents(
+            self,
+            query_vector: List[float],
+            k: int,
+            database: Optional[str] = None,
+            schema_version: Optional[str] = None,
+            ivfflat_probes: int = 10,
+    ) -> List[Tuple[Dict, float]]:
+        """
+        ANN search over table sub-documents.
+
+        An HNSW scan returns at most ``hnsw.ef_search`` rows and the metadata
+        filter is applied after it, so the search runs in its own transaction
+        with ``ef_search`` raised to ``k`` and ``ivfflat.probes`` set. On
+        pgvector >= 0.8 iterative scans are enabled as well, so rows removed
+        by the filter are replaced instead of shrinking the candidate set.
+
+        Returns (metadata, cosine_similarity) pairs, nearest first.
+        """
+        metadata_filter = {"object_type": SUBDOC_OBJECT_TYPE}
+        if database:
+            metadata_filter["database"] = database
+        if schema_version:
+            metadata_filter["schema_version"] = schema_version
+
+        with self._engine.begin() as conn:
+            conn.execute(
+                text(f"SET LOCAL hnsw.ef_search = {max(int(k), HNSW_DEFAULT_EF_SEARCH)}")
+            )
+            conn.execute(text(f"SET LOCAL ivfflat.probes = {int(ivfflat_probes)}"))
+            if self._supports_iterative_scan(conn):
+                conn.execute(text("SET LOCAL hnsw.iterative_scan = strict_order"))
+                conn.execute(text("SET LOCAL ivfflat.iterative_scan = relaxed_order"))
+
+            rows = conn.execute(
+                text(
+                    "SELECT cmetadata, embedding <=> CAST(:embedding AS vector) AS distance "
+                    "FROM langchain_pg_embedding "
+                    "WHERE collection_id = ("
+                    "  SELECT uuid FROM langchain_pg_collection WHERE name = :collection"
+                    ") "
+                    "AND cmetadata @> CAST(:filter AS jsonb) "
+                    "ORDER BY embedding <=> CAST(:embedding AS vector) "
+                    "LIMIT :k"
+                ),
+                {
+                    "embedding": json.dumps([float(value) for value in query_vector]),
+                    "collection": self._vectorstore.collection_name,
+                    "filter": json.dumps(metadata_filter),
+                    "k": int(k),
+                },
+            ).all()
+
+        # Relaxed ivfflat ordering can be slightly off; cosine distance -> similarity
+        return [
+            (metadata, 1.0 - distance)
+            for metadata, distance in sorted(rows, key=lambda row: row[1])
+        ]
+
+    def _supports_iterative_scan(self, conn) -> bool:
+        """Whether the installed pgvector (>= 0.8) has iterative index scans."""
+        if self._iterative_scan is None:
+            version = conn.execute(
+                text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+            ).scalar()
+            try:
+                major, minor = (int(part) for part in str(version).split(".")[:2])
+                self._iterative_scan = (major, minor) >= (0, 8)
+            except ValueError:
+                self._iterative_scan = False
+        return self._iterative_scan
+
+    def ensure_ann_index(self, index_type: str = "hnsw", ivfflat_lists: int = 100) -> None:
+        """
+        Create the ANN index on the embedding column and a metadata index for filters.
+
+        Requires a fixed-dimension embedding column (``embedding_dimensions``).
+        """
+        if not self._has_fixed_dimensions():
+            raise RuntimeError(
+                "langchain_pg_embedding.embedding has no fixed dimension, so it cannot "
+                f"hold a {index_type} index. The collection was created without "
+                "embedding_dimensions; drop it and recreate it with "
+                "retrieval.embedding_dimensions set."
+            )
+
+        if index_type == "hnsw":
+            ann_ddl = (
+                "CREATE INDEX IF NOT EXISTS ix_langchain_pg_embedding_hnsw "
+                "ON langchain_pg_embedding USING hnsw (embedding vector_cosine_ops)"
+            )
+        elif index_type == "ivfflat":
+            ann_ddl = (
+                "CREATE INDEX IF NOT EXISTS ix_langchain_pg_embedding_ivfflat "
+                "ON langchain_pg_embedding USING ivfflat (embedding vector_cosine_ops) "
+                f"WITH (lists = {int(ivfflat_lists)})"
+            )
+        else:
+            raise ValueError(f"Unsupported ANN index type: {index_type}")
+
+        metadata_ddl = (
+            "CREATE INDEX IF NOT EXISTS ix_langchain_pg_embedding_cmetadata "
+            "ON langchain_pg_embedding USING gin (cmetadata jsonb_path_ops)"
+        )
+
+        with self._engine.begin() as conn:
+            conn.execute(text(ann_ddl))
+            conn.execute(text(metadata_ddl))
+
+        logger.info(f"Ensured {index_type} ANN index on langchain_pg_embedding")
+
+    def _has_fixed_dimensions(self) -> bool:
+        """Whether the embedding column was created as ``vector(n)`` (typmod set)."""
+        with self._engine.connect() as conn:
+            typmod = conn.execute(
+                text(
+                    "SELECT atttypmod FROM pg_attribute "
+                    "WHERE attrelid = 'langchain_pg_embedding'::regclass "
+                    "AND attname = 'embedding'"
+                )
+            ).scalar()
+        return typmod is not None and typmod > 0
+
+    def _delete_sub_documents(self, database: str) -> None:
+        with self._engine.begin() as conn:
+            conn.execute(
+                text(
+                    "DELETE FROM langchain_pg_embedding "
+                    "WHERE collection_id = ("
+                    "  SELECT uuid FROM langchain_pg_collection WHERE name = :collection"
+                    ") "
+                    "AND cmetadata->>'object_type' = :object_type "
+                    "AND cmetadata->>'database' = :database"
+                ),
+                {
+                    "collection": self._vectorstore.collection_name,
+                    "object_type": SUBDOC_OBJECT_TYPE,
+                    "database": database,
+                },
+            )
+
+
+_store: Optional[PgVectorSchemaStore] = None
+_store_lock = Lock()
+
+
+def get_pgvector_schema_store(
+        collection_name: str = "db_schema_vectors",
+        datasource: str = "postgresql.primary",
+        embedding_dimensions: Optional[int] = None,
+) -> PgVectorSchemaStore:
+    """Get the process-wide store (PGVector setup runs DDL, so build it once)."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = PgVectorSchemaStore(
+                    connection_string="",
+                    collection_name=collection_name,
+                    datasource=datasource,
+                    embedding_dimensions=embedding_dimensions,
+                )
+    return _store
@@ -0,0 +1,230 @@
+"""Persisted embedding index for schema table documents."""
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from typing import Any, Dict, List, Mapping, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from ai_agentic_chatbot.infrastructure.embedding.embedding_connection import (
+    get_azure_openai_embedding,
+    get_embedding_model_name,
+)
+from ai_agentic_chatbot.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+INDEX_DIR = BASE_DIR / "temp" / "embedding_index"
+
+# Sub-document kinds embedded for every table doc
+KIND_QUESTION = "question"
+KIND_PURPOSE = "purpose"
+KIND_SEARCH_TEXT = "search_text"
+KIND_FIELD = "field"
+
+
+@dataclass(frozen=True)
+class SubDocument:
+    """A single embeddable text belonging to a table document."""
+
+    table_name: str
+    kind: str
+    text: str
+
+
+def build_sub_documents(table_docs: Sequence[Mapping[str, Any]]) -> List[SubDocument]:
+    """Split table documents into the texts that are matched against user queries."""
+    sub_documents = []
+
+    for table_doc in table_docs:
+        name = table_doc["name"]
+
+        for question in table_doc.get("example_questions") or []:
+            sub_documents.append(SubDocument(name, KIND_QUESTION, question))
+
+        business_purpose = table_doc.get("business_purpose", "")
+        if business_purpose:
+            sub_documents.append(SubDocument(name, KIND_PURPOSE, business_purpose))
+
+        search_text = table_doc.get("search_text", "")
+        if search_text:
+            sub_documents.append(SubDocument(name, KIND_SEARCH_TEXT, search_text))
+
+        for field in table_doc.get("key_fields") or []:
+            field_meaning = field.get("meaning", "")
+            if field_meaning:
+                sub_documents.append(SubDocument(name, KIND_FIELD, field_meaning))
+
+    return sub_documents
+
+
+def compute_index_key(schema_version: str, content_hash: str, embedding_model: str) -> str:
+    """Key an index by schema version plus the catalog content hash and embedding model."""
+    digest = hashlib.sha256(f"{embedding_model}\x00{content_hash}".encode("utf-8"))
+
+    safe_version = "".join(c if c.isalnum() else "_" for c in schema_version)
+    return f"{safe_version}-{digest.hexdigest()[:16]}"
+
+
+class SchemaEmbeddingIndex:
+    """Precomputed sub-document embeddings held as one contiguous float32 matrix."""
+
+    def __init__(self, key: str, sub_documents: List[SubDocument], matrix: np.ndarray):
+        if len(sub_documents) != len(matrix):
+            raise ValueError("Every sub-document must have exactly one vector")
+
+        self.key = key
+        self.sub_documents = sub_documents
+        self.matrix = np.ascontiguousarray(matrix, dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.sub_documents)
+
+    @property
+    def table_names(self) -> List[str]:
+        return list(dict.fromkeys(sub_doc.table_name for sub_doc in self.sub_documents))
+
+    @classmethod
+    def build(
+        cls,
+        key: str,
+        sub_documents: List[SubDocument],
+        embedding: Embeddings,
+    ) -> "SchemaEmbeddingIndex":
+        """Embed all sub-documents in a single batched call (duplicate texts once)."""
+        unique_texts = list(dict.fromkeys(sub_doc.text for sub_doc in sub_documents))
+
+        logger.info(
+            f"Embedding {len(unique_texts)} unique schema texts "
+            f"({len(sub_documents)} sub-documents) for index {key}"
+        )
+        unique_vectors = embedding.embed_documents(unique_texts) if unique_texts else []
+        vector_by_text = dict(zip(unique_texts, unique_vectors))
+
+        vectors = [vector_by_text[sub_doc.text] for sub_doc in sub_documents]
+        return cls(key, sub_documents, np.array(vectors, dtype=np.float32))
+
+    def save(self, path: Path) -> Path:
+        """Persist the index atomically as JSON with float32 base64 vectors."""
+        payload = {
+            "key": self.key,
+            "entries": [
+                {
+                    "table_name": sub_doc.table_name,
+                    "kind": sub_doc.kind,
+                    "text": sub_doc.text,
+                    "vector": _encode_vector(vector),
+                }
+                for sub_doc, vector in zip(self.sub_documents, self.matrix)
+            ],
+        }
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            mode="w", dir=path.parent, delete=False, encoding="utf-8"
+        ) as tmp_file:
+            json.dump(payload, tmp_file)
+            temp_path = Path(tmp_file.name)
+
+        os.replace(temp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Path) -> "SchemaEmbeddingIndex":
+        """Load a persisted index from disk."""
+        with open(path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+
+        entries = payload["entries"]
+        sub_documents = [
+            SubDocument(entry["table_name"], entry["kind"], entry["text"])
+            for entry in entries
+        ]
+        buffer = b"".join(base64.b64decode(entry["vector"]) for entry in entries)
+        if entries:
+            matrix = np.frombuffer(buffer, dtype="<f4").reshape(len(entries), -1)
+        else:
+            matrix = np.zeros((0, 0), dtype=np.float32)
+
+        return cls(payload["key"], sub_documents, matrix)
+
+
+def _encode_vector(vector: np.ndarray) -> str:
+    return base64.b64encode(vector.astype("<f4").tobytes()).decode("ascii")
+
+
+def get_index_path(key: str) -> Path:
+    return INDEX_DIR / f"{key}.json"
+
+
+_index: Optional[SchemaEmbeddingIndex] = None
+_index_lock = Lock()
+
+
+def load_or_build_index(
+    table_docs: Sequence[Mapping[str, Any]],
+    schema_version: str,
+    content_hash: str,
+    embedding: Embeddings,
+    force_rebuild: bool = False,
+) -> SchemaEmbeddingIndex:
+    """
+    Get the embedding index for the given table docs.
+
+    The index is keyed on the catalog content hash, so a lookup never touches
+    the table docs: the in-memory index (and its sub-documents) is reused while
+    its key matches; otherwise the index is loaded from disk, and sub-documents
+    are only built and embedded when no persisted copy exists.
+    """
+    global _index
+
+    key = compute_index_key(
+        schema_version, content_hash, get_embedding_model_name(embedding)
+    )
+
+    if not force_rebuild and _index is not None and _index.key == key:
+        return _index
+
+    with _index_lock:
+        if not force_rebuild and _index is not None and _index.key == key:
+            return _index
+
+        path = get_index_path(key)
+        if path.exists() and not force_rebuild:
+            try:
+                _index = SchemaEmbeddingIndex.load(path)
+                logger.info(f"Loaded schema embedding index {key} ({len(_index)} vectors)")
+                return _index
+            except Exception as e:
+                logger.warning(f"Could not load embedding index {path}: {e}")
+
+        index = SchemaEmbeddingIndex.build(key, build_sub_documents(table_docs), embedding)
+        index.save(path)
+        logger.info(f"Saved schema embedding index to {path}")
+
+        _index = index
+        return _index
+
+
+def get_schema_embedding_index(
+    embedding: Optional[Embeddings] = None, force_rebuild: bool = False
+) -> SchemaEmbeddingIndex:
+    """Get the embedding index for the currently configured schema."""
+    from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+    catalog = get_schema_catalog()
+    return load_or_build_index(
+        table_docs=catalog.table_docs,
+        schema_version=catalog.schema_version,
+        content_hash=catalog.content_hash,
+        embedding=embedding or get_azure_openai_embedding(),
+        force_rebuild=force_rebuild,
+    )
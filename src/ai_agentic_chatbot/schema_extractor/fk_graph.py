@@ -0,0 +1,119 @@
+"""Foreign-key adjacency index for related-table expansion."""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+from ai_agentic_chatbot.schema_extractor.SchemaModels import ForeignKeySchema
+
+
+@dataclass(frozen=True)
+class ForeignKeyEdge:
+    """A foreign key from ``table.column`` to ``referred_table.referred_column``."""
+
+    table: str
+    column: str
+    referred_table: str
+    referred_column: str
+
+    @classmethod
+    def from_schema(cls, table: str, fk: ForeignKeySchema) -> "ForeignKeyEdge":
+        return cls(table, fk.column, fk.referred_table, fk.referred_column)
+
+
+class ForeignKeyGraph:
+    """
+    Undirected adjacency lists over foreign keys.
+
+    Built once per schema; traversals are breadth-first and bounded by depth,
+    so each touches every edge at most once.
+    """
+
+    def __init__(self, edges: Iterable[ForeignKeyEdge]):
+        self._adjacency: Dict[str, List[Tuple[str, ForeignKeyEdge]]] = {}
+        self.edge_count = 0
+
+        for edge in edges:
+            if edge.table == edge.referred_table:
+                continue
+            self._adjacency.setdefault(edge.table, []).append((edge.referred_table, edge))
+            self._adjacency.setdefault(edge.referred_table, []).append((edge.table, edge))
+            self.edge_count += 1
+
+    @classmethod
+    def from_schema_json(cls, schema_json: Mapping[str, Any]) -> "ForeignKeyGraph":
+        """Build from ``db_schema.json`` (``DatabaseSchema`` as written by SaveSchemaJson)."""
+        edges = []
+        for table in schema_json.get("tables") or []:
+            for fk in table.get("foreign_keys") or []:
+                edges.append(
+                    ForeignKeyEdge.from_schema(
+                        table.get("table_name", ""),
+                        ForeignKeySchema(
+                            column=fk.get("column", ""),
+                            referred_table=fk.get("referred_table", ""),
+                            referred_column=fk.get("referred_column", ""),
+                        ),
+                    )
+                )
+        return cls(edges)
+
+    def __contains__(self, table: str) -> bool:
+        return table in self._adjacency
+
+    def neighbors(self, table: str) -> List[str]:
+        """Tables one foreign key away, in either direction."""
+        return list(dict.fromkeys(neighbor for neighbor, _ in self._adjacency.get(table, [])))
+
+    def edges_between(self, left: str, right: str) -> List[ForeignKeyEdge]:
+        return [edge for neighbor, edge in self._adjacency.get(left, []) if neighbor == right]
+
+    def reachable(self, start: str, max_depth: int) -> Dict[str, str]:
+        """BFS from ``start``: reached table -> parent on a shortest path."""
+        parents = {start: start}
+        frontier = deque([(start, 0)])
+
+        while frontier:
+            table, depth = frontier.popleft()
+            if depth == max_depth:
+                continue
+            for neighbor, _ in self._adjacency.get(table, []):
+                if neighbor not in parents:
+                    parents[neighbor] = table
+                    frontier.append((neighbor, depth + 1))
+
+        return parents
+
+    def join_path(self, start: str, end: str, max_depth: int = 2) -> List[str]:
+        """Shortest join path from ``start`` to ``end`` (inclusive), or [] if none within ``max_depth`` hops."""
+        parents = self.reachable(start, max_depth)
+        if end not in parents:
+            return []
+
+        path = [end]
+        while path[-1] != start:
+            path.append(parents[path[-1]])
+        return path[::-1]
+
+    def bridge_tables(self, tables: List[str], max_depth: int = 2) -> List[str]:
+        """
+        Intermediate tables on shortest join paths between any two of ``tables``.
+
+        These are the tables a query needs to join the given ones but would not
+        be retrieved by similarity alone (e.g. junction tables).
+        """
+        targets = [table for table in dict.fromkeys(tables) if table in self._adjacency]
+        bridges: Dict[str, None] = {}
+
+        for i, start in enumerate(targets):
+            parents = self.reachable(start, max_depth)
+            for end in targets[i + 1:]:
+                if end not in parents:
+                    continue
+                table = parents[end]
+                while table != start:
+                    if table not in targets:
+                        bridges[table] = None
+                    table = parents[table]
+
+        return list(bridges)
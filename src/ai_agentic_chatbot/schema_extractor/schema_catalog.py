@@ -0,0 +1,237 @@
+"""In-memory compiled schema catalog with hot reload."""
+
+import hashlib
+import json
+import os
+import yaml
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from ai_agentic_chatbot.logging_config import get_logger
+from ai_agentic_chatbot.schema_extractor.fk_graph import ForeignKeyGraph
+from ai_agentic_chatbot.schema_extractor.schema_loader import (
+    SchemaLoader,
+    get_schema_loader,
+)
+
+logger = get_logger(__name__)
+
+# (path, mtime_ns, size) per source file; None when the file does not exist
+Fingerprint = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@dataclass(frozen=True)
+class SchemaCatalog:
+    """
+    Immutable snapshot of the parsed schema.
+
+    Table docs are read-only mappings with the same keys as
+    ``SchemaLoader.get_table_docs_for_search``, so they can be shared between
+    requests and threads without copying.
+    """
+
+    content_hash: str
+    database_name: str
+    version: str
+    table_docs: Tuple[Mapping[str, Any], ...]
+    summary: Mapping[str, str]
+    raw_schema: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+    raw_ddl: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))
+    fk_graph: ForeignKeyGraph = field(default_factory=lambda: ForeignKeyGraph([]))
+    tables_by_name: Mapping[str, Mapping[str, Any]] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self,
+            "tables_by_name",
+            MappingProxyType({doc["name"]: doc for doc in self.table_docs}),
+        )
+
+    @property
+    def schema_version(self) -> str:
+        """Version label (database + version), or "raw" without documentation."""
+        if not self.database_name and not self.version:
+            return "raw"
+        return f"{self.database_name}_{self.version}"
+
+    def get_table(self, name: str) -> Optional[Mapping[str, Any]]:
+        return self.tables_by_name.get(name)
+
+    def get_ddl(self, name: str) -> Optional[str]:
+        """DDL of a table doc, falling back to DDL generated from the raw schema."""
+        table_doc = self.tables_by_name.get(name)
+        if table_doc is not None:
+            return table_doc["ddl"]
+        return self.raw_ddl.get(name)
+
+
+def _source_paths(schema_loader: SchemaLoader) -> Dict[str, Optional[Path]]:
+    doc_path = os.environ.get("SCHEMA_PATH")
+    summary_path = os.environ.get("SCHEMA_SUMMARY_PATH")
+    return {
+        "documentation": Path(doc_path) if doc_path else None,
+        "summary": Path(summary_path) if summary_path else None,
+        "raw": schema_loader.temp_dir / "db_schema.json",
+    }
+
+
+def _fingerprint(paths: Dict[str, Optional[Path]]) -> Fingerprint:
+    entries = []
+    for name, path in sorted(paths.items()):
+        try:
+            stat = path.stat() if path else None
+        except OSError:
+            stat = None
+        entries.append(
+            (name, stat.st_mtime_ns if stat else None, stat.st_size if stat else None)
+        )
+    return tuple(entries)
+
+
+def _read_sources(paths: Dict[str, Optional[Path]]) -> Dict[str, Optional[bytes]]:
+    contents = {}
+    for name, path in paths.items():
+        try:
+            contents[name] = path.read_bytes() if path else None
+        except OSError:
+            contents[name] = None
+    return contents
+
+
+def _hash_sources(contents: Dict[str, Optional[bytes]]) -> str:
+    digest = hashlib.sha256()
+    for name in sorted(contents):
+        data = contents[name]
+        digest.update(f"\x00{name}\x00".encode("utf-8"))
+        if data is not None:
+            digest.update(data)
+    return digest.hexdigest()
+
+
+def build_schema_catalog(
+    contents: Dict[str, Optional[bytes]],
+    content_hash: str,
+    schema_loader: Optional[SchemaLoader] = None,
+) -> SchemaCatalog:
+    """Parse schema source files once and compile them into a catalog."""
+    schema_loader = schema_loader or get_schema_loader()
+
+    raw_schema = json.loads(contents["raw"]) if contents.get("raw") else {}
+
+    database_name, version = "", ""
+    table_docs = []
+    if contents.get("documentation"):
+        try:
+            schema_doc = yaml.safe_load(contents["documentation"]) or {}
+            table_docs = schema_loader.build_table_docs(schema_doc)
+            database_name = str(schema_doc.get("database_name", ""))
+            version = str(schema_doc.get("version", ""))
+        except Exception as e:
+            logger.error(f"Failed to load preprocessed schema data: {e}")
+            table_docs = []
+
+    if not table_docs and raw_schema:
+        table_docs = schema_loader.build_raw_table_docs(raw_schema)
+
+    summary = {}
+    if contents.get("summary"):
+        try:
+            summary = json.loads(contents["summary"])
+        except Exception as e:
+            logger.warning(f"Could not load schema summary: {e}")
+
+    raw_ddl = {
+        table.get("table_name", ""): schema_loader._generate_ddl_from_raw(table)
+        for table in raw_schema.get("tables", [])
+    }
+
+    return SchemaCatalog(
+        content_hash=content_hash,
+        database_name=database_name,
+        version=version,
+        table_docs=_freeze(table_docs),
+        summary=_freeze(summary),
+        raw_schema=_freeze(raw_schema),
+        raw_ddl=_freeze(raw_ddl),
+        fk_graph=ForeignKeyGraph.from_schema_json(raw_schema),
+    )
+
+
+def load_schema_catalog(documentation_path: Path) -> SchemaCatalog:
+    """
+    Build a catalog from an explicit documentation file, bypassing the cache.
+
+    The other sources are the configured ones, so the content hash matches the
+    served catalog whenever ``documentation_path`` is the configured file.
+    """
+    schema_loader = get_schema_loader()
+    paths = {**_source_paths(schema_loader), "documentation": Path(documentation_path)}
+    contents = _read_sources(paths)
+    if contents["documentation"] is None:
+        raise FileNotFoundError(f"Schema documentation not found at {documentation_path}")
+
+    return build_schema_catalog(contents, _hash_sources(contents), schema_loader)
+
+
+_catalog: Optional[SchemaCatalog] = None
+_fingerprint_seen: Optional[Fingerprint] = None
+_catalog_lock = Lock()
+
+
+def get_schema_catalog(force_reload: bool = False) -> SchemaCatalog:
+    """
+    Get the current schema catalog.
+
+    Each call only stats the source files. When an mtime or size changes the
+    files are re-read and hashed, and the catalog is rebuilt and swapped only
+    if the content actually changed. Readers holding the previous snapshot
+    keep using it unaffected. A failed rebuild keeps the previous catalog.
+    """
+    global _catalog, _fingerprint_seen
+
+    schema_loader = get_schema_loader()
+    paths = _source_paths(schema_loader)
+    fingerprint = _fingerprint(paths)
+
+    catalog = _catalog
+    if not force_reload and catalog is not None and fingerprint == _fingerprint_seen:
+        return catalog
+
+    with _catalog_lock:
+        if not force_reload and _catalog is not None and fingerprint == _fingerprint_seen:
+            return _catalog
+
+        contents = _read_sources(paths)
+        content_hash = _hash_sources(contents)
+
+        if not force_reload and _catalog is not None and _catalog.content_hash == content_hash:
+            _fingerprint_seen = fingerprint
+            return _catalog
+
+        try:
+            new_catalog = build_schema_catalog(contents, content_hash, schema_loader)
+        except Exception as e:
+            if _catalog is None:
+                raise
+            logger.error(f"Schema catalog reload failed, keeping previous catalog: {e}")
+            return _catalog
+
+        _catalog = new_catalog
+        _fingerprint_seen = fingerprint
+        logger.info(
+            f"Schema catalog loaded: {new_catalog.schema_version} "
+            f"({len(new_catalog.table_docs)} tables, {content_hash[:12]})"
+        )
+        return _catalog
@@ -54,121 +54,128 @@ class SchemaLoader:
         """
         Get table documents formatted for semantic search.
         Uses pre-processed schema data with rich business context.
+
+        Reads and parses the schema files on every call; request-path callers
+        should use ``get_schema_catalog()`` instead.
         """
         try:
-            schema_doc = self.load_schema_documentation()
-
-            table_docs = []
-            for table in schema_doc.get("tables", []):
-                search_text_parts = [
-                    f"Table: {table.get('table_name', '')}",
-                    f"Business Purpose: {table.get('business_purpose', '')}",
-                    f"Primary Identifier: {table.get('primary_identifier', '')}",
-                ]
-
-                for field in table.get("key_fields", []):
-                    field_desc = f"Field {field.get('field_name', '')}: {field.get('meaning', '')}"
-                    search_text_parts.append(field_desc)
-
-                for date_field in table.get("important_dates", []):
-                    date_desc = f"Date {date_field.get('field_name', '')}: {date_field.get('meaning', '')}"
-                    search_text_parts.append(date_desc)
-
-                relationships = table.get("relationships")
-                if relationships:
-                    for rel in relationships:
-                        rel_desc = f"Related to {rel.get('related_table', '')}: {rel.get('explanation', '')}"
-                        search_text_parts.append(rel_desc)
-
-                if table.get("operational_notes"):
-                    search_text_parts.append(f"Notes: {table.get('operational_notes')}")
-
-                for question in table.get("example_questions", []):
-                    search_text_parts.append(f"Example Query: {question}")
-
-                ddl = self._generate_ddl_from_your_format(table)
-
-                columns = []
-                for field in table.get("key_fields", []):
-                    columns.append(field.get("field_name", ""))
-                for date_field in table.get("important_dates", []):
-                    columns.append(date_field.get("field_name", ""))
-
-                table_docs.append(
-                    {
-                        "name": table.get("table_name", ""),
-                        "schema": "public",
-                        "ddl": ddl,
-                        "search_text": " ".join(search_text_parts),
-                        "columns": columns,
-                        "business_purpose": table.get("business_purpose", ""),
-                        "example_questions": table.get("example_questions", []),
-                        "key_fields": table.get("key_fields", []),
-                        "relationships": table.get("relationships", []),
-                        "operational_notes": table.get("operational_notes", ""),
-                    }
-                )
-
-            logger.info(
-                f"Loaded {len(table_docs)} table documents from preprocessed schema"
-            )
-            return table_docs
+            return self.build_table_docs(self.load_schema_documentation())
 
         except Exception as e:
             logger.error(f"Failed to load preprocessed schema data: {e}")
             return self._fallback_to_raw_schema()
 
+    def build_table_docs(self, schema_doc: Dict) -> List[Dict]:
+        """Build search table documents from parsed schema documentation."""
+        table_docs = []
+        for table in schema_doc.get("tables", []):
+            search_text_parts = [
+                f"Table: {table.get('table_name', '')}",
+                f"Business Purpose: {table.get('business_purpose', '')}",
+                f"Primary Identifier: {table.get('primary_identifier', '')}",
+            ]
+
+            for field in table.get("key_fields", []):
+                field_desc = f"Field {field.get('field_name', '')}: {field.get('meaning', '')}"
+                search_text_parts.append(field_desc)
+
+            for date_field in table.get("important_dates", []):
+                date_desc = f"Date {date_field.get('field_name', '')}: {date_field.get('meaning', '')}"
+                search_text_parts.append(date_desc)
+
+            relationships = table.get("relationships")
+            if relationships:
+                for rel in relationships:
+                    rel_desc = f"Related to {rel.get('related_table', '')}: {rel.get('explanation', '')}"
+                    search_text_parts.append(rel_desc)
+
+            if table.get("operational_notes"):
+                search_text_parts.append(f"Notes: {table.get('operational_notes')}")
+
+            for question in table.get("example_questions", []):
+                search_text_parts.append(f"Example Query: {question}")
+
+            ddl = self._generate_ddl_from_your_format(table)
+
+            columns = []
+            for field in table.get("key_fields", []):
+                columns.append(field.get("field_name", ""))
+            for date_field in table.get("important_dates", []):
+                columns.append(date_field.get("field_name", ""))
+
+            table_docs.append(
+                {
+                    "name": table.get("table_name", ""),
+                    "schema": "public",
+                    "ddl": ddl,
+                    "search_text": " ".join(search_text_parts),
+                    "columns": columns,
+                    "business_purpose": table.get("business_purpose", ""),
+                    "example_questions": table.get("example_questions", []),
+                    "key_fields": table.get("key_fields", []),
+                    "relationships": table.get("relationships", []),
+                    "operational_notes": table.get("operational_notes", ""),
+                }
+            )
+
+        logger.info(
+            f"Loaded {len(table_docs)} table documents from preprocessed schema"
+        )
+        return table_docs
+
     def _fallback_to_raw_schema(self) -> List[Dict]:
         """Fallback to raw schema JSON if documentation is not available."""
         try:
-            schema_json = self.load_schema_json()
-
-            table_docs = []
-            for table in schema_json.get("tables", []):
-                search_text_parts = [
-                    f"Table: {table.get('table_name', '')}",
-                    f"Schema: {table.get('schema_name', 'public')}",
-                ]
-
-                for col in table.get("columns", []):
-                    col_desc = (
-                        f"Column {col.get('name', '')} ({col.get('data_type', '')})"
-                    )
-                    if not col.get("nullable", True):
-                        col_desc += " NOT NULL"
-                    search_text_parts.append(col_desc)
-
-                for fk in table.get("foreign_keys", []):
-                    search_text_parts.append(
-                        f"Foreign key {fk.get('column', '')} references "
-                        f"{fk.get('referred_table', '')}.{fk.get('referred_column', '')}"
-                    )
-
-                ddl = self._generate_ddl_from_raw(table)
-
-                table_docs.append(
-                    {
-                        "name": table.get("table_name", ""),
-                        "schema": table.get("schema_name", "public"),
-                        "ddl": ddl,
-                        "search_text": " ".join(search_text_parts),
-                        "columns": [
-                            col.get("name", "") for col in table.get("columns", [])
-                        ],
-                        "business_purpose": "",
-                        "example_questions": [],
-                    }
-                )
-
-            logger.info(
-                f"Loaded {len(table_docs)} table documents from raw schema (fallback)"
-            )
-            return table_docs
+            return self.build_raw_table_docs(self.load_schema_json())
 
         except Exception as e:
             logger.error(f"Failed to load raw schema data: {e}")
             return []
 
+    def build_raw_table_docs(self, schema_json: Dict) -> List[Dict]:
+        """Build search table documents from the raw schema JSON."""
+        table_docs = []
+        for table in schema_json.get("tables", []):
+            search_text_parts = [
+                f"Table: {table.get('table_name', '')}",
+                f"Schema: {table.get('schema_name', 'public')}",
+            ]
+
+            for col in table.get("columns", []):
+                col_desc = (
+                    f"Column {col.get('name', '')} ({col.get('data_type', '')})"
+                )
+                if not col.get("nullable", True):
+                    col_desc += " NOT NULL"
+                search_text_parts.append(col_desc)
+
+            for fk in table.get("foreign_keys", []):
+                search_text_parts.append(
+                    f"Foreign key {fk.get('column', '')} references "
+                    f"{fk.get('referred_table', '')}.{fk.get('referred_column', '')}"
+                )
+
+            ddl = self._generate_ddl_from_raw(table)
+
+            table_docs.append(
+                {
+                    "name": table.get("table_name", ""),
+                    "schema": table.get("schema_name", "public"),
+                    "ddl": ddl,
+                    "search_text": " ".join(search_text_parts),
+                    "columns": [
+                        col.get("name", "") for col in table.get("columns", [])
+                    ],
+                    "business_purpose": "",
+                    "example_questions": [],
+                }
+            )
+
+        logger.info(
+            f"Loaded {len(table_docs)} table documents from raw schema (fallback)"
+        )
+        return table_docs
+
     def _generate_ddl_from_your_format(self, table: Dict) -> str:
         """Generate DDL from your preprocessed schema format."""
         table_name = table.get("table_name", "")
@@ -22,6 +22,10 @@ from ai_agentic_chatbot.infrastructure.datasource.factory import (
     get_datasource_factory,
     get_engine,
 )
+from ai_agentic_chatbot.infrastructure.embedding.http_pool import close_http_clients
+from ai_agentic_chatbot.infrastructure.llm.usage import get_usage_stats
+from ai_agentic_chatbot.agent.subgraphs.sql_query.answer_cache import get_answer_cache
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_validator import get_sql_validator
 from ai_agentic_chatbot.infrastructure.db_depency import get_db_session
 from ai_agentic_chatbot.logging_config import setup_logging, get_logger
 from ai_agentic_chatbot.schema_extractor.SaveSchemaJson import save_schema_temp_file
@@ -29,6 +33,9 @@ from ai_agentic_chatbot.schema_extractor.SchemaExtractionConfig import (
     SchemaExtractionConfig,
 )
 from ai_agentic_chatbot.schema_extractor.SchemaExtractor import SchemaExtractor
+from ai_agentic_chatbot.schema_extractor.embedding_index import (
+    get_schema_embedding_index,
+)
 from ai_agentic_chatbot.application.transform_schema_to_text import (
     transform_schema_to_text,
 )
@@ -54,15 +61,28 @@ async def lifespan(api: FastAPI):
     except Exception as e:
         logger.error(f"Failed to initialize datasources: {e}", exc_info=True)
 
+    logger.info("Loading schema embedding index...")
+    try:
+        index = get_schema_embedding_index()
+        logger.info(f"Schema embedding index {index.key} ready ({len(index)} vectors)")
+    except Exception as e:
+        logger.error(f"Failed to load schema embedding index: {e}", exc_info=True)
+
     yield
 
     logger.info("Shutting down application...")
     try:
         get_datasource_factory().close_all_connections()
+        await get_datasource_factory().close_all_async_connections()
         logger.info("Datasource connections closed successfully")
     except Exception as e:
         logger.error(f"Error closing datasource connections: {e}", exc_info=True)
 
+    try:
+        await close_http_clients()
+    except Exception as e:
+        logger.error(f"Error closing HTTP clients: {e}", exc_info=True)
+
     logger.info("Application shutdown complete")
 
 
@@ -79,6 +99,24 @@ def health_check():
     return {"status": "UP"}
 
 
+@app.get("/metrics/llm-usage", tags=["Metrics"])
+def llm_usage():
+    """Prompt, cached and completion tokens per LLM call site."""
+    return get_usage_stats()
+
+
+@app.get("/metrics/sql-answer-cache", tags=["Metrics"])
+def sql_answer_cache():
+    """Hit rate of the SQL answer cache."""
+    return get_answer_cache().stats()
+
+
+@app.get("/metrics/sql-validator", tags=["Metrics"])
+def sql_validator():
+    """Calls, failures and time per SQL validation rule."""
+    return get_sql_validator().stats()
+
+
 @app.get("/db-health", tags=["Health"])
 def db_health(db: Session = Depends(get_db_session)):
     try:
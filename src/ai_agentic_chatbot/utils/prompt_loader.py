@@ -32,11 +32,33 @@ def load_file_content(file_path: str | Path) -> str:
     return content
 
 
+def get_formatted_date() -> str:
+    import datetime
+
+    return datetime.datetime.now().strftime("%A, %B %d, %Y")
+
+
+# Stand-in for the date inside static system prompts; the date itself is sent
+# in a separate message after the static prefix so provider prompt caching works
+DATE_REFERENCE = "the current date (given below)"
+
+
+def render_static_system_prompt(prompt_text: str) -> str:
+    """Render a system prompt without the date, so it is byte-identical across days."""
+    return prompt_text.format(formatted_date=DATE_REFERENCE)
+
+
+def get_date_message_text(formatted_date: str | None = None) -> str:
+    return f"Current date: {formatted_date or get_formatted_date()}"
+
+
+def render_system_prompt(prompt_text: str, formatted_date: str | None = None) -> str:
+    """Fill the date placeholder of an already loaded system prompt."""
+    return prompt_text.format(formatted_date=formatted_date or get_formatted_date())
+
+
 def get_system_prompt() -> str:
     import os
-    import datetime
 
-    now = datetime.datetime.now()
-    formatted_date = now.strftime("%A, %B %d, %Y")
     prompt_text = load_file_content(os.environ["SYSTEM_PROMPT_PATH"])
-    return prompt_text.format(formatted_date=formatted_date)
+    return render_system_prompt(prompt_text)
@@ -0,0 +1,81 @@
+from ai_agentic_chatbot.agent.subgraphs.sql_query.answer_cache import (
+    CachedAnswer,
+    question_parameters,
+    SQLAnswerCache,
+)
+
+
+def _answer(question, sql="SELECT 1"):
+    return CachedAnswer(question, sql, "explanation", ("sales",), 0.9)
+
+
+def test_exact_hit_uses_normalized_question():
+    cache = SQLAnswerCache()
+    cache.store("Total sales last month?", "schema-a", _answer("Total sales last month?"))
+
+    hit = cache.lookup("  total SALES last month ", "schema-a")
+
+    assert hit is not None and hit.exact
+    assert hit.answer.generated_sql == "SELECT 1"
+    assert cache.stats()["exact_hits"] == 1
+
+
+def test_semantic_hit_above_threshold_only():
+    cache = SQLAnswerCache(similarity_threshold=0.95)
+    cache.store("total sales last month", "schema-a", _answer("q"), [1.0, 0.0, 0.0])
+
+    near = cache.lookup("sales total for last month", "schema-a", lambda: [0.99, 0.05, 0.0])
+    far = cache.lookup("top customers", "schema-a", lambda: [0.0, 1.0, 0.0])
+
+    assert near is not None and not near.exact and near.similarity > 0.95
+    assert far is None
+    stats = cache.stats()
+    assert (stats["semantic_hits"], stats["misses"]) == (1, 1)
+    assert stats["hit_rate"] == 0.5
+
+
+def test_embedding_only_computed_on_exact_miss():
+    cache = SQLAnswerCache()
+    cache.store("total sales", "schema-a", _answer("total sales"), [1.0, 0.0])
+
+    def fail():
+        raise AssertionError("should not embed on exact hit")
+
+    assert cache.lookup("total sales", "schema-a", fail).exact
+
+
+def test_schema_change_drops_entries():
+    cache = SQLAnswerCache()
+    cache.store("total sales", "schema-a", _answer("total sales"), [1.0, 0.0])
+
+    assert cache.lookup("total sales", "schema-b", lambda: [1.0, 0.0]) is None
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_invalidate_removes_entry():
+    cache = SQLAnswerCache()
+    cache.store("total sales", "schema-a", _answer("total sales"), [1.0, 0.0])
+    hit = cache.lookup("total sales", "schema-a")
+
+    cache.invalidate(hit.key)
+
+    assert cache.lookup("total sales", "schema-a", lambda: [1.0, 0.0]) is None
+
+
+def test_semantic_hit_requires_the_same_parameters():
+    cache = SQLAnswerCache(similarity_threshold=0.95)
+    cache.store("top 10 customers by revenue", "schema-a", _answer("q"), [1.0, 0.0, 0.0])
+    cache.store("sales in January", "schema-a", _answer("q"), [0.0, 1.0, 0.0])
+
+    near = [0.99, 0.05, 0.0]
+    assert cache.lookup("top 20 customers by revenue", "schema-a", lambda: near) is None
+    assert cache.lookup("sales in February", "schema-a", lambda: [0.05, 0.99, 0.0]) is None
+    assert cache.lookup("top 10 customers by sales", "schema-a", lambda: near) is not None
+
+
+def test_question_parameters():
+    assert question_parameters("Top 10 customers in 'West' for Q1 2024") == (
+        "10", "2024", "q1", "west"
+    )
+    assert question_parameters("sales this month") != question_parameters("sales last month")
@@ -0,0 +1,227 @@
+import asyncio
+import time
+
+import pytest
+
+from ai_agentic_chatbot.agent.settings import AgentSettings, ExecutionRetrySettings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes import execute_query
+from ai_agentic_chatbot.agent.subgraphs.sql_query.retry_policy import acall_with_retry
+from ai_agentic_chatbot.infrastructure.datasource.datasource_config import (
+    MySQLConfig,
+    PostgreSQLConfig,
+)
+from ai_agentic_chatbot.infrastructure.datasource.datasource_types import (
+    DataSourceProvider,
+    DataSourceType,
+)
+from ai_agentic_chatbot.infrastructure.datasource.factory import get_datasource_factory
+
+
+def test_async_connection_strings_use_asyncio_drivers():
+    mysql = MySQLConfig(host="db", database="shop", username="u", password="p")
+    postgres = PostgreSQLConfig(host="pg", database="shop", username="u", password="p")
+
+    assert mysql.get_async_connection_string() == "mysql+aiomysql://u:p@db:3306/shop"
+    assert postgres.get_async_connection_string() == "postgresql+asyncpg://u:p@pg:5432/shop"
+    assert postgres.get_async_engine_kwargs()["connect_args"]["ssl"] == "require"
+
+
+@pytest.fixture
+def async_datasource():
+    factory = get_datasource_factory()
+    factory.register_datasource(
+        "test.async",
+        DataSourceProvider.MYSQL,
+        DataSourceType.PRIMARY,
+        MySQLConfig(host="db", database="shop", username="u", password="p"),
+    )
+    yield factory
+    asyncio.run(factory.close_all_async_connections())
+    factory._configurations.pop("test.async")
+
+
+def test_factory_caches_async_engine(async_datasource):
+    engine = async_datasource.get_async_engine("test.async")
+
+    assert engine.dialect.driver == "aiomysql"
+    assert async_datasource.get_async_engine("test.async") is engine
+
+
+def test_async_retry_awaits_backoff():
+    calls, sleeps = [], []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("lost connection")
+        return "rows"
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    result = asyncio.run(
+        acall_with_retry(flaky, lambda e: isinstance(e, ConnectionError), sleep=sleep)
+    )
+
+    assert result == "rows"
+    assert len(calls) == 3 and len(sleeps) == 2
+
+
+@pytest.fixture
+def slow_query(monkeypatch):
+    async def run_query(sql_query):
+        await asyncio.sleep(0.2)
+        return [{"sql": sql_query}], False
+
+    monkeypatch.setattr(execute_query, "_arun_query", run_query)
+
+
+def test_slow_queries_do_not_block_each_other(slow_query):
+    async def run_both():
+        return await asyncio.gather(
+            execute_query.aexecute_query_node({"is_safe": True, "generated_sql": "SELECT 1"}),
+            execute_query.aexecute_query_node({"is_safe": True, "generated_sql": "SELECT 2"}),
+        )
+
+    start = time.perf_counter()
+    first, second = asyncio.run(run_both())
+
+    assert time.perf_counter() - start < 0.35
+    assert first["query_result"] == [{"sql": "SELECT 1"}]
+    assert second["row_count"] == 1 and second["execution_error"] is None
+
+
+def test_async_execution_failure_is_categorized(monkeypatch):
+    async def run_query(sql_query):
+        raise RuntimeError("Unknown column 'totl' in 'field list'")
+
+    monkeypatch.setattr(execute_query, "_arun_query", run_query)
+
+    result = asyncio.run(
+        execute_query.aexecute_query_node({"is_safe": True, "generated_sql": "SELECT totl FROM t"})
+    )
+
+    assert result["error_category"] == "not_found"
+    assert result["query_result"] is None
+
+
+def test_unvalidated_query_is_not_executed():
+    result = asyncio.run(execute_query.aexecute_query_node({"is_safe": False}))
+
+    assert result == {"execution_error": "Query failed safety validation"}
+
+
+class FakeAsyncResult:
+    def __init__(self, engine):
+        self.engine = engine
+        self.rows = iter(range(engine.row_count))
+
+    def keys(self):
+        return ["n"]
+
+    async def fetchmany(self, size):
+        rows = []
+        for _ in range(size):
+            row = await self.fetchone()
+            if row is None:
+                break
+            rows.append(row)
+        return rows
+
+    async def fetchone(self):
+        value = next(self.rows, None)
+        if value is None:
+            return None
+        self.engine.fetched += 1
+        return (value,)
+
+    async def close(self):
+        self.engine.closed = True
+
+
+class FakeAsyncConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def start(self):
+        self.engine.connects += 1
+        if self.engine.connect_error:
+            raise self.engine.connect_error
+
+    async def stream(self, statement):
+        if self.engine.query_error:
+            raise self.engine.query_error
+        return FakeAsyncResult(self.engine)
+
+    async def invalidate(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+class FakeAsyncEngine:
+    def __init__(self, connect_error=None, query_error=None, row_count=0):
+        self.connect_error = connect_error
+        self.query_error = query_error
+        self.row_count = row_count
+        self.connects = 0
+        self.fetched = 0
+        self.closed = False
+
+    def connect(self):
+        return FakeAsyncConnection(self)
+
+
+@pytest.fixture
+def async_engine(monkeypatch):
+    settings = AgentSettings(execution_retry=ExecutionRetrySettings(base_delay=0, max_delay=0))
+    monkeypatch.setattr(execute_query, "get_agent_settings", lambda: settings)
+
+    def install(**errors):
+        fake = FakeAsyncEngine(**errors)
+        monkeypatch.setattr(execute_query, "get_async_engine", lambda datasource: fake)
+        return fake
+
+    return install
+
+
+def _aexecute():
+    return asyncio.run(
+        execute_query.aexecute_query_node({"is_safe": True, "generated_sql": "SELECT 1"})
+    )
+
+
+def test_async_connect_failure_is_retried(async_engine):
+    fake = async_engine(connect_error=OSError("Can't connect to MySQL server on 'db'"))
+
+    result = _aexecute()
+
+    assert fake.connects == 3
+    assert result["error_category"] == "connection"
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        "(3024, 'Query execution was interrupted, maximum statement execution time exceeded')",
+        "(2013, 'Lost connection to MySQL server during query')",
+    ],
+)
+def test_async_query_that_started_is_not_rerun(async_engine, error):
+    fake = async_engine(query_error=RuntimeError(error))
+
+    _aexecute()
+
+    assert fake.connects == 1
+
+
+def test_async_results_are_streamed_up_to_the_cap(async_engine):
+    fake = async_engine(row_count=execute_query.MAX_QUERY_RESULTS * 5)
+
+    result = _aexecute()
+
+    assert fake.fetched == execute_query.MAX_QUERY_RESULTS + 1
+    assert fake.closed
+    assert result["row_count"] == execute_query.MAX_QUERY_RESULTS
+    assert result["query_result"][0] == {"n": 0}
@@ -0,0 +1,61 @@
+from ai_agentic_chatbot.agent.subgraphs.sql_query.column_pruning import (
+    ColumnPruner,
+    parse_ddl,
+)
+from ai_agentic_chatbot.schema_extractor.fk_graph import ForeignKeyEdge, ForeignKeyGraph
+
+ORDERS_DDL = "\n".join(
+    ["CREATE TABLE public.orders ("]
+    + [
+        "  id INTEGER NOT NULL,\n  customer_id INTEGER,\n  order_total DECIMAL(10,2),"
+    ]
+    + [f"  extra_attribute_{i} VARCHAR(255)," for i in range(40)]
+    + [
+        "  PRIMARY KEY (id),",
+        "  FOREIGN KEY (customer_id) REFERENCES customer(id)",
+        ");",
+    ]
+)
+CUSTOMER_DDL = """CREATE TABLE public.customer (
+  id INTEGER NOT NULL,
+  customer_name VARCHAR(255),
+  PRIMARY KEY (id)
+);"""
+
+FK_GRAPH = ForeignKeyGraph([ForeignKeyEdge("orders", "customer_id", "customer", "id")])
+
+
+def test_parse_ddl_splits_columns_and_constraints():
+    parsed = parse_ddl(ORDERS_DDL)
+
+    assert parsed.column_names[:3] == ["id", "customer_id", "order_total"]
+    assert parsed.primary_key == ["id"]
+    assert len(parsed.constraints) == 2
+
+
+def test_full_ddl_kept_when_within_budget():
+    tables = [("orders", ORDERS_DDL, 0.9)]
+
+    assert ColumnPruner(max_tokens=100_000).prune(tables, "total", FK_GRAPH) == tables
+
+
+def test_prune_keeps_keys_join_columns_and_relevant_columns():
+    tables = [("orders", ORDERS_DDL, 0.9), ("customer", CUSTOMER_DDL, 0.7)]
+    pruner = ColumnPruner(max_tokens=120, min_columns=1)
+
+    pruned = pruner.prune(
+        tables,
+        "order totals per customer",
+        FK_GRAPH,
+        {"orders": {"extra_attribute_7": 0.9}},
+    )
+
+    orders_ddl = dict((name, ddl) for name, ddl, _ in pruned)["orders"]
+    assert "  id INTEGER NOT NULL" in orders_ddl
+    assert "customer_id INTEGER" in orders_ddl
+    assert "FOREIGN KEY (customer_id)" in orders_ddl
+    assert "order_total" in orders_ddl
+    assert "extra_attribute_7 " in orders_ddl
+    assert "extra_attribute_30 " not in orders_ddl
+    assert "more columns omitted" in orders_ddl
+    assert orders_ddl.endswith(");")
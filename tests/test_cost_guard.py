@@ -0,0 +1,115 @@
+import inspect
+
+from ai_agentic_chatbot.agent.settings import AgentSettings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.cost_guard import (
+    CostBudget,
+    QueryPlan,
+    TableScan,
+    evaluate_plan,
+    parse_mysql_plan,
+    parse_postgres_plan,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes import check_cost, execute_query
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import route_after_cost_check
+
+
+MYSQL_PLAN = {
+    "query_block": {
+        "cost_info": {"query_cost": "250123.40"},
+        "nested_loop": [
+            {
+                "table": {
+                    "table_name": "o",
+                    "access_type": "ALL",
+                    "rows_examined_per_scan": 200000,
+                    "rows_produced_per_join": 200000,
+                }
+            },
+            {
+                "table": {
+                    "table_name": "c",
+                    "access_type": "eq_ref",
+                    "rows_examined_per_scan": 1,
+                    "rows_produced_per_join": 200000,
+                }
+            },
+        ],
+    }
+}
+
+POSTGRES_PLAN = [
+    "Hash Join  (cost=10.00..5000.50 rows=2550 width=4)",
+    "  Hash Cond: (o.customer_id = c.id)",
+    "  ->  Seq Scan on orders o  (cost=0.00..3500.00 rows=200000 width=8)",
+    "  ->  Hash  (cost=5.00..5.00 rows=400 width=4)",
+    "        ->  Index Scan using customers_pkey on customers c  (cost=0.00..5.00 rows=400 width=4)",
+]
+
+
+def test_parse_mysql_plan_multiplies_join_fan_out():
+    plan = parse_mysql_plan(MYSQL_PLAN)
+
+    assert plan.examined_rows == 200000 + 200000 * 1
+    assert plan.cost == 250123.40
+    assert [(scan.table, scan.access_type) for scan in plan.full_scans] == [("o", "ALL")]
+
+
+def test_parse_postgres_plan():
+    plan = parse_postgres_plan(POSTGRES_PLAN)
+
+    assert plan.cost == 5000.50
+    assert plan.examined_rows == 200400
+    assert [scan.table for scan in plan.full_scans] == ["orders"]
+
+
+def test_evaluate_plan_reports_each_violated_budget():
+    plan = parse_mysql_plan(MYSQL_PLAN)
+
+    assert evaluate_plan(plan, CostBudget(1_000_000, 500_000)).within_budget
+
+    verdict = evaluate_plan(plan, CostBudget(max_examined_rows=100_000, max_full_scan_rows=50_000))
+    assert verdict.violations == (
+        "~400,000 rows examined (budget 100,000)",
+        "full scan of o (~200,000 rows, budget 50,000)",
+    )
+
+
+def test_rejected_query_is_regenerated():
+    state = {
+        "cost_verdict": "rejected",
+        "execution_error": "Query too expensive: full scan of orders",
+        "error_category": "cost",
+        "generation_attempts": 1,
+        "max_retries": 2,
+    }
+
+    assert route_after_cost_check(state) == "generate_sql"
+    assert route_after_cost_check({**state, "cost_verdict": "limited"}) == "execute_query"
+
+
+def test_limited_query_is_re_estimated(monkeypatch):
+    plans = {
+        "SELECT id FROM orders": QueryPlan(2_000_000, (TableScan("orders", "ALL", 2_000_000),)),
+        "SELECT id FROM orders\nLIMIT 1000": QueryPlan(1000, (TableScan("orders", "ALL", 1000),)),
+    }
+    explained = []
+
+    def explain(sql):
+        explained.append(sql)
+        return plans[sql]
+
+    monkeypatch.setattr(check_cost, "get_agent_settings", AgentSettings)
+    monkeypatch.setattr(check_cost, "explain_plan", explain)
+
+    result = check_cost.check_cost_node({"generated_sql": "SELECT id FROM orders"})
+
+    assert result["cost_verdict"] == "limited"
+    assert result["generated_sql"] == "SELECT id FROM orders\nLIMIT 1000"
+    assert result["query_plan"]["examined_rows"] == 1000
+    assert explained == list(plans)
+
+
+def test_explain_uses_the_execution_datasource():
+    datasource = inspect.signature(check_cost.explain_plan).parameters["datasource"]
+
+    assert datasource.default == execute_query.QUERY_DATASOURCE
@@ -0,0 +1,57 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from ai_agentic_chatbot.infrastructure.embedding.batcher import EmbeddingBatcher
+
+
+class RecordingEmbedding(DeterministicFakeEmbedding):
+    batches: list = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return super().embed_documents(texts)
+
+
+def test_concurrent_queries_are_coalesced():
+    embedding = RecordingEmbedding(size=8, batches=[])
+    batcher = EmbeddingBatcher(embedding, max_batch_size=64, max_wait_ms=50)
+    queries = [f"question {i % 5}" for i in range(20)]
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        vectors = list(pool.map(batcher.embed_query, queries))
+
+    assert vectors == [embedding.embed_query(query) for query in queries]
+    assert sum(len(batch) for batch in embedding.batches) < len(queries)
+    assert batcher.stats()["items"] == len(queries)
+
+
+def test_async_queries_respect_max_batch_size():
+    embedding = RecordingEmbedding(size=8, batches=[])
+    batcher = EmbeddingBatcher(embedding, max_batch_size=4, max_wait_ms=50)
+
+    async def run():
+        return await asyncio.gather(
+            *(batcher.aembed_query(f"question {i}") for i in range(10))
+        )
+
+    vectors = asyncio.run(run())
+
+    assert len(vectors) == 10
+    assert max(len(batch) for batch in embedding.batches) <= 4
+
+
+class ShortEmbedding(DeterministicFakeEmbedding):
+    def embed_documents(self, texts):
+        return super().embed_documents(texts)[:-1]
+
+
+def test_short_embedding_response_fails_every_caller():
+    batcher = EmbeddingBatcher(ShortEmbedding(size=8), max_batch_size=64, max_wait_ms=50)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(batcher.embed_query, f"question {i}") for i in range(4)]
+        errors = [future.exception(timeout=5) for future in futures]
+
+    assert all(isinstance(error, ValueError) for error in errors)
@@ -0,0 +1,95 @@
+import pytest
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from ai_agentic_chatbot.schema_extractor import embedding_index
+from ai_agentic_chatbot.schema_extractor.embedding_index import (
+    SchemaEmbeddingIndex,
+    build_sub_documents,
+    load_or_build_index,
+)
+
+TABLE_DOCS = [
+    {
+        "name": "orders",
+        "business_purpose": "Customer orders",
+        "search_text": "Table: orders",
+        "example_questions": ["total sales last month"],
+        "key_fields": [{"field_name": "order_total", "meaning": "Total value"}],
+    },
+    {
+        "name": "customer",
+        "business_purpose": "Customers",
+        "search_text": "Table: customer",
+        "example_questions": [],
+        "key_fields": [],
+    },
+]
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    calls: int = 0
+
+    def embed_documents(self, texts):
+        self.calls += 1
+        return super().embed_documents(texts)
+
+
+@pytest.fixture(autouse=True)
+def isolated_index(tmp_path, monkeypatch):
+    monkeypatch.setattr(embedding_index, "INDEX_DIR", tmp_path)
+    monkeypatch.setattr(embedding_index, "_index", None)
+
+
+def test_index_roundtrip(tmp_path):
+    embedding = CountingEmbedding(size=8)
+    index = load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding)
+
+    loaded = SchemaEmbeddingIndex.load(embedding_index.get_index_path(index.key))
+
+    assert loaded.key == index.key
+    assert len(loaded) == len(build_sub_documents(TABLE_DOCS)) == 6
+    assert [sub_doc.kind for sub_doc in loaded.sub_documents[-2:]] == [
+        "purpose",
+        "search_text",
+    ]
+    assert loaded.matrix.shape == (6, 8)
+    assert loaded.matrix.tolist() == index.matrix.tolist()
+
+
+def test_index_is_embedded_once_per_schema_version(monkeypatch):
+    embedding = CountingEmbedding(size=8)
+
+    first = load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding)
+    monkeypatch.setattr(embedding_index, "_index", None)
+    second = load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding)
+    third = load_or_build_index(TABLE_DOCS, "shop_v2", "hash2", embedding)
+
+    assert first.key == second.key
+    assert third.key != first.key
+    assert embedding.calls == 2
+
+
+def test_cached_index_lookup_skips_sub_documents(monkeypatch):
+    embedding = CountingEmbedding(size=8)
+    first = load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding)
+
+    def fail(table_docs):
+        raise AssertionError("sub-documents rebuilt on a cache hit")
+
+    monkeypatch.setattr(embedding_index, "build_sub_documents", fail)
+    assert load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding) is first
+
+    monkeypatch.setattr(embedding_index, "_index", None)
+    assert load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding).key == first.key
+    assert embedding.calls == 1
+
+
+def test_changed_content_hash_rebuilds_index():
+    embedding = CountingEmbedding(size=8)
+
+    first = load_or_build_index(TABLE_DOCS, "shop_v1", "hash1", embedding)
+    second = load_or_build_index(TABLE_DOCS[:1], "shop_v1", "hash2", embedding)
+
+    assert second.key != first.key
+    assert second.table_names == ["orders"]
+    assert embedding.calls == 2
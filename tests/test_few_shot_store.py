@@ -0,0 +1,38 @@
+from ai_agentic_chatbot.agent.subgraphs.sql_query.few_shot_store import (
+    FewShotStore,
+    format_examples,
+)
+
+
+def test_search_returns_most_similar_examples_of_scope(tmp_path):
+    store = FewShotStore(tmp_path / "few_shot.sqlite3")
+    store.add("total sales last month", "SELECT SUM(total) FROM sales", "a", [1.0, 0.0], ["sales"])
+    store.add("top customers", "SELECT name FROM customer", "a", [0.0, 1.0])
+    store.add("sales by region", "SELECT region FROM sales", "b", [1.0, 0.0])
+
+    examples = store.search([0.9, 0.1], "a", k=1)
+
+    assert [example.sql for example in examples] == ["SELECT SUM(total) FROM sales"]
+    assert examples[0].tables_used == ("sales",)
+    assert examples[0].similarity > 0.9
+    assert store.search([0.0, 1.0], "a", k=5, min_similarity=0.5)[0].question == "top customers"
+
+
+def test_examples_persist_and_same_question_is_replaced(tmp_path):
+    path = tmp_path / "few_shot.sqlite3"
+    store = FewShotStore(path)
+    store.add("Total sales?", "SELECT 1", "a", [1.0, 0.0])
+    store.search([1.0, 0.0], "a")
+    store.add("total sales", "SELECT 2", "a", [1.0, 0.0])
+
+    assert [e.sql for e in store.search([1.0, 0.0], "a", k=5)] == ["SELECT 2"]
+    assert [e.sql for e in FewShotStore(path).search([1.0, 0.0], "a", k=5)] == ["SELECT 2"]
+
+
+def test_max_examples_keeps_newest(tmp_path):
+    store = FewShotStore(tmp_path / "few_shot.sqlite3", max_examples=2)
+    for i in range(4):
+        store.add(f"question {i}", f"SELECT {i}", "a", [1.0, float(i)])
+
+    assert len(store) == 2
+    assert "SELECT 3" in format_examples(store.search([1.0, 3.0], "a", k=2))
@@ -0,0 +1,42 @@
+from ai_agentic_chatbot.schema_extractor.fk_graph import ForeignKeyGraph
+
+SCHEMA_JSON = {
+    "tables": [
+        {
+            "table_name": "order_items",
+            "foreign_keys": [
+                {"column": "order_id", "referred_table": "orders", "referred_column": "id"},
+                {"column": "product_id", "referred_table": "products", "referred_column": "id"},
+            ],
+        },
+        {
+            "table_name": "orders",
+            "foreign_keys": [
+                {"column": "customer_id", "referred_table": "customer", "referred_column": "id"},
+            ],
+        },
+        {"table_name": "products", "foreign_keys": []},
+        {"table_name": "customer", "foreign_keys": []},
+    ]
+}
+
+
+def test_bridge_tables_within_depth():
+    graph = ForeignKeyGraph.from_schema_json(SCHEMA_JSON)
+
+    assert graph.edge_count == 3
+    assert graph.bridge_tables(["orders", "products"]) == ["order_items"]
+    assert graph.bridge_tables(["customer", "products"], max_depth=2) == []
+    assert set(graph.bridge_tables(["customer", "products"], max_depth=3)) == {
+        "orders",
+        "order_items",
+    }
+
+
+def test_join_path_and_neighbors():
+    graph = ForeignKeyGraph.from_schema_json(SCHEMA_JSON)
+
+    assert graph.join_path("customer", "order_items") == ["customer", "orders", "order_items"]
+    assert graph.join_path("customer", "products", max_depth=2) == []
+    assert graph.neighbors("orders") == ["order_items", "customer"]
+    assert graph.edges_between("orders", "customer")[0].column == "customer_id"
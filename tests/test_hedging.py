@@ -0,0 +1,85 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.hedging import first_accepted
+
+
+def test_first_accepted_result_wins_without_waiting_for_slower_tasks():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "slow"
+
+    start = time.monotonic()
+    result = first_accepted([slow, lambda: "fast"], accept=lambda value: True)
+    elapsed = time.monotonic() - start
+    release.set()
+
+    assert result.winner == "fast"
+    assert result.completed == ["fast"]
+    assert elapsed < 1
+
+
+def test_rejected_and_failed_tasks_are_skipped():
+    def broken():
+        raise RuntimeError("boom")
+
+    def late_valid():
+        time.sleep(0.05)
+        return "valid"
+
+    result = first_accepted(
+        [broken, lambda: "invalid", late_valid],
+        accept=lambda value: value == "valid",
+    )
+
+    assert result.winner == "valid"
+    assert "invalid" in result.completed
+    assert "valid" in result.completed
+
+
+def test_no_accepted_result_returns_all_completed():
+    result = first_accepted([lambda: 1, lambda: 2], accept=lambda value: value > 5)
+
+    assert result.winner is None
+    assert sorted(result.completed) == [1, 2]
+
+
+def test_timeout_returns_what_completed():
+    release = threading.Event()
+
+    def slow():
+        release.wait(5)
+        return "slow"
+
+    result = first_accepted([slow, lambda: "rejected"], accept=lambda v: v == "slow", timeout=0.2)
+    release.set()
+
+    assert result.winner is None
+    assert result.completed == ["rejected"]
+
+
+def test_running_tasks_are_signalled_and_counted_as_abandoned():
+    release = threading.Event()
+    cancel = threading.Event()
+    stopped = []
+
+    def slow():
+        release.wait(5)
+        stopped.append(cancel.is_set())
+        return "slow"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = first_accepted(
+            [slow, lambda: "fast"],
+            accept=lambda value: value == "fast",
+            executor=executor,
+            cancel=cancel,
+        )
+        release.set()
+
+    assert result.winner == "fast"
+    assert result.abandoned == 1
+    assert stopped == [True]
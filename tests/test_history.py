@@ -0,0 +1,110 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+
+from ai_agentic_chatbot.agent.history import HistoryManager
+
+
+def _conversation(turns):
+    messages = []
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"question {i}"))
+        messages.append(AIMessage(content=f"answer {i}"))
+    return messages
+
+
+def test_window_keeps_last_turns_and_summary():
+    manager = HistoryManager(max_turns=2, max_tokens=10_000)
+    messages = _conversation(5) + [HumanMessage(content="question 5")]
+
+    window = manager.window(messages, "user asked about sales")
+
+    assert isinstance(window[0], SystemMessage)
+    assert "user asked about sales" in window[0].content
+    assert [m.content for m in window[1:]] == ["question 4", "answer 4", "question 5"]
+
+
+def test_window_enforces_token_budget_but_keeps_latest_message():
+    manager = HistoryManager(max_turns=10, max_tokens=30)
+    messages = _conversation(3) + [HumanMessage(content="latest " * 200)]
+
+    window = manager.window(messages)
+
+    assert window == [messages[-1]]
+
+
+def test_fold_summarizes_only_newly_aged_messages():
+    calls = []
+
+    def summarizer(summary, messages):
+        calls.append((summary, [m.content for m in messages]))
+        return f"{summary}|{len(messages)}"
+
+    manager = HistoryManager(summarizer=summarizer, max_turns=2)
+    messages = _conversation(3) + [HumanMessage(content="question 3")]
+
+    update = manager.fold(messages, None, 0)
+    assert update == {"history_summary": "|4", "summarized_count": 4}
+    assert calls == [("", ["question 0", "answer 0", "question 1", "answer 1"])]
+
+    # Nothing new left the window
+    assert manager.fold(messages, update["history_summary"], 4) is None
+
+    messages += [AIMessage(content="answer 3"), HumanMessage(content="question 4")]
+    update = manager.fold(messages, update["history_summary"], 4)
+    assert update == {"history_summary": "|4|2", "summarized_count": 6}
+    assert calls[-1] == ("|4", ["question 2", "answer 2"])
+
+
+def test_background_fold_never_waits_and_applies_on_the_next_turn():
+    release = threading.Event()
+
+    def summarizer(summary, messages):
+        release.wait(5)
+        return f"{summary}|{len(messages)}"
+
+    manager = HistoryManager(summarizer=summarizer, max_turns=2)
+    messages = _conversation(3) + [HumanMessage(content="question 3")]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Returns at once, with the summarizer still blocked
+        assert manager.fold_in_background("t1", messages, None, 0, executor) == {}
+        assert manager.fold_in_background("t1", messages, None, 0, executor) == {}
+
+        release.set()
+        manager._folds["t1"].future.result()
+
+        messages += [AIMessage(content="answer 3"), HumanMessage(content="question 4")]
+        update = manager.fold_in_background("t1", messages, None, 0, executor)
+        assert update == {"history_summary": "|4", "summarized_count": 4}
+
+        # The turn that aged out since is folded next, from the new summary
+        manager._folds["t1"].future.result()
+        update = manager.fold_in_background("t1", messages, "|4", 4, executor)
+        assert update == {"history_summary": "|4|2", "summarized_count": 6}
+
+
+def test_background_fold_of_another_state_is_discarded():
+    manager = HistoryManager(summarizer=lambda summary, messages: "s", max_turns=2)
+    messages = _conversation(3) + [HumanMessage(content="question 3")]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        manager.fold_in_background("t1", messages, None, 0, executor)
+        manager._folds["t1"].future.result()
+
+        other = _conversation(1) + [HumanMessage(content="hello")]
+        assert manager.fold_in_background("t1", other, None, 0, executor) == {}
+
+
+def test_background_folds_are_bounded():
+    manager = HistoryManager(
+        summarizer=lambda summary, messages: "s", max_turns=2, max_background_folds=2
+    )
+    messages = _conversation(3) + [HumanMessage(content="question 3")]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for key in ("t1", "t2", "t3"):
+            manager.fold_in_background(key, messages, None, 0, executor)
+
+    assert list(manager._folds) == ["t2", "t3"]
@@ -0,0 +1,52 @@
+from langchain_core.embeddings import Embeddings
+
+from ai_agentic_chatbot.agent.intent_classifier import (
+    FastPathClassifier,
+    match_lexicon,
+    schema_vocabulary,
+)
+
+
+class KeywordEmbedding(Embeddings):
+    """Embeds texts on three axes: greeting, gibberish, data words."""
+
+    def _embed(self, text):
+        text = text.lower()
+        return [
+            1.0 + sum(word in text for word in ("hi", "hello", "thank", "morning", "meet")),
+            sum(word in text for word in ("asdf", "qwe", "zzz", "blah", "lorem", "?", "jdj", "banana")),
+            sum(word in text for word in ("sales", "orders", "customers", "revenue", "how many", "list", "count")),
+        ]
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+def test_lexicon_matches_greetings_and_keyboard_mash():
+    assert match_lexicon("Hi!").intent == "greeting"
+    assert match_lexicon("  thank you  ").intent == "greeting"
+    assert match_lexicon("???").intent == "nonsense"
+    assert match_lexicon("sdfghjkl").intent == "nonsense"
+    assert match_lexicon("show total sales") is None
+
+
+def test_acronyms_and_schema_words_are_not_keyboard_mash():
+    vocabulary = schema_vocabulary([{"name": "txn_hist", "columns": ["gmv", "cnt"]}])
+
+    assert vocabulary == {"txn", "hist", "gmv", "cnt"}
+    assert match_lexicon("GMV MTD") is None
+    assert match_lexicon("gmv mtd").intent == "nonsense"
+    assert match_lexicon("txn cnt", vocabulary) is None
+    assert match_lexicon("txn sdfghjkl", vocabulary).intent == "nonsense"
+    assert FastPathClassifier(vocabulary=lambda: vocabulary).classify("txn cnt") is None
+
+
+def test_centroid_model_only_routes_confident_non_data_messages():
+    classifier = FastPathClassifier(KeywordEmbedding(), similarity_threshold=0.8)
+
+    assert classifier.classify("hello, nice to meet you").intent == "greeting"
+    assert classifier.classify("hello, how many orders today") is None
+    assert classifier.classify("hi " + "word " * 10) is None
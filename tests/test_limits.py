@@ -0,0 +1,78 @@
+import pytest
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.limits import apply_limit, is_limitable
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes import validate_query
+
+
+@pytest.mark.parametrize(
+    "sql, expected",
+    [
+        ("SELECT id FROM t;", "SELECT id FROM t\nLIMIT 100"),
+        ("SELECT id FROM t; -- all ids", "SELECT id FROM t\nLIMIT 100"),
+        ("SELECT id FROM t LIMIT 5000", "SELECT id FROM t LIMIT 100"),
+        ("SELECT id FROM t LIMIT 20, 5000", "SELECT id FROM t LIMIT 20, 100"),
+        ("SELECT id FROM t LIMIT 10 OFFSET 500", "SELECT id FROM t LIMIT 10 OFFSET 500"),
+        ("SELECT id FROM t LIMIT ALL", "SELECT id FROM t LIMIT 100"),
+        ("SELECT id FROM t LIMIT all OFFSET 20", "SELECT id FROM t LIMIT 100 OFFSET 20"),
+        (
+            "SELECT a FROM t ORDER BY a FETCH FIRST 5000 ROWS ONLY",
+            "SELECT a FROM t ORDER BY a FETCH FIRST 100 ROWS ONLY",
+        ),
+        (
+            "SELECT a FROM t ORDER BY a FETCH FIRST 5 ROWS ONLY",
+            "SELECT a FROM t ORDER BY a FETCH FIRST 5 ROWS ONLY",
+        ),
+        (
+            "SELECT a FROM t OFFSET 10 ROWS FETCH NEXT 500 ROWS ONLY",
+            "SELECT a FROM t OFFSET 10 ROWS FETCH NEXT 100 ROWS ONLY",
+        ),
+        ("SELECT a FROM t FETCH FIRST ROW ONLY", "SELECT a FROM t FETCH FIRST ROW ONLY"),
+        (
+            "SELECT id FROM (SELECT id FROM t LIMIT 5000) x",
+            "SELECT id FROM (SELECT id FROM t LIMIT 5000) x\nLIMIT 100",
+        ),
+        (
+            "WITH recent AS (SELECT id FROM orders LIMIT 5000) SELECT id FROM recent",
+            "WITH recent AS (SELECT id FROM orders LIMIT 5000) SELECT id FROM recent\nLIMIT 100",
+        ),
+        (
+            "(SELECT id FROM a LIMIT 5000) UNION ALL (SELECT id FROM b)",
+            "(SELECT id FROM a LIMIT 5000) UNION ALL (SELECT id FROM b)\nLIMIT 100",
+        ),
+        (
+            "SELECT id FROM a UNION SELECT id FROM b LIMIT 5000",
+            "SELECT id FROM a UNION SELECT id FROM b LIMIT 100",
+        ),
+    ],
+)
+def test_apply_limit_appends_or_lowers_top_level_limit(sql, expected):
+    assert apply_limit(sql, 100) == expected
+
+
+def test_is_limitable():
+    assert is_limitable("SELECT o.id FROM orders o JOIN customers c ON c.id = o.customer_id")
+    assert is_limitable("SELECT id FROM t WHERE id IN (SELECT MAX(id) FROM u GROUP BY x)")
+    assert not is_limitable("SELECT customer_id, SUM(total) FROM orders GROUP BY customer_id")
+    assert not is_limitable("SELECT COUNT(*) FROM orders")
+    assert not is_limitable("SELECT id FROM orders ORDER BY created_at DESC")
+
+
+@pytest.fixture
+def no_schema_check(monkeypatch):
+    monkeypatch.setattr(validate_query, "check_query_schema", lambda sql: [])
+
+
+def test_validation_injects_missing_limit(no_schema_check):
+    result = validate_query.validate_query_node({"generated_sql": "SELECT id FROM customers"})
+
+    assert result["is_safe"]
+    assert result["generated_sql"] == (
+        f"SELECT id FROM customers\nLIMIT {validate_query.MAX_QUERY_RESULTS}"
+    )
+
+
+def test_validation_keeps_query_within_limit(no_schema_check):
+    result = validate_query.validate_query_node({"generated_sql": "SELECT id FROM customers LIMIT 10"})
+
+    assert result["is_safe"]
+    assert "generated_sql" not in result
@@ -0,0 +1,62 @@
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, LLMResult
+
+from ai_agentic_chatbot.infrastructure.llm.usage import (
+    extract_token_usage,
+    get_usage_stats,
+    usage_config,
+)
+
+
+def test_extract_token_usage_from_usage_metadata():
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": 1200,
+            "output_tokens": 40,
+            "total_tokens": 1240,
+            "input_token_details": {"cache_read": 1024},
+        },
+    )
+    result = LLMResult(generations=[[ChatGeneration(message=message)]])
+
+    assert extract_token_usage(result) == (1200, 1024, 40)
+
+
+def test_extract_token_usage_falls_back_to_llm_output():
+    result = LLMResult(
+        generations=[[ChatGeneration(message=AIMessage(content="ok"))]],
+        llm_output={
+            "token_usage": {
+                "prompt_tokens": 2048,
+                "completion_tokens": 12,
+                "prompt_tokens_details": {"cached_tokens": 1536},
+            }
+        },
+    )
+
+    assert extract_token_usage(result) == (2048, 1536, 12)
+
+
+def test_usage_config_records_per_call_site():
+    config = usage_config("test_call_site", {"tags": ["x"]})
+    handler = config["callbacks"][-1]
+    assert config["tags"] == ["x"]
+    assert config["run_name"] == "test_call_site"
+    assert usage_config("test_call_site")["callbacks"][-1] is handler
+
+    message = AIMessage(
+        content="ok",
+        usage_metadata={
+            "input_tokens": 100,
+            "output_tokens": 5,
+            "total_tokens": 105,
+            "input_token_details": {"cache_read": 50},
+        },
+    )
+    handler.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]))
+
+    stats = get_usage_stats()["test_call_site"]
+    assert stats["calls"] == 1
+    assert stats["cached_tokens"] == 50
+    assert stats["cached_ratio"] == 0.5
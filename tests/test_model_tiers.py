@@ -0,0 +1,62 @@
+from ai_agentic_chatbot.agent.subgraphs.sql_query.model_tiers import (
+    TIER_FAST,
+    call_cost,
+    select_tier,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import (
+    route_after_execution,
+    route_after_validation,
+)
+from ai_agentic_chatbot.infrastructure.llm.types import ModelType
+
+
+def test_fast_tier_for_single_confident_table():
+    tables = [("sales", "ddl", 1.84), ("product", "ddl", 0.5)]
+
+    tier, _ = select_tier(tables, None, 0)
+
+    assert tier == ModelType.FAST
+
+
+def test_smart_tier_for_multiple_or_weak_tables_and_retries():
+    two_tables = [("sales", "ddl", 1.84), ("customer", "ddl", 1.7)]
+    weak = [("sales", "ddl", 0.4)]
+    single = [("sales", "ddl", 1.84)]
+
+    assert select_tier(two_tables, None, 0)[0] == ModelType.SMART
+    assert select_tier(weak, None, 0)[0] == ModelType.SMART
+    assert select_tier(single, TIER_FAST, 1)[0] == ModelType.SMART
+    assert select_tier(single, None, 1)[0] == ModelType.SMART
+    assert select_tier(single, None, 0, enabled=False)[0] == ModelType.SMART
+
+
+def test_weak_weighted_match_is_not_confident():
+    # Cosine 0.45 on an example question (x2.0), boosted by a router hint (x1.3)
+    weak_question_match = [("sales", "ddl", 0.45 * 2.0 * 1.3)]
+
+    assert select_tier(weak_question_match, None, 0)[0] == ModelType.SMART
+
+
+def test_rejected_fast_query_escalates_instead_of_ending():
+    state = {"is_safe": False, "model_tier": TIER_FAST, "escalation_reason": "x"}
+
+    assert route_after_validation(state) == "generate_sql"
+    assert route_after_validation({**state, "model_tier": "smart"}) == "END"
+
+
+def test_fast_tier_attempt_does_not_use_up_a_retry():
+    state = {
+        "execution_error": "Unknown column",
+        "error_category": "not_found",
+        "generation_attempts": 2,
+        "max_retries": 2,
+        "tier_calls": [{"tier": "fast"}, {"tier": "smart"}],
+        "repair_attempts": 2,
+    }
+
+    assert route_after_execution(state) == "generate_sql"
+    assert route_after_execution({**state, "tier_calls": [{"tier": "smart"}]}) == "END"
+
+
+def test_call_cost():
+    assert call_cost(2000, 500, 0.0025, 0.01) == 0.005 + 0.005
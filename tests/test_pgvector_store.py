@@ -0,0 +1,105 @@
+import pytest
+
+from ai_agentic_chatbot.infrastructure.vector_store.pgvector_store import PgVectorSchemaStore
+
+
+class FakeResult:
+    def __init__(self, value=None, rows=()):
+        self.value = value
+        self.rows = list(rows)
+
+    def scalar(self):
+        return self.value
+
+    def all(self):
+        return self.rows
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self.engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        self.engine.statements.append(sql)
+        if "extversion" in sql:
+            return FakeResult(self.engine.version)
+        if "ORDER BY" in sql:
+            self.engine.params = params
+            return FakeResult(rows=self.engine.rows)
+        return FakeResult(self.engine.typmod)
+
+
+class FakeEngine:
+    def __init__(self, typmod=1536, version="0.8.0", rows=()):
+        self.typmod = typmod
+        self.version = version
+        self.rows = rows
+        self.params = None
+        self.statements = []
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def begin(self):
+        return FakeConnection(self)
+
+
+class FakeVectorStore:
+    collection_name = "db_schema_vectors"
+
+
+def _store(typmod=1536, **engine_options):
+    store = PgVectorSchemaStore.__new__(PgVectorSchemaStore)
+    store._engine = FakeEngine(typmod, **engine_options)
+    store._vectorstore = FakeVectorStore()
+    store._iterative_scan = None
+    return store
+
+
+def test_ann_index_requires_fixed_dimension_column():
+    store = _store(-1)
+
+    with pytest.raises(RuntimeError, match="embedding_dimensions"):
+        store.ensure_ann_index("hnsw")
+
+    assert not any("CREATE INDEX" in sql for sql in store._engine.statements)
+
+
+def test_ann_index_is_created_on_fixed_dimension_column():
+    store = _store(1536)
+
+    store.ensure_ann_index("hnsw")
+
+    assert any("USING hnsw" in sql for sql in store._engine.statements)
+
+
+def test_search_widens_ann_scan_to_candidate_pool():
+    rows = [({"table_name": "b"}, 0.4), ({"table_name": "a"}, 0.1)]
+    store = _store(rows=rows)
+
+    matches = store.search_sub_documents([0.5, 0.5], k=100, database="shop")
+
+    statements = store._engine.statements
+    assert "SET LOCAL hnsw.ef_search = 100" in statements
+    assert "SET LOCAL hnsw.iterative_scan = strict_order" in statements
+    assert any(sql.startswith("SET LOCAL ivfflat.probes") for sql in statements)
+    assert store._engine.params["k"] == 100
+    assert '"database": "shop"' in store._engine.params["filter"]
+    assert [metadata["table_name"] for metadata, _ in matches] == ["a", "b"]
+    assert matches[0][1] == pytest.approx(0.9)
+
+
+def test_iterative_scan_is_skipped_before_pgvector_0_8():
+    store = _store(version="0.7.4")
+
+    store.search_sub_documents([0.5, 0.5], k=10)
+
+    assert "SET LOCAL hnsw.ef_search = 40" in store._engine.statements
+    assert not any("iterative_scan" in sql for sql in store._engine.statements)
@@ -0,0 +1,45 @@
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from ai_agentic_chatbot.infrastructure.embedding.query_cache import (
+    QueryEmbeddingCache,
+    normalize_query,
+)
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    calls: int = 0
+
+    def embed_query(self, text):
+        self.calls += 1
+        return super().embed_query(text)
+
+
+def test_normalize_query():
+    assert normalize_query("  Total   SALES last month?? ") == "total sales last month"
+
+
+def test_rephrased_query_hits_cache_and_lru_evicts():
+    embedding = CountingEmbedding(size=8)
+    cache = QueryEmbeddingCache(max_size=2)
+
+    first = cache.embed_query(embedding, "Total sales last month?")
+    assert cache.embed_query(embedding, "total sales  last month") == first
+    cache.embed_query(embedding, "top customers")
+    cache.embed_query(embedding, "open invoices")
+    cache.embed_query(embedding, "total sales last month")
+
+    assert embedding.calls == 4
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["size"] == 2
+
+
+def test_sqlite_tier_survives_restart(tmp_path):
+    embedding = CountingEmbedding(size=8)
+    path = tmp_path / "cache.sqlite3"
+
+    vector = QueryEmbeddingCache(sqlite_path=path).embed_query(embedding, "top customers")
+    restarted = QueryEmbeddingCache(sqlite_path=path)
+
+    assert restarted.embed_query(embedding, "Top customers") == vector
+    assert embedding.calls == 1
+    assert restarted.stats()["disk_hits"] == 1
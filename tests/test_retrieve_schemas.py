@@ -0,0 +1,41 @@
+import json
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes import retrieve_schemas
+from ai_agentic_chatbot.agent.subgraphs.sql_query.scoring import ROUTER_HINT_BOOST
+from ai_agentic_chatbot.schema_extractor.schema_catalog import build_schema_catalog
+
+RAW_SCHEMA = {
+    "tables": [
+        {"table_name": "orders", "columns": [], "foreign_keys": []},
+        {"table_name": "customer", "columns": [], "foreign_keys": []},
+        {"table_name": "audit_log", "columns": [], "foreign_keys": []},
+    ]
+}
+
+
+def test_speculative_candidates_are_ranked_with_router_hints(monkeypatch):
+    catalog = build_schema_catalog({"raw": json.dumps(RAW_SCHEMA).encode()}, "test")
+    monkeypatch.setattr(retrieve_schemas, "get_schema_catalog", lambda: catalog)
+
+    def fail(_):
+        raise AssertionError("candidates were already retrieved")
+
+    monkeypatch.setattr(retrieve_schemas, "retrieve_candidates", fail)
+
+    result = retrieve_schemas.retrieve_schemas_node(
+        {
+            "user_query": "orders per customer",
+            "router_table_hints": ["customer"],
+            "candidate_tables": [
+                ("orders", "CREATE TABLE orders", 0.5),
+                ("customer", "CREATE TABLE customer", 0.45),
+                ("audit_log", "CREATE TABLE audit_log", 0.25),
+            ],
+        },
+        config={},
+    )
+
+    assert result["retrieved_tables"] == [
+        ("customer", "CREATE TABLE customer", 0.45 * ROUTER_HINT_BOOST),
+        ("orders", "CREATE TABLE orders", 0.5),
+    ]
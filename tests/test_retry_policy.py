@@ -0,0 +1,157 @@
+import pytest
+from pymysql.err import OperationalError
+
+from ai_agentic_chatbot.agent.settings import AgentSettings, ExecutionRetrySettings
+from ai_agentic_chatbot.agent.subgraphs.sql_query.nodes import execute_query
+from ai_agentic_chatbot.agent.subgraphs.sql_query.retry_policy import (
+    backoff_delay,
+    call_with_retry,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import route_after_execution
+
+
+class TransientError(Exception):
+    pass
+
+
+def _flaky(failures, error=TransientError):
+    calls = []
+
+    def fn():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise error("boom")
+        return "rows"
+
+    return fn, calls
+
+
+def test_backoff_delay_is_jittered_and_capped():
+    assert backoff_delay(1, 0.5, 4.0, rng=lambda: 1.0) == 0.5
+    assert backoff_delay(3, 0.5, 4.0, rng=lambda: 1.0) == 2.0
+    assert backoff_delay(10, 0.5, 4.0, rng=lambda: 1.0) == 4.0
+    assert backoff_delay(3, 0.5, 4.0, rng=lambda: 0.25) == 0.5
+
+
+def test_transient_failures_are_retried_with_backoff():
+    fn, calls = _flaky(failures=2)
+    sleeps = []
+
+    result = call_with_retry(
+        fn, lambda e: isinstance(e, TransientError), max_attempts=3, sleep=sleeps.append
+    )
+
+    assert result == "rows"
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_last_transient_failure_is_raised():
+    fn, calls = _flaky(failures=5)
+
+    with pytest.raises(TransientError):
+        call_with_retry(fn, lambda e: True, max_attempts=3, sleep=lambda _: None)
+    assert len(calls) == 3
+
+
+def test_non_transient_failure_fails_fast():
+    fn, calls = _flaky(failures=1, error=ValueError)
+
+    with pytest.raises(ValueError):
+        call_with_retry(fn, lambda e: isinstance(e, TransientError), sleep=lambda _: None)
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("category", ["permission", "connection"])
+def test_unfixable_categories_do_not_regenerate(category):
+    state = {
+        "execution_error": "boom",
+        "error_category": category,
+        "generation_attempts": 0,
+        "max_retries": 2,
+        "cache_hit": True,
+    }
+
+    assert route_after_execution(state) == "END"
+
+
+class FakeConnection:
+    def __init__(self, error):
+        self.error = error
+        self.invalidated = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement):
+        raise self.error
+
+    def invalidate(self):
+        self.invalidated = True
+
+
+class FakeEngine:
+    def __init__(self, connect_error=None, query_error=None):
+        self.connect_error = connect_error
+        self.query_error = query_error
+        self.connects = 0
+
+    def connect(self):
+        self.connects += 1
+        if self.connect_error:
+            raise self.connect_error
+        return FakeConnection(self.query_error)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    settings = AgentSettings(execution_retry=ExecutionRetrySettings(base_delay=0, max_delay=0))
+    monkeypatch.setattr(execute_query, "get_agent_settings", lambda: settings)
+
+    def install(**errors):
+        fake = FakeEngine(**errors)
+        monkeypatch.setattr(execute_query, "get_engine", lambda datasource: fake)
+        return fake
+
+    return install
+
+
+def _execute():
+    return execute_query.execute_query_node({"is_safe": True, "generated_sql": "SELECT 1"})
+
+
+def test_connection_refused_is_retried(engine):
+    fake = engine(connect_error=OperationalError("Can't connect to MySQL server on 'db' (111)"))
+
+    result = _execute()
+
+    assert fake.connects == 3
+    assert result["error_category"] == "connection"
+
+
+def test_stale_pooled_connection_is_retried(engine):
+    fake = engine(query_error=OperationalError("(2006, 'MySQL server has gone away')"))
+
+    _execute()
+
+    assert fake.connects == 3
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        "(3024, 'Query execution was interrupted, maximum statement execution time exceeded')",
+        "(2013, 'Lost connection to MySQL server during query')",
+        "canceling statement due to statement timeout",
+    ],
+)
+def test_query_that_started_is_not_rerun(engine, error):
+    fake = engine(query_error=OperationalError(error))
+
+    result = _execute()
+
+    assert fake.connects == 1
+    assert result["execution_error"] == error
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+from ai_agentic_chatbot.agent import router
+from ai_agentic_chatbot.schema_extractor import schema_catalog
+
+
+class FakeLLM:
+    bind_calls = 0
+
+    def with_structured_output(self, schema, strict=False):
+        FakeLLM.bind_calls += 1
+        return object()
+
+
+@pytest.fixture
+def prompt_files(tmp_path, monkeypatch):
+    router_prompt = tmp_path / "router.md"
+    system_prompt = tmp_path / "system.md"
+    summary = tmp_path / "summary.json"
+    router_prompt.write_text("Tables:\n{schema_text}")
+    system_prompt.write_text("Today is {formatted_date}.")
+    summary.write_text('{"orders": "Customer orders"}')
+
+    monkeypatch.setenv("ROUTER_PROMPT_PATH", str(router_prompt))
+    monkeypatch.setenv("SYSTEM_PROMPT_PATH", str(system_prompt))
+    monkeypatch.setenv("SCHEMA_SUMMARY_PATH", str(summary))
+    monkeypatch.setenv("SCHEMA_PATH", str(tmp_path / "missing.yaml"))
+    monkeypatch.setattr(schema_catalog, "_catalog", None)
+    monkeypatch.setattr(schema_catalog, "_fingerprint_seen", None)
+    monkeypatch.setattr(router, "_runtime", None)
+    monkeypatch.setattr(router, "get_llm", FakeLLM)
+    FakeLLM.bind_calls = 0
+    return router_prompt
+
+
+def test_runtime_is_compiled_once_and_reloaded_on_change(prompt_files):
+    runtime = router.get_router_runtime()
+
+    assert router.get_router_runtime() is runtime
+    assert runtime.router_prompt.content == "Tables:\n- orders: Customer orders"
+    assert runtime.static_system_prompt.content == "Today is the current date (given below)."
+    assert runtime.date_message() is runtime.date_message()
+    assert runtime.build_messages(["hi"])[-2:] == [runtime.date_message(), "hi"]
+    assert FakeLLM.bind_calls == 1
+
+    prompt_files.write_text("Schema:\n{schema_text}")
+    stat = prompt_files.stat()
+    os.utime(prompt_files, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = router.get_router_runtime()
+    assert reloaded is not runtime
+    assert reloaded.router_prompt.content.startswith("Schema:")
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from ai_agentic_chatbot.schema_extractor import schema_catalog
+from ai_agentic_chatbot.schema_extractor.schema_catalog import get_schema_catalog
+
+SCHEMA_YAML = """
+database_name: shop
+version: "{version}"
+tables:
+  - table_name: orders
+    business_purpose: Customer orders
+    primary_identifier: id
+    key_fields:
+      - field_name: order_total
+        meaning: Total value
+"""
+
+
+@pytest.fixture
+def schema_files(tmp_path, monkeypatch):
+    doc_path = tmp_path / "schema.yaml"
+    summary_path = tmp_path / "summary.json"
+    doc_path.write_text(SCHEMA_YAML.format(version="1"))
+    summary_path.write_text('{"orders": "Customer orders"}')
+
+    monkeypatch.setenv("SCHEMA_PATH", str(doc_path))
+    monkeypatch.setenv("SCHEMA_SUMMARY_PATH", str(summary_path))
+    monkeypatch.setattr(schema_catalog, "_catalog", None)
+    monkeypatch.setattr(schema_catalog, "_fingerprint_seen", None)
+    return doc_path
+
+
+def _bump_mtime(path):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_catalog_is_built_once_and_immutable(schema_files):
+    catalog = get_schema_catalog()
+
+    assert get_schema_catalog() is catalog
+    assert catalog.schema_version == "shop_1"
+    assert catalog.summary["orders"] == "Customer orders"
+    assert catalog.get_table("orders")["columns"] == ("order_total",)
+    with pytest.raises(TypeError):
+        catalog.table_docs[0]["name"] = "changed"
+
+
+def test_catalog_swaps_only_when_content_changes(schema_files):
+    first = get_schema_catalog()
+
+    _bump_mtime(schema_files)
+    assert get_schema_catalog() is first
+
+    schema_files.write_text(SCHEMA_YAML.format(version="2"))
+    _bump_mtime(schema_files)
+    second = get_schema_catalog()
+
+    assert second is not first
+    assert second.schema_version == "shop_2"
+    assert first.schema_version == "shop_1"
+
+
+def test_catalog_from_explicit_path_matches_configured_catalog(schema_files, tmp_path):
+    other_path = tmp_path / "other.yaml"
+    other_path.write_text(SCHEMA_YAML.format(version="9"))
+
+    served = get_schema_catalog()
+    same = schema_catalog.load_schema_catalog(schema_files)
+    other = schema_catalog.load_schema_catalog(other_path)
+
+    assert same.content_hash == served.content_hash
+    assert other.schema_version == "shop_9"
+    assert get_schema_catalog() is served
+    with pytest.raises(FileNotFoundError):
+        schema_catalog.load_schema_catalog(tmp_path / "missing.yaml")
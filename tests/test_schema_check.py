@@ -0,0 +1,124 @@
+import pytest
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import route_after_validation
+from ai_agentic_chatbot.agent.subgraphs.sql_query.schema_check import SchemaChecker
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_repair import (
+    SchemaIdentifiers,
+    SQLRepairer,
+)
+
+
+IDENTIFIERS = SchemaIdentifiers(
+    {
+        "customers": ["id", "name", "email"],
+        "orders": ["id", "customer_id", "order_date", "order_total"],
+    }
+)
+
+
+def _messages(sql):
+    return [error.message for error in SchemaChecker(IDENTIFIERS).check(sql)]
+
+
+def test_valid_query_has_no_errors():
+    sql = (
+        "SELECT c.name, SUM(o.order_total) AS spent, COUNT(*) orders_count "
+        "FROM customers c JOIN orders o ON o.customer_id = c.id "
+        "WHERE EXTRACT(YEAR FROM o.order_date) = 2024 "
+        "GROUP BY c.name ORDER BY spent DESC LIMIT 10"
+    )
+
+    assert _messages(sql) == []
+
+
+def test_implicit_alias_after_case_expression():
+    sql = (
+        "SELECT order_total, CASE WHEN order_total > 100 THEN 'big' ELSE 'small' END bucket "
+        "FROM orders ORDER BY bucket LIMIT 10"
+    )
+
+    assert _messages(sql) == []
+
+
+def test_unknown_qualified_column_names_the_table_and_suggests():
+    assert _messages("SELECT o.total_amount FROM orders o LIMIT 5") == [
+        "Unknown column 'o.total_amount': orders.total_amount does not exist; "
+        "did you mean order_total?"
+    ]
+
+
+def test_unknown_table_suggests_closest():
+    assert _messages("SELECT id FROM custmers LIMIT 5") == [
+        "Table 'custmers' doesn't exist; did you mean customers?"
+    ]
+
+
+def test_unknown_unqualified_column():
+    assert _messages("SELECT nmae FROM customers LIMIT 5") == [
+        "Unknown column 'nmae': not a column of customers; did you mean name?"
+    ]
+
+
+def test_derived_sources_are_not_guessed():
+    sql = "WITH recent AS (SELECT id FROM orders LIMIT 5) SELECT anything FROM recent LIMIT 5"
+
+    assert _messages(sql) == []
+
+
+def test_errors_are_repairable_locally():
+    sql = "SELECT o.order_totl FROM orders o LIMIT 5"
+
+    repair = SQLRepairer(IDENTIFIERS).repair(sql, _messages(sql)[0])
+
+    assert repair.sql == "SELECT o.order_total FROM orders o LIMIT 5"
+
+
+def test_schema_errors_route_to_repair():
+    state = {
+        "is_safe": False,
+        "schema_errors": ["Table 'custmers' doesn't exist"],
+        "execution_error": "Table 'custmers' doesn't exist",
+        "error_category": "not_found",
+        "generation_attempts": 1,
+        "repair_attempts": 0,
+    }
+
+    assert route_after_validation(state) == "repair_sql"
+    assert route_after_validation({**state, "repair_attempts": 2}) == "generate_sql"
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT name FROM customers WHERE id IN (SELECT customer_id FROM orders) LIMIT 5",
+        "SELECT c.name FROM customers c WHERE EXISTS "
+        "(SELECT 1 FROM orders o WHERE o.customer_id = c.id) LIMIT 5",
+        "SELECT name FROM customers WHERE id = ANY (SELECT customer_id FROM orders) LIMIT 5",
+    ],
+)
+def test_subqueries_are_not_read_as_function_calls(sql):
+    assert _messages(sql) == []
+
+
+def test_subquery_columns_are_still_checked_when_qualified():
+    sql = (
+        "SELECT c.name FROM customers c WHERE EXISTS "
+        "(SELECT 1 FROM orders o WHERE o.customer = c.id) LIMIT 5"
+    )
+
+    assert _messages(sql) == [
+        "Unknown column 'o.customer': orders.customer does not exist; did you mean customer_id?"
+    ]
+
+
+def test_partially_documented_tables_do_not_reject_columns():
+    identifiers = SchemaIdentifiers(
+        {"customers": ["id", "name"], "orders": ["id", "order_date"]}, partial_tables=["orders"]
+    )
+    checker = SchemaChecker(identifiers)
+
+    assert checker.check("SELECT o.status FROM orders o LIMIT 5") == []
+    assert checker.check("SELECT status FROM orders LIMIT 5") == []
+    assert [e.message for e in checker.check("SELECT c.status FROM customers c LIMIT 5")] == [
+        "Unknown column 'c.status': customers.status does not exist"
+    ]
@@ -0,0 +1,123 @@
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_repair import (
+    KIND_COLUMN,
+    KIND_TABLE,
+    SchemaIdentifiers,
+    SQLRepairer,
+    closest_identifier,
+    parse_unknown_identifier,
+    rename_identifier,
+    table_references,
+)
+from ai_agentic_chatbot.agent.subgraphs.sql_query.routes import (
+    route_after_execution,
+    route_after_repair,
+)
+
+
+IDENTIFIERS = SchemaIdentifiers(
+    {
+        "customers": ["id", "name", "email"],
+        "orders": ["id", "customer_id", "order_date", "total_amount"],
+        "invoices": ["id", "customer_ref"],
+    }
+)
+
+
+def test_parse_unknown_identifier_mysql_and_postgres():
+    column = parse_unknown_identifier(
+        "(1054, \"Unknown column 'o.custmer_id' in 'field list'\")"
+    )
+    assert (column.kind, column.name, column.qualifier) == (KIND_COLUMN, "custmer_id", "o")
+
+    table = parse_unknown_identifier("(1146, \"Table 'shop.custmers' doesn't exist\")")
+    assert (table.kind, table.name) == (KIND_TABLE, "custmers")
+
+    relation = parse_unknown_identifier('relation "ordrs" does not exist')
+    assert (relation.kind, relation.name) == (KIND_TABLE, "ordrs")
+
+    assert parse_unknown_identifier("Lost connection to MySQL server") is None
+
+
+def test_closest_identifier_requires_similarity_and_a_unique_best():
+    assert closest_identifier("custmer_id", ["customer_id", "order_date"], 0.75) == "customer_id"
+    assert closest_identifier("qty", ["quantity"], 0.75) is None
+    assert closest_identifier("nam", ["name", "namx"], 0.5) is None
+
+
+def test_table_references_resolves_aliases():
+    references = table_references(
+        "SELECT * FROM shop.orders AS o, invoices i "
+        "LEFT JOIN customers c ON c.id = o.customer_id"
+    )
+
+    assert references["o"] == "orders"
+    assert references["orders"] == "orders"
+    assert references["c"] == "customers"
+    assert references["i"] == "invoices"
+
+
+def test_table_references_include_in_and_exists_subqueries():
+    references = table_references(
+        "SELECT name FROM customers c WHERE c.id IN (SELECT customer_id FROM orders) "
+        "AND EXISTS (SELECT 1 FROM invoices i WHERE i.customer_ref = c.id)"
+    )
+
+    assert set(references.values()) == {"customers", "orders", "invoices"}
+
+
+def test_rename_identifier_keeps_quotes_and_respects_qualifier():
+    sql = "SELECT o.custmer_id, c.custmer_id, `custmer_id` FROM orders o JOIN customers c"
+
+    assert rename_identifier(sql, "custmer_id", "customer_id", qualifier="o") == (
+        "SELECT o.customer_id, c.custmer_id, `custmer_id` FROM orders o JOIN customers c"
+    )
+    assert rename_identifier(sql, "custmer_id", "customer_id") == (
+        "SELECT o.customer_id, c.customer_id, `customer_id` FROM orders o JOIN customers c"
+    )
+
+
+def test_repair_unknown_column_uses_columns_of_the_aliased_table():
+    repairer = SQLRepairer(IDENTIFIERS)
+
+    repair = repairer.repair(
+        "SELECT o.custmer_id, SUM(o.total_amount) FROM orders o GROUP BY o.custmer_id",
+        "(1054, \"Unknown column 'o.custmer_id' in 'field list'\")",
+    )
+
+    assert repair.sql == (
+        "SELECT o.customer_id, SUM(o.total_amount) FROM orders o GROUP BY o.customer_id"
+    )
+    assert repair.describe() == "column custmer_id -> customer_id"
+
+
+def test_repair_unknown_table():
+    repair = SQLRepairer(IDENTIFIERS).repair(
+        "SELECT COUNT(*) FROM custmers", "(1146, \"Table 'shop.custmers' doesn't exist\")"
+    )
+
+    assert repair.sql == "SELECT COUNT(*) FROM customers"
+
+
+def test_repair_gives_up_without_a_close_match():
+    repairer = SQLRepairer(IDENTIFIERS)
+
+    assert repairer.repair(
+        "SELECT o.revenue FROM orders o", "Unknown column 'o.revenue' in 'field list'"
+    ) is None
+    assert repairer.repair("SELECT 1", "syntax error near SELECT") is None
+
+
+def test_unknown_identifier_is_repaired_before_regenerating():
+    state = {
+        "execution_error": "Unknown column 'o.custmer_id' in 'field list'",
+        "error_category": "not_found",
+        "generation_attempts": 1,
+        "max_retries": 2,
+        "repair_attempts": 0,
+    }
+
+    assert route_after_execution(state) == "repair_sql"
+    assert route_after_execution({**state, "error_category": "syntax"}) == "generate_sql"
+    repaired = {**state, "repair_attempts": 1, "last_repair": "column a -> b"}
+    assert route_after_repair(repaired) == "validate_query"
+    assert route_after_repair({**repaired, "last_repair": None}) == "generate_sql"
@@ -0,0 +1,71 @@
+import time
+
+import pytest
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.sql_validator import SQLValidator
+
+
+@pytest.fixture
+def validator():
+    return SQLValidator()
+
+
+@pytest.mark.parametrize(
+    "sql",
+    [
+        "SELECT id, name FROM customers WHERE status = 'active' OR name = 'x' LIMIT 10",
+        "SELECT COUNT(*) FROM orders",
+        "WITH recent AS (SELECT id FROM orders LIMIT 5) SELECT id FROM recent LIMIT 5",
+        "SELECT REPLACE(name, 'a', 'b') AS cleaned FROM customers LIMIT 10;",
+        "SELECT id FROM orders -- latest orders\nLIMIT 20 OFFSET 40",
+        "SELECT 'drop table; delete' AS note FROM customers LIMIT 1",
+        "SELECT id, start FROM shifts WHERE start > NOW() LIMIT 10",
+        "SELECT commit, rollback, replace FROM deployments LIMIT 10",
+    ],
+)
+def test_valid_queries_pass(validator, sql):
+    assert validator.validate(sql) == []
+
+
+@pytest.mark.parametrize(
+    "sql, error",
+    [
+        ("DELETE FROM customers", "Only SELECT queries are allowed"),
+        ("SELECT id FROM t LIMIT 1; DROP TABLE t", "Dangerous keyword detected: DROP"),
+        ("SELECT id FROM t LIMIT 1; SELECT 2", "Multiple statements detected - only one statement allowed"),
+        ("SELECT SLEEP(5) FROM t LIMIT 1", "Function not allowed: SLEEP"),
+        ("SELECT table_name FROM information_schema.tables LIMIT 5", "System catalog access not allowed: information_schema"),
+        ("SELECT * FROM pg_user LIMIT 5", "System catalog access not allowed: pg_user"),
+        ("SELECT id FROM t /*! DROP */ LIMIT 1", "Block comments not allowed for security"),
+        ("SELECT id FROM t WHERE 1 = 1 LIMIT 1", "Potential tautology injection"),
+        ("SELECT id FROM t WHERE (a = 1 LIMIT 1", "Unbalanced parentheses"),
+        ("SELECT id FROM t INTO OUTFILE '/tmp/x'", "Dangerous keyword detected: OUTFILE"),
+        ("SELECT id FROM t LIMIT 1; REPLACE INTO t VALUES (1)", "Dangerous keyword detected: REPLACE"),
+        (
+            "WITH gone AS (DELETE FROM t RETURNING id) SELECT id FROM gone",
+            "Dangerous keyword detected: DELETE",
+        ),
+        ("SELECT name", "SELECT requires FROM clause"),
+        ("   ", "Empty query"),
+    ],
+)
+def test_unsafe_queries_are_rejected(validator, sql, error):
+    assert error in validator.validate(sql)
+
+
+def test_validation_time_is_linear_on_pathological_input(validator):
+    # Alternating quotes and ORs made the old regex battery backtrack
+    sql = "SELECT id FROM t WHERE " + " OR ".join(f"c = '{i}'" for i in range(3000)) + " LIMIT 1"
+
+    start = time.perf_counter()
+    assert validator.validate(sql) == []
+    assert time.perf_counter() - start < 2
+
+
+def test_stats_record_every_rule(validator):
+    validator.validate("DELETE FROM customers")
+
+    stats = validator.stats()
+    assert stats["tokenize"]["calls"] == 1
+    assert stats["select_only"]["failures"] == 1
+    assert stats["system_catalog"]["failures"] == 0
@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pytest
+
+from ai_agentic_chatbot.agent.subgraphs.sql_query.scoring import (
+    RELATIONSHIP_BOOST,
+    ROUTER_HINT_BOOST,
+    SUBDOC_WEIGHTS,
+    TableScorer,
+    reduce_sub_document_matches,
+)
+from ai_agentic_chatbot.schema_extractor.embedding_index import (
+    SchemaEmbeddingIndex,
+    SubDocument,
+)
+
+TABLE_DOCS = [
+    {"name": "orders", "relationships": [{"related_table": "customer"}]},
+    {"name": "customer"},
+    {"name": "empty"},
+]
+
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b)) / (
+        math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    )
+
+
+@pytest.fixture
+def index():
+    rng = np.random.default_rng(7)
+    sub_documents = [
+        SubDocument("customer", "purpose", "Customers"),
+        SubDocument("orders", "question", "total sales"),
+        SubDocument("orders", "field", "Total value"),
+        SubDocument("customer", "search_text", "Table: customer"),
+    ]
+    return SchemaEmbeddingIndex("k", sub_documents, rng.normal(size=(4, 16)))
+
+
+def test_scores_match_weighted_max_cosine(index):
+    scorer = TableScorer(index, TABLE_DOCS)
+    query = np.random.default_rng(1).normal(size=16)
+
+    scores = scorer.score(query)
+
+    for position, name in enumerate(scorer.table_names):
+        expected = max(
+            (
+                _cosine(query, vector) * SUBDOC_WEIGHTS[sub_doc.kind]
+                for sub_doc, vector in zip(index.sub_documents, index.matrix)
+                if sub_doc.table_name == name
+            ),
+            default=0.0,
+        )
+        assert scores[position] == pytest.approx(expected, abs=1e-5)
+
+
+def test_boosts_and_top_k(index):
+    scorer = TableScorer(index, TABLE_DOCS)
+    scores = np.array([0.5, 0.6, 0.1], dtype=np.float32)
+
+    boosted = scorer.apply_boosts(scores, "orders per customer", ["orders"])
+
+    assert boosted[0] == pytest.approx(0.5 * 1.3 * 1.2)
+    assert scorer.top_k(boosted, k=1, score_threshold=0.3) == [
+        ("orders", pytest.approx(0.78))
+    ]
+    assert [name for name, _ in scorer.top_k(boosted, 5, 0.3)] == ["orders", "customer"]
+
+
+def test_reduce_sub_document_matches_takes_weighted_max_per_table():
+    matches = [
+        ({"table_name": "orders", "kind": "field", "ddl": "CREATE TABLE orders"}, 0.5),
+        ({"table_name": "orders", "kind": "question", "ddl": "CREATE TABLE orders"}, 0.4),
+        ({"table_name": "customer", "kind": "search_text", "ddl": "CREATE TABLE customer",
+          "related_tables": ["orders"]}, 0.5),
+        ({"table_name": "audit_log", "kind": "search_text", "ddl": ""}, 0.1),
+    ]
+
+    results = reduce_sub_document_matches(
+        matches, "customers with orders", ["customer"], k=5, score_threshold=0.3
+    )
+
+    assert [name for name, _, _ in results] == ["orders", "customer"]
+    assert results[0] == ("orders", "CREATE TABLE orders", pytest.approx(0.8))
+    assert results[1][2] == pytest.approx(0.5 * ROUTER_HINT_BOOST * RELATIONSHIP_BOOST)